@@ -8,4 +8,5 @@ __all__ = [
     "events",
     "state",
     "logging",
+    "retry",
 ]
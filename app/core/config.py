@@ -1,19 +1,114 @@
 """
 Configuration loading and validation utilities.
 
-This module will later provide typed configuration schemas and robust
-load/merge/validation logic. For now, it exposes a minimal stub.
+``AppSettings`` is the typed, immutable schema of the user settings.
+``ConfigStore`` persists them in one JSON file (``configs/settings.json``).
+It validates the file against the schema and caches the parsed snapshot,
+re-reading only when the file's mtime changes. Updates report a diff of
+the changed keys. ``CrawlConfig`` is the per-run snapshot handed to the
+services.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
 from typing import Any, Dict
 
+from app.core.errors import ConfigurationError
+
+DEFAULT_SETTINGS_PATH = Path("configs/settings.json")
+
+# 개발 모드(dev.py)에서 앱에 스타일 재적용을 알리는 표시 파일 경로의 환경 변수
+STYLE_RELOAD_ENV = "APP_DEV_STYLE_RELOAD_FILE"
+
+
+@dataclass(frozen=True)
+class AppSettings:
+    """사용자 설정 스키마 (불변 스냅샷)"""
+
+    # 답변 생성
+    business_type: str = "일반"
+    tone: str = "친절하고 정중한"
+    custom_prompt: str = ""
+    length_limit: int = 350
+    banned_words: tuple[str, ...] = ()
+    reply_batch_size: int = 10
+    template_replies: bool = True
+    priority_model: str = ""
+    use_reply_history: bool = True
+
+    # LLM 백엔드
+    llm_provider: str = "OpenAI"
+    llm_model: str = "gpt-4o-mini"
+    llm_base_url: str = ""
+    llm_fallbacks: tuple[Dict[str, Any], ...] = ()
+
+    # 실행/제출
+    mode: str = "assist"
+    max_reviews: int = 10
+    submit_per_store_concurrency: int = 2
+    submit_global_concurrency: int = 6
+    retry_budget: int = 100
+
+    # 여러 계정 동시 실행
+    max_parallel_accounts: int = 4
+    global_request_concurrency: int = 8
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> AppSettings:
+        """딕셔너리를 검증해 설정으로 변환합니다. 알 수 없는 키는 무시합니다.
+
+        값의 타입이나 범위가 잘못되면 모든 문제를 모아 ``ConfigurationError``를
+        발생시킵니다.
+        """
+        values: Dict[str, Any] = {}
+        problems: list[str] = []
+        for spec in fields(cls):
+            if spec.name not in data:
+                continue
+            value, problem = _coerce(spec.name, data[spec.name], spec.default)
+            if problem:
+                problems.append(problem)
+            else:
+                values[spec.name] = value
+
+        for name, minimum in _MINIMUMS.items():
+            if name in values and values[name] < minimum:
+                problems.append(f"{name}: {minimum} 이상이어야 합니다 ({values[name]})")
+
+        if problems:
+            raise ConfigurationError("설정 값이 올바르지 않습니다: " + "; ".join(problems))
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["banned_words"] = list(self.banned_words)
+        data["llm_fallbacks"] = [dict(fallback) for fallback in self.llm_fallbacks]
+        return data
+
+    def diff(self, other: AppSettings) -> Dict[str, tuple[Any, Any]]:
+        """달라진 키 → (이전 값, 새 값)"""
+        return {
+            spec.name: (getattr(self, spec.name), getattr(other, spec.name))
+            for spec in fields(self)
+            if getattr(self, spec.name) != getattr(other, spec.name)
+        }
+
+
+# 실행 설정의 기본값도 사용자 설정 스키마에서 가져옴
+_DEFAULTS = AppSettings()
+
 
 @dataclass
 class CrawlConfig:
-    """A container for all settings required for an orchestration run."""
+    """A container for all settings required for an orchestration run.
+
+    Defaults for the user-configurable fields come from ``AppSettings``.
+    """
 
     user_id: str
     password: str
@@ -22,18 +117,147 @@ class CrawlConfig:
 
     # 답변 생성 관련 설정
     openai_api_key: str = ""
-    business_type: str = "일반"
-    tone: str = "친절하고 정중한"
-    custom_prompt: str = ""
+    business_type: str = _DEFAULTS.business_type
+    tone: str = _DEFAULTS.tone
+    custom_prompt: str = _DEFAULTS.custom_prompt
+    # 한 번의 LLM 요청으로 답변할 리뷰 수
+    reply_batch_size: int = _DEFAULTS.reply_batch_size
+    reply_length_limit: int = _DEFAULTS.length_limit  # 답변 최대 글자수
+    # 사소한 리뷰는 템플릿으로 답변
+    enable_template_replies: bool = _DEFAULTS.template_replies
+    # 부정/긴급 리뷰용 모델 (비우면 기본 모델)
+    priority_model: str = _DEFAULTS.priority_model
+    banned_words: list[str] = field(default_factory=list)  # 답변 금지어
+    use_reply_history: bool = _DEFAULTS.use_reply_history  # 과거 답변을 few-shot 예시로 사용
+    # "OpenAI" 또는 OpenAI 호환 "local" 서버 (대소문자는 LLM 라우터에서 정규화)
+    llm_provider: str = _DEFAULTS.llm_provider
+    llm_model: str = _DEFAULTS.llm_model
+    llm_base_url: str = _DEFAULTS.llm_base_url  # 비우면 공급자 기본 엔드포인트
+    llm_fallbacks: list[dict[str, Any]] = field(default_factory=list)
 
     # 답변 제출 관련 설정
     auto_submit_replies: bool = False
+    # 매장별/전체 동시 제출 수
+    submit_per_store_concurrency: int = _DEFAULTS.submit_per_store_concurrency
+    submit_global_concurrency: int = _DEFAULTS.submit_global_concurrency
     enable_reply_generation: bool = True
 
+    # 일시 오류 재시도 관련 설정 (실행 전체에서 허용할 재시도 횟수)
+    retry_budget: int = _DEFAULTS.retry_budget
+
+    # 실행 재개 관련 설정 (비어 있으면 새 실행 ID를 발급)
+    run_id: str = ""
+
+    # 여러 계정 동시 실행 관련 설정 (동시 계정 수, 전체 동시 GraphQL 요청 수)
+    max_parallel_accounts: int = _DEFAULTS.max_parallel_accounts
+    global_request_concurrency: int = _DEFAULTS.global_request_concurrency
+
 
-def load_config() -> Dict[str, Any]:
-    """Load application configuration.
+# 최솟값 제약 (스키마 검증용)
+_MINIMUMS = {
+    "length_limit": 50,
+    "reply_batch_size": 1,
+    "max_reviews": 1,
+    "submit_per_store_concurrency": 1,
+    "submit_global_concurrency": 1,
+    "retry_budget": 0,
+    "max_parallel_accounts": 1,
+    "global_request_concurrency": 1,
+}
 
-    Returns a dictionary for now. Will be replaced by a typed schema.
+
+def _coerce(name: str, value: Any, default: Any) -> tuple[Any, str | None]:
+    """기본값의 타입을 기준으로 값을 검증/변환합니다."""
+    if isinstance(default, bool):
+        if isinstance(value, bool):
+            return value, None
+        return None, f"{name}: true/false 값이어야 합니다"
+    if isinstance(default, int):
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value, None
+        return None, f"{name}: 정수여야 합니다"
+    if isinstance(default, str):
+        if isinstance(value, str):
+            return value, None
+        return None, f"{name}: 문자열이어야 합니다"
+    if name == "banned_words":
+        if isinstance(value, (list, tuple)) and all(isinstance(v, str) for v in value):
+            return tuple(value), None
+        return None, f"{name}: 문자열 목록이어야 합니다"
+    if name == "llm_fallbacks":
+        if isinstance(value, (list, tuple)) and all(isinstance(v, dict) for v in value):
+            return tuple(dict(v) for v in value), None
+        return None, f"{name}: 객체 목록이어야 합니다"
+    return value, None
+
+
+class ConfigStore:
+    """JSON 파일 하나에 저장되는 설정 저장소 (스레드 안전)
+
+    ``get``은 파일 수정 시각이 바뀐 경우에만 다시 읽고, 그 외에는 메모리에
+    캐시된 스냅샷을 반환합니다.
     """
-    return {}
+
+    def __init__(self, path: Path | str = DEFAULT_SETTINGS_PATH) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._settings = AppSettings()
+        self._mtime_ns: int | None = None
+
+    def get(self) -> AppSettings:
+        """현재 설정 스냅샷. 파일이 없으면 기본값입니다."""
+        with self._lock:
+            self._reload_if_changed()
+            return self._settings
+
+    def update(self, **changes: Any) -> Dict[str, tuple[Any, Any]]:
+        """일부 키를 바꿔 저장하고 달라진 키의 diff를 반환합니다."""
+        with self._lock:
+            self._reload_if_changed()
+            merged = {**self._settings.to_dict(), **changes}
+            return self._save(AppSettings.from_dict(merged))
+
+    def save(self, settings: AppSettings) -> Dict[str, tuple[Any, Any]]:
+        """설정 전체를 저장하고 달라진 키의 diff를 반환합니다. (변경이 없으면 쓰지 않음)"""
+        with self._lock:
+            self._reload_if_changed()
+            return self._save(settings)
+
+    def _save(self, settings: AppSettings) -> Dict[str, tuple[Any, Any]]:
+        changes = self._settings.diff(settings)
+        if not changes and self._mtime_ns is not None:
+            return {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(settings.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+        self._settings = settings
+        self._mtime_ns = self.path.stat().st_mtime_ns
+        return changes
+
+    def _reload_if_changed(self) -> None:
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime_ns == self._mtime_ns:
+            return
+
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ConfigurationError(f"설정 파일을 읽을 수 없습니다: {e}") from e
+        if not isinstance(data, dict):
+            raise ConfigurationError("설정 파일의 최상위 값은 객체여야 합니다.")
+
+        self._settings = AppSettings.from_dict(data)
+        self._mtime_ns = mtime_ns
+
+
+def load_config(path: Path | str = DEFAULT_SETTINGS_PATH) -> AppSettings:
+    """Load application settings from ``path`` (defaults if the file is missing)."""
+    return ConfigStore(path).get()
@@ -23,3 +23,7 @@ class StoreEnumerationError(Exception):
 
 class ReviewAPIAuthError(Exception):
     """Raised when review API authentication fails."""
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit breaker is open."""
@@ -1,24 +1,174 @@
-"""Logging setup utilities for the application."""
+"""Logging setup utilities for the application.
+
+Records are handed to a ``QueueHandler``, so the calling thread (including
+the worker threads' hot loops) only pays for a queue put. A
+``QueueListener`` thread formats the records and writes them to a rotating
+file and stdout. Rotation is by size by default, or by time when ``when`` is
+given.
+
+With ``json_lines=True`` (or ``APP_LOG_FORMAT=json``) the file is written as
+JSON lines (``logs/app.jsonl``). Each line includes the run, account, store
+and review IDs bound with ``log_context``/``bind_log_context``.
+"""
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Iterator
+
+DEFAULT_LOG_DIR = Path("logs")
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# "json"이면 JSON lines 형식으로 기록
+LOG_FORMAT_ENV = "APP_LOG_FORMAT"
+
+# 로그 레코드에 함께 남기는 식별자
+CONTEXT_KEYS = ("run_id", "account_id", "store_id", "review_id")
+
+_log_context: ContextVar[dict[str, str]] = ContextVar("log_context", default={})
+_listener: logging.handlers.QueueListener | None = None
+
+
+@contextmanager
+def log_context(**ids: Any) -> Iterator[None]:
+    """블록 안에서 남기는 로그에 식별자(run_id, store_id 등)를 붙입니다."""
+    token = _log_context.set(_merge_context(ids))
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+def bind_log_context(**ids: Any) -> None:
+    """현재 컨텍스트에 식별자를 추가합니다. 값이 None이면 해당 키를 제거합니다.
+
+    반복문의 항목별 식별자나 asyncio 작업(작업마다 컨텍스트가 복사됨)에 사용합니다.
+    """
+    _log_context.set(_merge_context(ids))
+
+
+def current_log_context() -> dict[str, str]:
+    return dict(_log_context.get())
+
+
+def _merge_context(ids: dict[str, Any]) -> dict[str, str]:
+    merged = dict(_log_context.get())
+    for key, value in ids.items():
+        if value is None:
+            merged.pop(key, None)
+        else:
+            merged[key] = str(value)
+    return merged
+
+
+class ContextFilter(logging.Filter):
+    """로그를 남긴 스레드/작업의 식별자를 레코드에 복사합니다.
 
+    리스너 스레드에서는 컨텍스트를 알 수 없으므로 큐에 넣기 전에 적용해야 합니다.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _log_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """레코드 하나를 JSON 한 줄로 변환합니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key in CONTEXT_KEYS:
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
 
-def setup_app_logging(level: int = logging.INFO) -> None:
-    """Configure basic logging to file and stdout.
 
-    Mirrors the current setup in app.main for future consolidation.
+def setup_app_logging(
+    level: int = logging.INFO,
+    log_dir: Path | str = DEFAULT_LOG_DIR,
+    json_lines: bool | None = None,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    when: str | None = None,
+) -> None:
+    """Configure non-blocking logging to a rotating file and stdout.
+
+    ``when`` (e.g. ``"midnight"``) switches from size-based to time-based
+    rotation. ``json_lines`` defaults to the ``APP_LOG_FORMAT`` env var.
+    Calling this again replaces the previous configuration.
     """
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_dir / "app.log", encoding="utf-8"),
-            logging.StreamHandler(),
-        ],
+    global _listener
+
+    if json_lines is None:
+        json_lines = os.getenv(LOG_FORMAT_ENV, "").lower() == "json"
+
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_path = log_dir / ("app.jsonl" if json_lines else "app.log")
+
+    if when:
+        file_handler: logging.Handler = logging.handlers.TimedRotatingFileHandler(
+            log_path, when=when, backupCount=backup_count, encoding="utf-8"
+        )
+    else:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+    file_handler.setFormatter(
+        JsonLinesFormatter() if json_lines else logging.Formatter(TEXT_FORMAT)
     )
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    shutdown_logging()
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 로그를 모두 기록하고 리스너를 종료합니다."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,219 @@
+"""Shared retry policy for SmartPlace GraphQL and LLM calls.
+
+Errors are classified as retryable (HTTP 429/5xx/408, timeouts, connection
+failures, ``RateLimitError``) or fatal (401/403, other 4xx, GraphQL
+validation/auth errors). Waits use decorrelated jitter and honor a
+``Retry-After`` header when the server sends one. All policies created for
+one run share a ``RetryBudget``, so an outage cannot multiply into unbounded
+retries across hundreds of stores and reviews.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, TypeVar
+
+from app.core.errors import CircuitOpenError, RateLimitError, ReviewAPIAuthError
+
+T = TypeVar("T")
+
+RetryCallback = Callable[[int, float, BaseException], None]
+
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+# 요청이 처리되지 않았음이 확실한 상태 코드 (멱등이 아닌 요청도 재시도 가능)
+NOT_PROCESSED_STATUS_CODES = {425, 429, 503}
+
+# 응답이 오지 않았어도 서버가 요청을 받지 못한 것이 확실한 오류
+_NOT_SENT_ERROR_NAMES = ("ConnectError", "ConnectTimeout", "PoolTimeout")
+_TRANSIENT_ERROR_NAMES = (
+    "Timeout",
+    "ConnectError",
+    "ReadError",
+    "WriteError",
+    "RemoteProtocolError",
+    "NetworkError",
+    "APIConnectionError",
+)
+
+
+class RetryBudget:
+    """실행 하나에서 쓸 수 있는 전체 재시도 횟수 (스레드 안전)"""
+
+    def __init__(self, max_retries: int = 100) -> None:
+        self.max_retries = max_retries
+        self._used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return max(0, self.max_retries - self._used)
+
+    def try_consume(self) -> bool:
+        with self._lock:
+            if self._used >= self.max_retries:
+                return False
+            self._used += 1
+            return True
+
+
+def status_code_of(exc: BaseException) -> int | None:
+    """httpx/OpenAI 예외에서 HTTP 상태 코드를 꺼냅니다."""
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """예외의 응답 헤더 ``Retry-After``(초 또는 HTTP 날짜)를 초 단위로 반환합니다."""
+    retry_after = getattr(exc, "retry_after", None)
+    if isinstance(retry_after, (int, float)):
+        return float(retry_after)
+
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def is_retryable(exc: BaseException, idempotent: bool = True) -> bool:
+    """재시도해도 되는 일시적 오류인지 판단합니다.
+
+    ``idempotent=False``(예: 답변 등록)이면 서버가 요청을 처리하지 않았음이
+    확실한 경우에만 재시도해 중복 등록을 막습니다.
+    """
+    if isinstance(exc, (ReviewAPIAuthError, CircuitOpenError)):
+        return False
+    if isinstance(exc, RateLimitError):
+        return True
+
+    status = status_code_of(exc)
+    if status is not None:
+        if idempotent:
+            return status in RETRYABLE_STATUS_CODES
+        return status in NOT_PROCESSED_STATUS_CODES
+
+    name = type(exc).__name__
+    if not idempotent:
+        return any(marker in name for marker in _NOT_SENT_ERROR_NAMES)
+    return any(marker in name for marker in _TRANSIENT_ERROR_NAMES)
+
+
+@dataclass
+class RetryPolicy:
+    """지수 백오프(decorrelated jitter) + Retry-After + 실행 단위 예산"""
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    # Retry-After가 이보다 길면 기다리지 않고 실패로 처리
+    max_retry_after: float = 120.0
+    budget: RetryBudget | None = None
+    _rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    def delay_before_retry(
+        self,
+        exc: BaseException,
+        attempt: int,
+        previous_delay: float,
+        idempotent: bool = True,
+        max_attempts: int | None = None,
+    ) -> float | None:
+        """``attempt``번째 시도가 실패한 뒤 기다릴 시간(초)을 반환합니다.
+
+        재시도하지 않아야 하면 None을 반환합니다. (치명적 오류, 시도 횟수 초과,
+        예산 소진, 너무 긴 Retry-After)
+        """
+        if attempt >= (max_attempts or self.max_attempts):
+            return None
+        if not is_retryable(exc, idempotent=idempotent):
+            return None
+
+        retry_after = retry_after_seconds(exc)
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+        if self.budget is not None and not self.budget.try_consume():
+            return None
+
+        # decorrelated jitter: base ~ 직전 대기 x3 사이에서 무작위
+        delay = min(
+            self.max_delay,
+            self._rng.uniform(self.base_delay, max(self.base_delay, previous_delay * 3)),
+        )
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def call(
+        self,
+        func: Callable[[], T],
+        idempotent: bool = True,
+        on_retry: RetryCallback | None = None,
+        max_attempts: int | None = None,
+    ) -> T:
+        """``func``를 정책에 따라 재시도하며 호출합니다. 마지막 예외는 그대로 전달됩니다."""
+        attempt = 0
+        delay = self.base_delay
+        while True:
+            attempt += 1
+            try:
+                return func()
+            except Exception as exc:
+                next_delay = self.delay_before_retry(
+                    exc, attempt, delay, idempotent, max_attempts
+                )
+                if next_delay is None:
+                    raise
+                if on_retry:
+                    on_retry(attempt, next_delay, exc)
+                delay = next_delay
+                time.sleep(delay)
+
+    async def call_async(
+        self,
+        func: Callable[[], Awaitable[Any]],
+        idempotent: bool = True,
+        on_retry: RetryCallback | None = None,
+        max_attempts: int | None = None,
+    ) -> Any:
+        """``call``의 비동기 버전입니다."""
+        # asyncio는 비동기 제출에서만 쓰므로 시작 시 불러오지 않음
+        import asyncio
+
+        attempt = 0
+        delay = self.base_delay
+        while True:
+            attempt += 1
+            try:
+                return await func()
+            except Exception as exc:
+                next_delay = self.delay_before_retry(
+                    exc, attempt, delay, idempotent, max_attempts
+                )
+                if next_delay is None:
+                    raise
+                if on_retry:
+                    on_retry(attempt, next_delay, exc)
+                delay = next_delay
+                await asyncio.sleep(delay)
@@ -1,3 +1,3 @@
 """Domain models, prompts, and selector mapping abstractions."""
 
-__all__ = ["models", "prompts", "selectors"]
+__all__ = ["models", "prompts", "selectors", "token_budget", "reply_templates"]
@@ -1,10 +1,15 @@
 """Prompt templates and post-processing rules for review replies."""
 
+import json
+from functools import lru_cache
+from typing import Any
+
 DEFAULT_TONE = "친절하고 정중한"
 DEFAULT_BUSINESS_TYPE = "일반"
+DEFAULT_REPLY_LENGTH_LIMIT = 250  # 답변 최대 글자수 기본값
 
-# 리뷰 답변 생성을 위한 기본 프롬프트 템플릿
-BASE_REPLY_PROMPT = """당신은 네이버 스마트플레이스에서 사업장을 운영하는 사장님입니다.
+# 리뷰 답변 작성 가이드라인 (단건/일괄 프롬프트 공통)
+REPLY_GUIDELINES = """당신은 네이버 스마트플레이스에서 사업장을 운영하는 사장님입니다.
 고객의 리뷰에 대해 {tone} 톤으로 답변을 작성해야 합니다.
 
 답변 작성 가이드라인:
@@ -14,13 +19,41 @@ BASE_REPLY_PROMPT = """당신은 네이버 스마트플레이스에서 사업장
 4. 부정적인 리뷰에는 진심 어린 사과와 개선 의지를 보여주세요
 5. 답변 길이는 50-150자 정도로 적당히 작성하세요
 6. 자연스러운 한국어로 작성하세요
-7. 과도한 이모지나 특수문자는 사용하지 마세요
+7. 과도한 이모지나 특수문자는 사용하지 마세요"""
+
+# 사용자 정의 프롬프트의 {작성자} 자리표시자 안내 (시스템 메시지에 고정으로 포함)
+AUTHOR_PLACEHOLDER_NOTE = "{작성자}는 사용자 메시지에 주어진 리뷰 작성자 닉네임을 의미합니다."
 
-고객 리뷰:
+# 리뷰마다 달라지는 사용자 메시지 템플릿
+REVIEW_USER_MESSAGE = """고객 리뷰:
 {review_text}
 
 위 리뷰에 대한 답변을 작성해주세요:"""
 
+# 사장님이 과거에 직접 작성한 비슷한 답변 (few-shot 예시)
+FEW_SHOT_HEADER = (
+    "참고: 사장님이 이전에 비슷한 리뷰에 직접 작성한 답변입니다. "
+    "문체와 어조는 참고하되 문장을 그대로 복사하지 마세요."
+)
+FEW_SHOT_EXAMPLE = """[예시 {index}]
+리뷰: {review_text}
+답변: {reply_text}"""
+
+# 여러 리뷰를 한 번의 요청으로 처리하기 위한 일괄 프롬프트 지시문
+BATCH_REPLY_INSTRUCTIONS = """아래 {count}개의 고객 리뷰 각각에 대해 서로 다른 답변을 작성하세요.
+{{작성자}} 자리에는 각 리뷰의 author 값을 그대로 사용하세요.
+반드시 아래 형식의 JSON 배열만 출력하세요. 설명이나 코드 블록 표시는 넣지 마세요.
+[{{"id": "<리뷰 id>", "reply": "<답변>"}}]
+
+리뷰 목록(JSON):
+{reviews_json}"""
+
+# 일괄 프롬프트의 리뷰별 few-shot 예시 안내
+BATCH_FEW_SHOT_NOTE = (
+    "examples가 있는 리뷰는 사장님이 이전에 비슷한 리뷰에 직접 작성한 답변을 "
+    "함께 제공합니다. 문체와 어조는 참고하되 문장을 그대로 복사하지 마세요."
+)
+
 # 비즈니스 타입별 특화 프롬프트
 BUSINESS_TYPE_PROMPTS = {
     "음식점": """당신은 음식점을 운영하는 사장님입니다. 음식 맛, 서비스, 분위기에 대한 리뷰에 적절히 답변하세요.
@@ -49,28 +82,168 @@ def build_reply_prompt(
     business_type: str = DEFAULT_BUSINESS_TYPE,
     store_name: str | None = None,
 ) -> str:
-    """리뷰 답변 생성을 위한 프롬프트를 구성합니다."""
+    """리뷰 답변 생성을 위한 단일 문자열 프롬프트를 구성합니다.
+
+    채팅 메시지를 쓸 수 없는 호출 측을 위한 형태로, 고정 지시문을 앞에 두고
+    리뷰 본문을 마지막에 붙입니다.
+    """
+    system_prompt = build_system_prompt(tone, business_type, store_name)
+    return f"{system_prompt}\n\n{build_user_message(review_text)}"
+
+
+@lru_cache(maxsize=64)
+def build_system_prompt(
+    tone: str = DEFAULT_TONE,
+    business_type: str = DEFAULT_BUSINESS_TYPE,
+    store_name: str | None = None,
+    custom_prompt: str = "",
+) -> str:
+    """리뷰와 무관한 고정 지시문(시스템 메시지)을 구성합니다.
+
+    같은 설정으로 호출하면 항상 같은 문자열을 반환하므로, 매 요청이 긴 공통
+    접두부를 공유하여 제공자 측 프롬프트 캐시가 적용됩니다.
+    """
+    if custom_prompt.strip():
+        prompt = custom_prompt.strip()
+        if "{작성자}" in prompt:
+            prompt += f"\n\n{AUTHOR_PLACEHOLDER_NOTE}"
+        return prompt
 
-    # 비즈니스 타입별 추가 가이드
     business_guide = BUSINESS_TYPE_PROMPTS.get(
         business_type, BUSINESS_TYPE_PROMPTS["일반"]
     )
-
-    # 톤별 가이드
     tone_guide = TONE_GUIDES.get(tone, TONE_GUIDES["친절하고 정중한"])
 
-    prompt = BASE_REPLY_PROMPT.format(tone=tone, review_text=review_text)
-
-    # 추가 가이드 삽입
+    prompt = REPLY_GUIDELINES.format(tone=tone)
     prompt += f"\n\n추가 가이드:\n{business_guide}\n{tone_guide}"
-
     if store_name:
         prompt += f"\n\n사업장명: {store_name}"
-
     return prompt
 
 
-def clean_reply_text(reply_text: str) -> str:
+def build_user_message(
+    review_text: str,
+    review_author: str | None = None,
+    examples: list[tuple[str, str]] | None = None,
+) -> str:
+    """리뷰마다 달라지는 짧은 사용자 메시지를 구성합니다.
+
+    ``examples``는 (과거 리뷰, 사장님 답변) 쌍 목록이며, 시스템 메시지의 캐시
+    접두부를 유지하도록 사용자 메시지 앞부분에 넣습니다.
+    """
+    message = REVIEW_USER_MESSAGE.format(review_text=review_text)
+    if review_author:
+        message = f"작성자: {review_author}\n\n{message}"
+    if examples:
+        shots = "\n\n".join(
+            FEW_SHOT_EXAMPLE.format(
+                index=i, review_text=example_review, reply_text=example_reply
+            )
+            for i, (example_review, example_reply) in enumerate(examples, 1)
+        )
+        message = f"{FEW_SHOT_HEADER}\n\n{shots}\n\n---\n\n{message}"
+    return message
+
+
+def build_reply_messages(
+    review_text: str,
+    tone: str = DEFAULT_TONE,
+    business_type: str = DEFAULT_BUSINESS_TYPE,
+    store_name: str | None = None,
+    custom_prompt: str = "",
+    review_author: str | None = None,
+    examples: list[tuple[str, str]] | None = None,
+) -> list[dict[str, str]]:
+    """고정 시스템 메시지 + 리뷰별 사용자 메시지로 채팅 메시지 목록을 구성합니다."""
+    return [
+        {
+            "role": "system",
+            "content": build_system_prompt(
+                tone, business_type, store_name, custom_prompt
+            ),
+        },
+        {
+            "role": "user",
+            "content": build_user_message(review_text, review_author, examples),
+        },
+    ]
+
+
+def build_batch_user_message(reviews: list[dict[str, Any]]) -> str:
+    """여러 리뷰에 대해 JSON 배열 응답을 요구하는 사용자 메시지를 구성합니다.
+
+    ``reviews`` 항목은 ``id``/``author``/``text`` 키를 가진 딕셔너리이며,
+    지시문은 ``build_system_prompt``의 시스템 메시지와 함께 전송합니다.
+    선택적인 ``examples``는 리뷰별 (과거 리뷰, 사장님 답변) 쌍 목록입니다.
+    """
+    items = []
+    for review in reviews:
+        item = {
+            "id": review["id"],
+            "author": review.get("author") or "",
+            "text": review["text"],
+        }
+        if review.get("examples"):
+            item["examples"] = [
+                {"review": example_review, "reply": example_reply}
+                for example_review, example_reply in review["examples"]
+            ]
+        items.append(item)
+
+    message = BATCH_REPLY_INSTRUCTIONS.format(
+        count=len(reviews), reviews_json=json.dumps(items, ensure_ascii=False)
+    )
+    if any("examples" in item for item in items):
+        message = f"{BATCH_FEW_SHOT_NOTE}\n\n{message}"
+    return message
+
+
+def parse_batch_reply_response(
+    raw_response: str,
+    expected_ids: list[str],
+    max_length: int = DEFAULT_REPLY_LENGTH_LIMIT,
+) -> dict[str, str]:
+    """일괄 프롬프트 응답(JSON 배열)을 ``{리뷰 id: 답변}`` 형태로 변환합니다.
+
+    형식이 잘못되었거나 비어 있는 항목은 결과에서 제외되므로, 호출 측에서
+    누락된 id만 단건 생성으로 대체하면 됩니다.
+    """
+    if not raw_response:
+        return {}
+
+    # 코드 블록 등 배열 바깥의 텍스트 제거
+    start = raw_response.find("[")
+    end = raw_response.rfind("]")
+    if start == -1 or end <= start:
+        return {}
+
+    try:
+        items = json.loads(raw_response[start : end + 1])
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    wanted = set(expected_ids)
+    replies: dict[str, str] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        review_id = str(item.get("id", ""))
+        reply = item.get("reply")
+        if review_id not in wanted or review_id in replies:
+            continue
+        if not isinstance(reply, str):
+            continue
+        cleaned = clean_reply_text(reply, max_length)
+        if cleaned:
+            replies[review_id] = cleaned
+    return replies
+
+
+def clean_reply_text(
+    reply_text: str, max_length: int = DEFAULT_REPLY_LENGTH_LIMIT
+) -> str:
     """생성된 답변 텍스트를 후처리합니다."""
     if not reply_text:
         return ""
@@ -87,8 +260,8 @@ def clean_reply_text(reply_text: str) -> str:
     # 과도한 줄바꿈 정리
     cleaned = "\n".join(line.strip() for line in cleaned.split("\n") if line.strip())
 
-    # 길이 제한 (250자 초과 시 자름)
-    if len(cleaned) > 250:
-        cleaned = cleaned[:247] + "..."
+    # 길이 제한 (max_length 초과 시 자름)
+    if len(cleaned) > max_length:
+        cleaned = cleaned[: max_length - 3] + "..."
 
     return cleaned
@@ -0,0 +1,137 @@
+"""Local reply templates for trivial reviews (rating-only or short praise).
+
+Such reviews do not need the LLM: a reply is picked from a curated pool for
+the business type and closed with a line matching the tone. The choice is
+seeded by the review ID, so the same review always gets the same reply while
+replies across a store still vary.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+
+from app.domain.prompts import DEFAULT_BUSINESS_TYPE, DEFAULT_TONE
+
+# 짧은 리뷰라도 이런 표현이 있으면 템플릿 대신 LLM으로 답변
+NEGATIVE_KEYWORDS = (
+    "별로",
+    "실망",
+    "불친절",
+    "최악",
+    "아쉽",
+    "아쉬",
+    "비싸",
+    "늦",
+    "더럽",
+    "불편",
+    "짜증",
+    "환불",
+    "다시는",
+    "글쎄",
+    "그닥",
+    "그저",
+    "ㅡㅡ",
+)
+
+# 비즈니스 타입별 본문 템플릿 ({author}는 "작성자님" 또는 "고객님")
+BUSINESS_TEMPLATE_POOLS = {
+    "음식점": [
+        "안녕하세요, {author}! 맛있게 드셔주셔서 감사합니다.",
+        "안녕하세요, {author}! 식사 만족스러우셨다니 저희도 기쁩니다.",
+        "안녕하세요, {author}! 소중한 리뷰 남겨주셔서 감사합니다. 늘 같은 맛으로 준비하겠습니다.",
+        "안녕하세요, {author}! 방문해주셔서 감사합니다. 다음에도 맛있는 음식으로 보답하겠습니다.",
+    ],
+    "카페": [
+        "안녕하세요, {author}! 카페를 찾아주셔서 감사합니다.",
+        "안녕하세요, {author}! 편안한 시간 보내셨길 바랍니다. 리뷰 감사합니다.",
+        "안녕하세요, {author}! 좋은 평가 감사합니다. 늘 맛있는 커피로 준비하겠습니다.",
+        "안녕하세요, {author}! 방문해주셔서 감사합니다. 다음에도 아늑한 공간으로 맞이하겠습니다.",
+    ],
+    "미용실": [
+        "안녕하세요, {author}! 시술 만족스러우셨다니 정말 기쁩니다.",
+        "안녕하세요, {author}! 찾아주셔서 감사합니다. 새 스타일 잘 어울리시길 바랍니다.",
+        "안녕하세요, {author}! 좋은 리뷰 감사합니다. 다음 방문 때도 정성껏 모시겠습니다.",
+        "안녕하세요, {author}! 믿고 맡겨주셔서 감사합니다.",
+    ],
+    "병원": [
+        "안녕하세요, {author}! 저희 병원을 찾아주셔서 감사합니다.",
+        "안녕하세요, {author}! 소중한 후기 감사합니다. 늘 건강하시길 바랍니다.",
+        "안녕하세요, {author}! 믿고 방문해주셔서 감사합니다. 앞으로도 세심하게 진료하겠습니다.",
+        "안녕하세요, {author}! 좋은 말씀 감사합니다. 빠른 쾌유를 바랍니다.",
+    ],
+    "일반": [
+        "안녕하세요, {author}! 방문해주셔서 감사합니다.",
+        "안녕하세요, {author}! 소중한 리뷰 남겨주셔서 감사합니다.",
+        "안녕하세요, {author}! 좋은 평가 감사합니다. 큰 힘이 됩니다.",
+        "안녕하세요, {author}! 찾아주셔서 진심으로 감사드립니다.",
+    ],
+}
+
+# 톤별 마무리 문장
+TONE_CLOSING_POOLS = {
+    "친절하고 정중한": [
+        "다음에도 정성을 다해 모시겠습니다.",
+        "또 뵙기를 기다리겠습니다.",
+        "항상 좋은 하루 보내세요.",
+    ],
+    "전문적인": [
+        "앞으로도 만족스러운 서비스를 제공하도록 노력하겠습니다.",
+        "더 나은 모습으로 찾아뵙겠습니다.",
+        "변함없는 품질로 보답하겠습니다.",
+    ],
+    "캐주얼한": [
+        "또 놀러 오세요! 😊",
+        "다음에 또 만나요!",
+        "좋은 하루 보내세요! ✨",
+    ],
+    "감사한": [
+        "다시 한번 진심으로 감사드립니다.",
+        "보내주신 마음 잊지 않겠습니다. 감사합니다.",
+        "따뜻한 리뷰에 큰 힘을 얻었습니다. 감사합니다.",
+    ],
+}
+
+
+def is_trivial_review(
+    review_text: str,
+    rating: int | None = None,
+    max_chars: int = 10,
+    has_negative_grade: bool = False,
+) -> bool:
+    """LLM 없이 템플릿으로 답변해도 되는 리뷰인지 판단합니다.
+
+    텍스트가 없거나 ``max_chars`` 이하의 짧은 긍정 리뷰만 해당합니다. 별점이
+    3점 이하이거나 부정 표현/부정 등급 플래그가 있으면 제외합니다.
+    """
+    if has_negative_grade:
+        return False
+    if rating is not None and rating <= 3:
+        return False
+
+    text = (review_text or "").strip()
+    if not text:
+        return True
+    if len(text) > max_chars:
+        return False
+    return not any(keyword in text for keyword in NEGATIVE_KEYWORDS)
+
+
+def render_template_reply(
+    review_id: str,
+    business_type: str = DEFAULT_BUSINESS_TYPE,
+    tone: str = DEFAULT_TONE,
+    review_author: str | None = None,
+) -> str:
+    """리뷰 ID로 시드를 고정해 템플릿 풀에서 답변을 결정적으로 선택합니다."""
+    body_pool = BUSINESS_TEMPLATE_POOLS.get(
+        business_type, BUSINESS_TEMPLATE_POOLS[DEFAULT_BUSINESS_TYPE]
+    )
+    closing_pool = TONE_CLOSING_POOLS.get(tone, TONE_CLOSING_POOLS[DEFAULT_TONE])
+
+    digest = hashlib.sha256(review_id.encode("utf-8")).digest()
+    rng = random.Random(int.from_bytes(digest[:8], "big"))
+
+    author = f"{review_author}님" if review_author else "고객님"
+    body = rng.choice(body_pool).format(author=author)
+    return f"{body} {rng.choice(closing_pool)}"
@@ -0,0 +1,141 @@
+"""Token budgeting for review input and reply output.
+
+Trims oversized review text before it is sent to the LLM and derives the
+completion ``max_tokens`` from the configured reply length limit, so the
+request never pays for tokens that ``clean_reply_text`` would cut off anyway.
+Uses ``tiktoken`` when installed and a character-class heuristic otherwise,
+including when the tokenizer data cannot be downloaded (offline machines,
+proxies, local LLM setups).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 토크나이저 데이터를 한 번 받지 못하면 이후에는 다시 시도하지 않음
+_encoding_load_failed = False
+
+# 생략 구간 표시 (앞/뒤만 남기고 가운데를 잘라낼 때 사용)
+TRUNCATION_MARKER = " …(중략)… "
+
+# 토크나이저가 없을 때 사용하는 문자 유형별 토큰 추정치
+_WIDE_CHAR_PATTERN = re.compile(
+    r"[\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3\u4e00-\u9fff]"
+)
+_WIDE_CHAR_TOKENS = 1.0
+_OTHER_CHAR_TOKENS = 0.25
+
+# 답변 길이 → 토큰 환산용 한국어 샘플 (토크나이저가 있으면 비율을 보정)
+_CALIBRATION_SAMPLE = (
+    "안녕하세요, 고객님! 소중한 리뷰 남겨주셔서 진심으로 감사드립니다. "
+    "말씀해주신 부분은 더 신경 써서 다음 방문 때 더 좋은 모습으로 찾아뵙겠습니다. 😊"
+)
+
+
+class TokenBudget:
+    """리뷰 입력/답변 출력 토큰 예산 계산기"""
+
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        max_review_tokens: int = 800,
+        safety_margin: float = 1.15,
+    ) -> None:
+        self.model = model
+        self.max_review_tokens = max_review_tokens
+        self.safety_margin = safety_margin
+        self._encoding = self._load_encoding(model)
+        self._tokens_per_char: float | None = None
+
+    @staticmethod
+    def _load_encoding(model: str):
+        global _encoding_load_failed
+        if not TIKTOKEN_AVAILABLE or _encoding_load_failed:
+            return None
+        try:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                return tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            # BPE 파일 다운로드 실패 등 → 문자 수 기반 추정치 사용
+            _encoding_load_failed = True
+            logger.warning("tiktoken 인코딩을 불러오지 못해 토큰 수를 추정합니다: %s", e)
+            return None
+
+    def count_tokens(self, text: str) -> int:
+        """텍스트의 토큰 수를 반환합니다. (토크나이저가 없으면 추정치)"""
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+
+        wide_chars = len(_WIDE_CHAR_PATTERN.findall(text))
+        other_chars = len(text) - wide_chars
+        return math.ceil(
+            wide_chars * _WIDE_CHAR_TOKENS + other_chars * _OTHER_CHAR_TOKENS
+        )
+
+    def fit_review_text(self, review_text: str) -> str:
+        """리뷰가 예산을 넘으면 앞부분과 끝부분만 남기고 가운데를 생략합니다.
+
+        리뷰의 요지는 보통 처음과 마지막 문장에 있으므로 앞 2/3, 뒤 1/3 비율로
+        남깁니다.
+        """
+        if self.count_tokens(review_text) <= self.max_review_tokens:
+            return review_text
+
+        budget = self.max_review_tokens - self.count_tokens(TRUNCATION_MARKER)
+        head = self._take_tokens(review_text, budget * 2 // 3)
+        tail = self._take_tokens(
+            review_text, budget - budget * 2 // 3, from_end=True
+        )
+        return f"{head.rstrip()}{TRUNCATION_MARKER}{tail.lstrip()}"
+
+    def max_tokens_for_reply(self, length_limit: int, items: int = 1) -> int:
+        """답변 글자수 제한에 맞는 completion ``max_tokens``를 계산합니다.
+
+        ``items``개의 답변을 JSON 배열로 한 번에 받는 경우 항목당 구조 토큰을
+        더합니다.
+        """
+        per_reply = math.ceil(length_limit * self._reply_tokens_per_char())
+        per_reply = math.ceil(per_reply * self.safety_margin)
+        if items <= 1:
+            return per_reply
+        # {"id": "12", "reply": "..."} 형태의 항목당 구조 토큰
+        return (per_reply + 16) * items + 4
+
+    def _reply_tokens_per_char(self) -> float:
+        if self._tokens_per_char is None:
+            self._tokens_per_char = self.count_tokens(_CALIBRATION_SAMPLE) / len(
+                _CALIBRATION_SAMPLE
+            )
+        return self._tokens_per_char
+
+    def _take_tokens(self, text: str, max_tokens: int, from_end: bool = False) -> str:
+        """토큰 수가 ``max_tokens`` 이하인 최장 접두부(또는 접미부)를 반환합니다."""
+        if max_tokens <= 0:
+            return ""
+
+        def piece(length: int) -> str:
+            return text[len(text) - length :] if from_end else text[:length]
+
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.count_tokens(piece(mid)) <= max_tokens:
+                low = mid
+            else:
+                high = mid - 1
+        return piece(low)
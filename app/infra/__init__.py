@@ -1,3 +1,3 @@
 """Infrastructure layer: browser automation, DB, and external services."""
 
-__all__ = ["browser", "llm_openai", "db"]
+__all__ = ["browser", "llm_openai", "llm_router", "smartplace_graphql", "db"]
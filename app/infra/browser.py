@@ -2,14 +2,103 @@
 
 This module provides a thin synchronous wrapper around Playwright for use by
 services that need to interact with a headed browser (login, navigation).
+
+``BrowserPool`` keeps one browser process warm across logins. Playwright's
+sync API must be used from the thread that started it, so the pool owns a
+dedicated thread. Each task runs on that thread and gets isolated contexts
+that are closed when the task ends.
+
+The ``wait_for_*`` helpers replace fixed sleeps with readiness checks: a URL
+predicate, a cookie being set, or the first matching network response. Each
+one has a timeout and returns a falsy value instead of raising when it
+expires.
 """
 
 from __future__ import annotations
 
 import os
-
+import queue
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# 쿠키 발급에 필요 없는 리소스 (로딩 시간만 늘어남)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+
+CookiePredicate = Callable[[dict], bool]
+
+
+def wait_for_url(page, predicate: Callable[[str], bool], timeout_ms: float) -> bool:
+    """페이지 URL이 ``predicate``를 만족할 때까지 기다립니다. 시간 초과 시 False."""
+    if predicate(page.url):
+        return True
+
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    try:
+        page.wait_for_url(predicate, timeout=timeout_ms, wait_until="commit")
+    except PlaywrightTimeoutError:
+        return False
+    return True
+
+
+def find_cookie(context, predicate: CookiePredicate) -> dict | None:
+    """컨텍스트의 쿠키 중 ``predicate``를 만족하는 첫 쿠키를 반환합니다."""
+    for cookie in context.cookies():
+        if predicate(cookie):
+            return cookie
+    return None
+
+
+def wait_for_cookie(
+    page, predicate: CookiePredicate, timeout_ms: float, poll_ms: float = 50
+) -> dict | None:
+    """조건에 맞는 쿠키가 설정될 때까지 기다립니다. 시간 초과 시 None.
+
+    Playwright에는 쿠키 설정 이벤트가 없으므로 짧은 간격으로 확인하되,
+    ``wait_for_timeout``으로 기다려 그 사이에도 페이지 이벤트가 처리되게 합니다.
+    """
+    remaining = timeout_ms
+    while True:
+        cookie = find_cookie(page.context, predicate)
+        if cookie is not None or remaining <= 0:
+            return cookie
+        page.wait_for_timeout(min(poll_ms, remaining))
+        remaining -= poll_ms
+
+
+def goto_and_wait_for_response(
+    page, url: str, predicate: Callable[[object], bool], timeout_ms: float
+):
+    """``url``로 이동하며 ``predicate``를 만족하는 첫 응답을 기다립니다.
+
+    응답 대기는 이동 전에 등록하므로 빠른 응답도 놓치지 않습니다.
+    시간 안에 응답이 없으면 None을 반환합니다.
+    """
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    try:
+        with page.expect_response(predicate, timeout=timeout_ms) as response_info:
+            page.goto(url, wait_until="commit", timeout=timeout_ms)
+        return response_info.value
+    except PlaywrightTimeoutError:
+        return None
+
+
+def block_heavy_resources(context) -> None:
+    """컨텍스트에서 이미지/폰트/미디어 요청을 보내지 않고 중단합니다."""
+
+    def handle(route) -> None:
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
+    context.route("**/*", handle)
 
 
 class BrowserClient:
@@ -53,22 +142,36 @@ class BrowserClient:
 
         self.browser = launcher.launch(headless=headless, slow_mo=slow_mo_ms)
 
-    def new_context(self, storage_state_path: Optional[Path] = None):
+    @property
+    def is_connected(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+    def new_context(
+        self,
+        storage_state_path: Optional[Path | dict] = None,
+        block_resources: bool = False,
+    ):
         """Create a new browser context, optionally loading storage state.
 
-        Returns a Playwright BrowserContext. The caller is responsible for
-        closing the returned context.
+        ``storage_state_path`` is a storage state file or an already loaded
+        storage state dict. With ``block_resources`` the context does not load
+        images, fonts or media. Returns a Playwright BrowserContext. The caller
+        is responsible for closing the returned context.
         """
         if self.browser is None:
             raise RuntimeError(
                 "BrowserClient not initialized. Call initialize() first."
             )
 
-        storage_state = str(storage_state_path) if storage_state_path else None
+        storage_state = storage_state_path or None
+        if isinstance(storage_state, Path):
+            storage_state = str(storage_state)
         context = self.browser.new_context(
             storage_state=storage_state,
             locale="ko-KR",
         )
+        if block_resources:
+            block_heavy_resources(context)
         return context
 
     def save_storage_state(self, context, path: Path) -> None:
@@ -84,3 +187,121 @@ class BrowserClient:
         finally:
             if self._playwright is not None:
                 self._playwright.stop()
+
+
+class BrowserPool:
+    """브라우저 프로세스 하나를 띄워 두고 여러 로그인에서 재사용하는 풀
+
+    모든 Playwright 호출은 풀 전용 스레드에서 실행됩니다. 작업은 순서대로
+    처리되고, 작업이 만든 컨텍스트는 끝나면 닫히므로 계정 간 세션이 섞이지
+    않습니다. 브라우저가 종료되었으면 다음 작업 때 다시 띄웁니다.
+    """
+
+    def __init__(self, headless: bool = True, browser_type: Optional[str] = None):
+        self.headless = headless
+        self.browser_type = browser_type
+        self._client: BrowserClient | None = None
+        self._tasks: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def run(self, task: Callable[[BrowserClient], T]) -> T:
+        """풀 스레드에서 ``task(client)``를 실행하고 결과를 반환합니다.
+
+        ``client``는 이미 실행 중인 브라우저를 가리키며 ``close``하면 안 됩니다.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BrowserPool is closed.")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="browser-pool", daemon=True
+                )
+                self._thread.start()
+            self._tasks.put((task, future))
+        return future.result()
+
+    def close(self) -> None:
+        """대기 중인 작업이 끝나면 브라우저를 닫고 스레드를 종료합니다."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            self._tasks.put(None)
+        if thread is not None:
+            thread.join(timeout=10)
+
+    def _worker(self) -> None:
+        try:
+            while True:
+                item = self._tasks.get()
+                if item is None:
+                    return
+                task, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(self._run_task(task))
+                except BaseException as exc:  # noqa: BLE001 - 호출한 스레드로 전달
+                    future.set_exception(exc)
+        finally:
+            self._shutdown_browser()
+
+    def _run_task(self, task: Callable[[BrowserClient], T]) -> T:
+        client = self._ensure_browser()
+        try:
+            return task(client)
+        finally:
+            # 작업이 닫지 않은 컨텍스트도 정리해 다음 계정과 격리
+            for context in list(client.browser.contexts):
+                try:
+                    context.close()
+                except Exception:  # noqa: BLE001 - 이미 닫힌 컨텍스트
+                    pass
+
+    def _ensure_browser(self) -> BrowserClient:
+        if self._client is not None and not self._client.is_connected:
+            self._shutdown_browser()
+        if self._client is None:
+            client = BrowserClient()
+            client.initialize(headless=self.headless, browser_type=self.browser_type)
+            self._client = client
+        return self._client
+
+    def _shutdown_browser(self) -> None:
+        if self._client is None:
+            return
+        try:
+            self._client.close()
+        except Exception:  # noqa: BLE001 - 종료 중 오류는 무시
+            pass
+        finally:
+            self._client = None
+
+
+_pools: dict[tuple[bool, str | None], BrowserPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool(
+    headless: bool = True, browser_type: Optional[str] = None
+) -> BrowserPool:
+    """설정(헤드리스 여부, 브라우저 종류)별로 공유되는 풀을 반환합니다."""
+    key = (headless, browser_type)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = _pools[key] = BrowserPool(headless, browser_type)
+        return pool
+
+
+def close_browser_pools() -> None:
+    """앱 종료 시 띄워 둔 브라우저를 모두 닫습니다."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
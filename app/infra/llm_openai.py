@@ -2,21 +2,44 @@
 
 from __future__ import annotations
 
+import importlib.util
+import json
 import os
 import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
 
-try:
-    from openai import OpenAI
+from app.core.retry import RetryPolicy
 
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# SDK 자체는 첫 클라이언트 생성 시 불러옴 (import만으로 수백 ms가 걸림)
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+
+
+# Batch API 작업의 종료 상태
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+@dataclass
+class BatchJobResult:
+    """Batch API 작업 결과 (custom_id 기준으로 매핑)"""
+
+    batch_id: str
+    status: str
+    outputs: dict[str, str] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
 
 
 class LLMClient:
     """OpenAI API 클라이언트"""
 
-    def __init__(self, model: str = "gpt-4o-mini", api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        api_key: str | None = None,
+        base_url: str | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
         if not OPENAI_AVAILABLE:
             raise ImportError("OpenAI package not installed. Run: pip install openai")
 
@@ -28,35 +51,97 @@ class LLMClient:
                 "OpenAI API key not found. Set OPENAI_API_KEY environment variable or pass api_key parameter"
             )
 
-        self.client = OpenAI(api_key=self.api_key)
+        from openai import OpenAI
+
+        # base_url을 지정하면 로컬 호환 서버(테스트용 가짜 엔드포인트 등)로 요청
+        # SDK 자체 재시도는 끄고 공용 재시도 정책(Retry-After 반영)을 사용
+        self.client = OpenAI(api_key=self.api_key, base_url=base_url, max_retries=0)
         self.max_retries = 3
-        self.retry_delay = 1.0
+        self.retry_policy = retry_policy or RetryPolicy(base_delay=1.0)
 
     def generate(
-        self, prompt: str, max_tokens: int = 500, temperature: float = 0.7
+        self,
+        prompt: str = "",
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        messages: list[dict[str, str]] | None = None,
+        model: str | None = None,
     ) -> str:
-        """프롬프트에 대한 응답을 생성합니다."""
+        """프롬프트(또는 채팅 메시지 목록)에 대한 응답을 생성합니다.
+
+        ``model``을 지정하면 이번 호출에 한해 기본 모델 대신 사용합니다.
+        """
+        if messages is None:
+            messages = [{"role": "user", "content": prompt}]
+
+        def create() -> str:
+            response = self.client.chat.completions.create(
+                model=model or self.model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                timeout=30.0,
+            )
+            return response.choices[0].message.content.strip()
 
-        for attempt in range(self.max_retries):
+        try:
+            # 429/5xx/타임아웃만 재시도하고 잘못된 요청(4xx)은 즉시 실패
+            return self.retry_policy.call(create, max_attempts=self.max_retries)
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API 호출 실패: {e}")
+
+    def generate_stream(
+        self,
+        prompt: str = "",
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        messages: list[dict[str, str]] | None = None,
+        model: str | None = None,
+    ) -> Iterator[str]:
+        """응답을 스트리밍으로 생성하며 도착하는 텍스트 조각을 차례로 반환합니다.
+
+        첫 조각을 받기 전에 실패한 경우에만 재시도합니다. 이미 일부를 전달한 뒤
+        재시도하면 같은 내용이 중복되기 때문입니다.
+        """
+        if messages is None:
+            messages = [{"role": "user", "content": prompt}]
+
+        attempt = 0
+        delay = self.retry_policy.base_delay
+        while True:
+            attempt += 1
+            received = False
             try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
+                stream = self.client.chat.completions.create(
+                    model=model or self.model,
+                    messages=messages,
                     max_tokens=max_tokens,
                     temperature=temperature,
                     timeout=30.0,
+                    stream=True,
                 )
-
-                return response.choices[0].message.content.strip()
+                for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        received = True
+                        yield delta
+                return
 
             except Exception as e:
-                if attempt == self.max_retries - 1:
-                    raise RuntimeError(f"OpenAI API 호출 실패 (최대 재시도 초과): {e}")
-
-                wait_time = self.retry_delay * (2**attempt)
-                time.sleep(wait_time)
+                next_delay = (
+                    None
+                    if received
+                    else self.retry_policy.delay_before_retry(
+                        e, attempt, delay, max_attempts=self.max_retries
+                    )
+                )
+                if next_delay is None:
+                    raise RuntimeError(f"OpenAI 스트리밍 호출 실패: {e}")
 
-        return ""  # Should not reach here
+                delay = next_delay
+                time.sleep(delay)
 
     def generate_batch(
         self, prompts: list[str], max_tokens: int = 500, temperature: float = 0.7
@@ -77,3 +162,117 @@ class LLMClient:
                 results.append(f"오류 발생: {e}")
 
         return results
+
+    def build_batch_request(
+        self,
+        custom_id: str,
+        prompt: str = "",
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        messages: list[dict[str, str]] | None = None,
+    ) -> dict[str, Any]:
+        """Batch API 입력 파일(JSONL)의 한 줄에 해당하는 요청을 만듭니다."""
+        if messages is None:
+            messages = [{"role": "user", "content": prompt}]
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": self.model,
+                "messages": messages,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+            },
+        }
+
+    def submit_batch_job(
+        self,
+        requests: list[dict[str, Any]],
+        jsonl_path: Path,
+        metadata: dict[str, str] | None = None,
+    ) -> str:
+        """요청 목록을 JSONL로 기록해 업로드하고 Batch 작업을 생성합니다.
+
+        생성된 batch ID를 반환합니다. 결과는 ``wait_for_batch_job``으로 수집합니다.
+        """
+        jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+        with jsonl_path.open("w", encoding="utf-8") as f:
+            for request in requests:
+                f.write(json.dumps(request, ensure_ascii=False) + "\n")
+
+        with jsonl_path.open("rb") as f:
+            input_file = self.client.files.create(file=f, purpose="batch")
+
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            metadata=metadata,
+        )
+        return batch.id
+
+    def wait_for_batch_job(
+        self,
+        batch_id: str,
+        poll_interval: float = 30.0,
+        timeout: float | None = None,
+        on_status: Callable[[str], None] | None = None,
+    ) -> BatchJobResult:
+        """Batch 작업이 끝날 때까지 폴링한 뒤 결과를 custom_id별로 반환합니다."""
+        started = time.monotonic()
+        last_status = None
+
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status != last_status:
+                last_status = batch.status
+                if on_status:
+                    on_status(batch.status)
+
+            if batch.status in BATCH_TERMINAL_STATUSES:
+                break
+
+            if timeout is not None and time.monotonic() - started > timeout:
+                raise TimeoutError(
+                    f"Batch 작업 대기 시간 초과 (batch_id: {batch_id}, 상태: {batch.status})"
+                )
+            time.sleep(poll_interval)
+
+        result = BatchJobResult(batch_id=batch_id, status=batch.status)
+        if batch.output_file_id:
+            self._collect_batch_lines(batch.output_file_id, result)
+        if getattr(batch, "error_file_id", None):
+            self._collect_batch_lines(batch.error_file_id, result)
+        return result
+
+    def _collect_batch_lines(self, file_id: str, result: BatchJobResult) -> None:
+        """Batch 출력/오류 파일을 읽어 결과 객체에 채웁니다."""
+        content = self.client.files.content(file_id).text
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            custom_id = record.get("custom_id")
+            if not custom_id:
+                continue
+
+            response = record.get("response") or {}
+            error = record.get("error")
+            if error or response.get("status_code") != 200:
+                message = (error or {}).get("message") if isinstance(error, dict) else error
+                result.errors[custom_id] = (
+                    message or f"HTTP {response.get('status_code')}"
+                )
+                continue
+
+            try:
+                text = response["body"]["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
+                result.errors[custom_id] = "응답 형식 오류"
+                continue
+            result.outputs[custom_id] = (text or "").strip()
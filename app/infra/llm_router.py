@@ -0,0 +1,303 @@
+"""Multi-provider LLM routing with health tracking and failover.
+
+Each backend is an ``LLMClient`` pointed at an OpenAI-compatible endpoint
+(the official API, or a local server such as Ollama, vLLM or LM Studio).
+``LLMRouter`` exposes the same ``generate`` interface as ``LLMClient`` and
+sends each call to the backend with the best recent p95 latency and error
+rate. If a call fails it moves on to the next backend, and a backend that
+keeps failing is put on a cooldown.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from app.core.retry import RetryPolicy
+from app.infra.llm_openai import LLMClient
+
+# 공급자 이름 → 기본 엔드포인트 (None이면 OpenAI 공식 API)
+PROVIDER_BASE_URLS: dict[str, str | None] = {
+    "openai": None,
+    "local": "http://localhost:11434/v1",
+}
+
+DEFAULT_PROVIDER = "openai"
+DEFAULT_MODEL = "gpt-4o-mini"
+
+# 선택되지 않은 백엔드도 이 간격마다 한 번씩 시도해 회복 여부를 측정
+PROBE_INTERVAL = 60.0
+
+
+@dataclass
+class BackendSpec:
+    """LLM 백엔드 설정"""
+
+    provider: str = DEFAULT_PROVIDER
+    model: str = DEFAULT_MODEL
+    base_url: str | None = None
+    api_key: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BackendSpec:
+        return cls(
+            provider=normalize_provider(data.get("provider", DEFAULT_PROVIDER)),
+            model=data.get("model") or DEFAULT_MODEL,
+            base_url=data.get("base_url") or None,
+            api_key=data.get("api_key") or None,
+        )
+
+    @property
+    def name(self) -> str:
+        return f"{self.provider}:{self.model}"
+
+
+@dataclass
+class BackendHealth:
+    """백엔드의 최근 지연 시간/오류율 기록"""
+
+    window: int = 50
+    latencies: deque = field(default_factory=deque)
+    outcomes: deque = field(default_factory=deque)
+    consecutive_failures: int = 0
+    cooldown_until: float = 0.0
+    last_attempt: float = 0.0
+
+    def record_success(self, latency: float) -> None:
+        self._push(self.latencies, latency)
+        self._push(self.outcomes, True)
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+
+    def record_failure(self, now: float) -> None:
+        self._push(self.outcomes, False)
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= 3:
+            # 연속 실패 시 30초부터 최대 5분까지 배로 늘어나는 휴지 기간
+            cooldown = min(30.0 * 2 ** (self.consecutive_failures - 3), 300.0)
+            self.cooldown_until = now + cooldown
+
+    def p95_latency(self) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def score(self) -> float:
+        """낮을수록 좋은 점수. 측정 기록이 없으면 0 (먼저 시도해 측정)."""
+        p95 = self.p95_latency()
+        if p95 is None:
+            return 0.0 if not self.outcomes else float("inf")
+        return p95 * (1.0 + 4.0 * self.error_rate())
+
+    def _push(self, values: deque, value: Any) -> None:
+        values.append(value)
+        while len(values) > self.window:
+            values.popleft()
+
+
+@dataclass
+class _Backend:
+    spec: BackendSpec
+    client: LLMClient
+    order: int
+    health: BackendHealth = field(default_factory=BackendHealth)
+
+
+def normalize_provider(provider: str | None) -> str:
+    """UI 표기(예: "OpenAI")를 내부 공급자 키로 변환합니다."""
+    return (provider or DEFAULT_PROVIDER).strip().lower()
+
+
+def _create_client(
+    spec: BackendSpec,
+    default_api_key: str | None,
+    retry_policy: RetryPolicy | None = None,
+) -> LLMClient:
+    base_url = spec.base_url or PROVIDER_BASE_URLS.get(spec.provider)
+    api_key = spec.api_key or (default_api_key if spec.provider == "openai" else None)
+    # 로컬 호환 서버는 키를 검사하지 않지만 SDK는 값이 필요함
+    if spec.provider != "openai" and not api_key:
+        api_key = spec.provider
+    return LLMClient(
+        model=spec.model, api_key=api_key, base_url=base_url, retry_policy=retry_policy
+    )
+
+
+class LLMRouter:
+    """여러 LLM 백엔드 중 상태가 가장 좋은 곳으로 요청을 보내는 라우터"""
+
+    def __init__(
+        self,
+        specs: list[BackendSpec],
+        default_api_key: str | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        if not specs:
+            raise ValueError("LLM 백엔드가 하나 이상 필요합니다.")
+
+        self._lock = threading.Lock()
+        self._backends: list[_Backend] = []
+        for order, spec in enumerate(specs):
+            client = _create_client(spec, default_api_key, retry_policy)
+            # 재시도는 라우터가 다른 백엔드로 넘기는 방식으로 처리
+            client.max_retries = 1
+            self._backends.append(_Backend(spec=spec, client=client, order=order))
+
+    @property
+    def primary(self) -> LLMClient:
+        return self._backends[0].client
+
+    @property
+    def model(self) -> str:
+        return self.primary.model
+
+    def generate(
+        self,
+        prompt: str = "",
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        messages: list[dict[str, str]] | None = None,
+        model: str | None = None,
+    ) -> str:
+        """가장 상태가 좋은 백엔드부터 차례로 시도해 응답을 생성합니다.
+
+        ``model`` 재지정은 기본(첫 번째) 백엔드와 같은 공급자에만 적용합니다.
+        """
+        errors = []
+        primary_provider = self._backends[0].spec.provider
+
+        for backend in self._ranked_backends():
+            started = time.monotonic()
+            backend.health.last_attempt = started
+            try:
+                result = backend.client.generate(
+                    prompt=prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    messages=messages,
+                    model=model if backend.spec.provider == primary_provider else None,
+                )
+            except Exception as e:
+                with self._lock:
+                    backend.health.record_failure(time.monotonic())
+                errors.append(f"{backend.spec.name}: {e}")
+                continue
+
+            with self._lock:
+                backend.health.record_success(time.monotonic() - started)
+            return result
+
+        raise RuntimeError(f"모든 LLM 백엔드 호출 실패: {'; '.join(errors)}")
+
+    def generate_stream(
+        self,
+        prompt: str = "",
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        messages: list[dict[str, str]] | None = None,
+        model: str | None = None,
+    ) -> Iterator[str]:
+        """스트리밍 생성. 첫 조각을 받기 전에 실패하면 다음 백엔드로 넘깁니다."""
+        errors = []
+        primary_provider = self._backends[0].spec.provider
+
+        for backend in self._ranked_backends():
+            started = time.monotonic()
+            backend.health.last_attempt = started
+            received = False
+            try:
+                for delta in backend.client.generate_stream(
+                    prompt=prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    messages=messages,
+                    model=model if backend.spec.provider == primary_provider else None,
+                ):
+                    if not received:
+                        # 첫 조각까지의 시간(TTFT)을 지연 시간으로 기록
+                        received = True
+                        with self._lock:
+                            backend.health.record_success(time.monotonic() - started)
+                    yield delta
+            except Exception as e:
+                with self._lock:
+                    backend.health.record_failure(time.monotonic())
+                if received:
+                    raise
+                errors.append(f"{backend.spec.name}: {e}")
+                continue
+
+            if not received:
+                with self._lock:
+                    backend.health.record_success(time.monotonic() - started)
+            return
+
+        raise RuntimeError(f"모든 LLM 백엔드 호출 실패: {'; '.join(errors)}")
+
+    def health_snapshot(self) -> list[dict[str, Any]]:
+        """백엔드별 상태 요약 (로그/디버깅용)"""
+        with self._lock:
+            return [
+                {
+                    "backend": backend.spec.name,
+                    "p95_latency": backend.health.p95_latency(),
+                    "error_rate": backend.health.error_rate(),
+                    "cooling_down": backend.health.cooldown_until > time.monotonic(),
+                }
+                for backend in self._backends
+            ]
+
+    # Batch API는 기본 백엔드에서만 지원
+    def build_batch_request(self, *args, **kwargs) -> dict[str, Any]:
+        return self.primary.build_batch_request(*args, **kwargs)
+
+    def submit_batch_job(self, *args, **kwargs) -> str:
+        return self.primary.submit_batch_job(*args, **kwargs)
+
+    def wait_for_batch_job(self, *args, **kwargs):
+        return self.primary.wait_for_batch_job(*args, **kwargs)
+
+    def _ranked_backends(self) -> list[_Backend]:
+        now = time.monotonic()
+        with self._lock:
+            ranked = sorted(
+                self._backends,
+                key=lambda backend: (backend.health.score(), backend.order),
+            )
+            available = [b for b in ranked if b.health.cooldown_until <= now]
+            cooling = [b for b in ranked if b.health.cooldown_until > now]
+            # 오래 쓰이지 않은 백엔드는 한 번 앞으로 보내 상태를 다시 측정
+            stale = [
+                b
+                for b in available[1:]
+                if b.health.last_attempt
+                and now - b.health.last_attempt >= PROBE_INTERVAL
+            ]
+        # 모두 휴지 중이어도 요청을 포기하지 않고 순서대로 시도
+        rest = [b for b in available if b not in stale]
+        return stale[:1] + rest + stale[1:] + cooling
+
+
+def create_llm_client(
+    primary: BackendSpec,
+    fallbacks: list[BackendSpec] | None = None,
+    default_api_key: str | None = None,
+    retry_policy: RetryPolicy | None = None,
+) -> LLMClient | LLMRouter:
+    """대체 백엔드가 없으면 단일 ``LLMClient``를, 있으면 ``LLMRouter``를 만듭니다."""
+    if not fallbacks:
+        return _create_client(primary, default_api_key, retry_policy)
+    return LLMRouter(
+        [primary, *fallbacks],
+        default_api_key=default_api_key,
+        retry_policy=retry_policy,
+    )
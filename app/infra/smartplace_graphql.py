@@ -0,0 +1,239 @@
+"""Shared SmartPlace GraphQL transport guarded by a circuit breaker.
+
+``getReviews`` and ``createReply`` calls go through ``SmartPlaceGraphQL``.
+Every timeout, connection error or 429/5xx response counts as a failure.
+After ``failure_threshold`` consecutive failures the breaker opens, and later
+calls fail at once with ``CircuitOpenError`` instead of each waiting for its
+own 30 s timeout. After ``recovery_timeout`` seconds one probe request is let
+through (half-open): a success closes the breaker, a failure opens it again.
+
+When several accounts run in parallel, a shared ``RequestLimiter`` caps the
+number of in-flight requests per account and across all accounts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Iterator
+
+import httpx
+
+from app.core.errors import CircuitOpenError
+from app.core.retry import is_retryable
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# 서버가 과부하/장애 상태임을 뜻하는 응답 코드
+FAILURE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커 (스레드 안전)"""
+
+    def __init__(
+        self,
+        name: str = "smartplace",
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def before_call(self) -> None:
+        """요청을 보내도 되는지 확인하고, 안 되면 ``CircuitOpenError``를 발생시킵니다."""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return
+            if self._state == STATE_OPEN:
+                remaining = self._opened_at + self.recovery_timeout - self._clock()
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"{self.name} 서킷 브레이커 열림 "
+                        f"(연속 {self._failures}회 실패, {remaining:.0f}초 후 재확인)"
+                    )
+                self._state = STATE_HALF_OPEN
+                self._probe_in_flight = False
+            # 반열림 상태에서는 확인 요청 하나만 통과
+            if self._probe_in_flight:
+                raise CircuitOpenError(f"{self.name} 서킷 브레이커 확인 요청 진행 중")
+            self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = STATE_CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if (
+                self._state == STATE_HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = STATE_OPEN
+                self._opened_at = self._clock()
+
+    def release_probe(self) -> None:
+        """결과를 알 수 없이 끝난 요청(취소 등)의 확인 요청 자리를 비웁니다."""
+        with self._lock:
+            self._probe_in_flight = False
+
+
+class RequestLimiter:
+    """계정별/전체 동시 요청 수 제한 (스레드 안전, 여러 계정이 공유)"""
+
+    def __init__(self, global_limit: int = 8, per_key_limit: int = 2) -> None:
+        self.global_limit = max(1, global_limit)
+        self.per_key_limit = max(1, per_key_limit)
+        self._global = threading.BoundedSemaphore(self.global_limit)
+        self._lock = threading.Lock()
+        self._per_key: dict[str, threading.BoundedSemaphore] = {}
+        # slot_async가 세마포어를 기다리는 스레드 (첫 사용 시 생성)
+        self._waiters: ThreadPoolExecutor | None = None
+
+    def _key_semaphore(self, key: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if key not in self._per_key:
+                self._per_key[key] = threading.BoundedSemaphore(self.per_key_limit)
+            return self._per_key[key]
+
+    @contextmanager
+    def slot(self, key: str) -> Iterator[None]:
+        """``key``(계정)의 요청 하나가 실행될 자리를 확보합니다."""
+        key_semaphore = self._key_semaphore(key)
+        # 계정 한도를 먼저 잡아야 한 계정이 전체 한도를 독차지하지 않음
+        with key_semaphore, self._global:
+            yield
+
+    @asynccontextmanager
+    async def slot_async(self, key: str) -> AsyncIterator[None]:
+        """``slot``의 비동기 버전. 대기는 이벤트 루프를 막지 않도록 스레드에서 합니다."""
+        key_semaphore = self._key_semaphore(key)
+        await self._acquire_async(key_semaphore)
+        try:
+            await self._acquire_async(self._global)
+            try:
+                yield
+            finally:
+                self._global.release()
+        finally:
+            key_semaphore.release()
+
+    async def _acquire_async(self, semaphore: threading.BoundedSemaphore) -> None:
+        with self._lock:
+            if self._waiters is None:
+                self._waiters = ThreadPoolExecutor(thread_name_prefix="limiter")
+            pending = self._waiters.submit(semaphore.acquire)
+        try:
+            await asyncio.wrap_future(pending)
+        except asyncio.CancelledError:
+            # 이미 기다리기 시작한 스레드는 멈출 수 없으므로, 나중에 얻은 자리는 반납
+            pending.add_done_callback(
+                lambda done: None if done.cancelled() else semaphore.release()
+            )
+            raise
+
+    def close(self) -> None:
+        """``slot_async`` 대기 스레드를 정리합니다. 이후 다시 쓰면 새로 만듭니다."""
+        with self._lock:
+            waiters, self._waiters = self._waiters, None
+        if waiters is not None:
+            waiters.shutdown(wait=False, cancel_futures=True)
+
+
+class SmartPlaceGraphQL:
+    """서킷 브레이커를 거쳐 SmartPlace GraphQL 엔드포인트로 요청을 보냅니다."""
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        breaker: CircuitBreaker | None = None,
+        limiter: RequestLimiter | None = None,
+        limiter_key: str = "",
+    ) -> None:
+        self.client = client
+        self.breaker = breaker or CircuitBreaker()
+        self.limiter = limiter
+        self.limiter_key = limiter_key
+
+    def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """동기 POST. 응답은 상태 코드와 관계없이 그대로 반환합니다."""
+        if self.limiter is None:
+            return self._post(url, **kwargs)
+        with self.limiter.slot(self.limiter_key):
+            return self._post(url, **kwargs)
+
+    def _post(self, url: str, **kwargs: Any) -> httpx.Response:
+        self.breaker.before_call()
+        try:
+            response = self.client.post(url, **kwargs)
+        except Exception as exc:
+            self._record_exception(exc)
+            raise
+        except BaseException:
+            # 취소 등으로 결과를 모르면 반열림 확인 요청 자리만 비움
+            self.breaker.release_probe()
+            raise
+        self._record_response(response)
+        return response
+
+    async def post_async(
+        self, async_client: httpx.AsyncClient, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        """``httpx.AsyncClient``로 보내는 비동기 POST (같은 브레이커 공유)."""
+        if self.limiter is None:
+            return await self._post_async(async_client, url, **kwargs)
+        async with self.limiter.slot_async(self.limiter_key):
+            return await self._post_async(async_client, url, **kwargs)
+
+    async def _post_async(
+        self, async_client: httpx.AsyncClient, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        self.breaker.before_call()
+        try:
+            response = await async_client.post(url, **kwargs)
+        except Exception as exc:
+            self._record_exception(exc)
+            raise
+        except BaseException:
+            # 취소 등으로 결과를 모르면 반열림 확인 요청 자리만 비움
+            self.breaker.release_probe()
+            raise
+        self._record_response(response)
+        return response
+
+    def _record_response(self, response: httpx.Response) -> None:
+        if response.status_code in FAILURE_STATUS_CODES:
+            self.breaker.record_failure()
+        else:
+            # 4xx 등은 서버가 정상 응답한 것이므로 장애로 보지 않음
+            self.breaker.record_success()
+
+    def _record_exception(self, exc: Exception) -> None:
+        if is_retryable(exc):
+            self.breaker.record_failure()
+        else:
+            # 서버 상태를 알려주지 않는 오류이므로 브레이커를 닫지 않고
+            # 반열림 확인 요청 자리만 비움
+            self.breaker.release_probe()
@@ -2,6 +2,7 @@
 메인 애플리케이션 진입점 - 네이버 스마트플레이스 리뷰 자동응답 시스템
 """
 
+import importlib.util
 import sys
 import os
 import logging
@@ -11,22 +12,12 @@ from PySide6.QtWidgets import QApplication, QMessageBox, QSplashScreen
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPixmap, QFont
 
-from app.ui import MainWindow
-
 
 def setup_logging():
-    """로깅 설정"""
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_dir / "app.log", encoding="utf-8"),
-            logging.StreamHandler(sys.stdout),
-        ],
-    )
+    """로깅 설정 (큐 기반 비동기 기록, 파일 크기별 회전)"""
+    from app.core.logging import setup_app_logging
+
+    setup_app_logging(level=logging.INFO)
 
 
 def check_dependencies():
@@ -35,10 +26,9 @@ def check_dependencies():
 
     missing_modules = []
 
+    # 모듈을 실제로 불러오지 않고 설치 여부만 확인 (시작 시간 단축)
     for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
+        if importlib.util.find_spec(module) is None:
             missing_modules.append(module)
 
     if missing_modules:
@@ -142,6 +132,9 @@ def main():
         )
         app.processEvents()
 
+        # 스플래시가 그려진 뒤에 UI 모듈을 불러옴
+        from app.ui.main_window import MainWindow
+
         main_window = MainWindow()
 
         # 스플래시 스크린 종료 및 메인 윈도우 표시
@@ -167,8 +160,8 @@ def main():
 
             logger.info("메인 윈도우 표시 완료")
 
-        # 2초 후 메인 윈도우 표시
-        QTimer.singleShot(2000, show_main_window)
+        # 이벤트 루프가 시작되면 바로 메인 윈도우 표시
+        QTimer.singleShot(0, show_main_window)
 
         # 이벤트 루프 실행
         exit_code = app.exec()
@@ -10,4 +10,8 @@ __all__ = [
     "throttle",
     "captcha_watch",
     "stop_signal",
+    "checkpoint",
+    "triage",
+    "accounts",
+    "account_scheduler",
 ]
@@ -0,0 +1,110 @@
+"""Run the orchestration for several owner accounts at the same time.
+
+Each account runs in its own thread with its own authenticated httpx client,
+so cookies and CSRF tokens never mix. All accounts share one
+``RequestLimiter``: it caps the number of in-flight SmartPlace requests per
+account and in total, so running accounts in parallel does not multiply the
+load on the API. A sweep then takes about as long as the slowest account,
+instead of the sum of all accounts.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from app.infra.smartplace_graphql import RequestLimiter
+from app.services.accounts import Account
+from app.services.stop_signal import StopSignal
+
+LogCallback = Callable[[str, str], None]
+AccountRunner = Callable[[Account], Any]
+
+
+@dataclass
+class AccountRunResult:
+    """계정 하나의 실행 결과"""
+
+    account_id: str
+    result: Any = None
+    error: str | None = None
+    elapsed: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+class AccountScheduler:
+    """계정별 실행을 스레드 풀에서 동시에 돌리는 스케줄러"""
+
+    def __init__(
+        self,
+        max_parallel_accounts: int = 4,
+        per_account_concurrency: int = 2,
+        global_concurrency: int = 8,
+        stop_signal: StopSignal | None = None,
+    ) -> None:
+        self.max_parallel_accounts = max(1, max_parallel_accounts)
+        self.stop_signal = stop_signal
+        # 모든 계정의 GraphQL 호출이 공유하는 동시 요청 제한
+        self.limiter = RequestLimiter(
+            global_limit=global_concurrency, per_key_limit=per_account_concurrency
+        )
+
+    def run(
+        self,
+        accounts: list[Account],
+        run_account: AccountRunner,
+        log: LogCallback | None = None,
+    ) -> list[AccountRunResult]:
+        """계정마다 ``run_account``를 실행하고 입력 순서대로 결과를 반환합니다.
+
+        한 계정의 실패는 다른 계정의 실행에 영향을 주지 않습니다.
+        """
+
+        def emit(level: str, message: str) -> None:
+            if log:
+                log(level, message)
+
+        if not accounts:
+            return []
+
+        def run_one(account: Account) -> AccountRunResult:
+            started = time.monotonic()
+            if self.stop_signal and self.stop_signal.is_set():
+                return AccountRunResult(account.user_id, error="중단됨")
+            try:
+                result = run_account(account)
+            except Exception as e:
+                emit("ERROR", f"계정 '{account.display_name}' 실행 실패: {e}")
+                return AccountRunResult(
+                    account.user_id, error=str(e), elapsed=time.monotonic() - started
+                )
+            return AccountRunResult(
+                account.user_id, result=result, elapsed=time.monotonic() - started
+            )
+
+        workers = min(self.max_parallel_accounts, len(accounts))
+        emit(
+            "INFO",
+            f"{len(accounts)}개 계정을 최대 {workers}개씩 동시에 실행합니다.",
+        )
+        started = time.monotonic()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="account"
+            ) as executor:
+                results = list(executor.map(run_one, accounts))
+        finally:
+            self.limiter.close()
+
+        slowest = max(results, key=lambda r: r.elapsed)
+        emit(
+            "INFO",
+            f"모든 계정 실행 완료: {time.monotonic() - started:.1f}초 "
+            f"(가장 느린 계정 '{slowest.account_id}' {slowest.elapsed:.1f}초)",
+        )
+        return results
@@ -0,0 +1,127 @@
+"""Registry of Naver owner accounts and their isolated session storage.
+
+Each account keeps its own Playwright storage state (cookies) and CSRF token
+under ``.auth/accounts/<account>/``, so sessions of different owners never
+overwrite each other. The registry file ``configs/accounts.json`` lists the
+accounts and the SmartPlace businesses each one manages. Passwords are not
+stored here.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+DEFAULT_ACCOUNTS_PATH = Path("configs/accounts.json")
+DEFAULT_SESSIONS_DIR = Path(".auth/accounts")
+
+_SAFE_NAME = re.compile(r"[^0-9A-Za-z_.-]")
+
+
+def account_storage_path(
+    user_id: str, sessions_dir: Path | str = DEFAULT_SESSIONS_DIR
+) -> Path:
+    """계정별 쿠키 파일 경로 (같은 폴더에 CSRF 토큰도 저장됨)"""
+    return Path(sessions_dir) / _SAFE_NAME.sub("_", user_id) / "cookies.json"
+
+
+@dataclass
+class Account:
+    """네이버 사장님 계정 하나와 관리하는 사업장 목록"""
+
+    user_id: str
+    business_ids: list[str] = field(default_factory=list)
+    label: str = ""
+    enabled: bool = True
+
+    @property
+    def display_name(self) -> str:
+        return self.label or self.user_id
+
+    @property
+    def storage_path(self) -> Path:
+        return account_storage_path(self.user_id)
+
+    def has_session(self) -> bool:
+        return self.storage_path.exists()
+
+
+class AccountRegistry:
+    """계정 목록을 JSON 파일 하나에 저장합니다. (스레드 안전)"""
+
+    def __init__(self, path: Path | str = DEFAULT_ACCOUNTS_PATH) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._accounts: dict[str, Account] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    def get(self, user_id: str) -> Account | None:
+        return self._accounts.get(user_id)
+
+    def list(self, enabled_only: bool = False) -> list[Account]:
+        accounts = list(self._accounts.values())
+        if enabled_only:
+            accounts = [account for account in accounts if account.enabled]
+        return accounts
+
+    def upsert(
+        self,
+        user_id: str,
+        business_ids: list[str] | None = None,
+        label: str | None = None,
+        enabled: bool | None = None,
+    ) -> Account:
+        """계정을 추가하거나 주어진 값만 갱신하고 저장합니다."""
+        with self._lock:
+            account = self._accounts.get(user_id) or Account(user_id=user_id)
+            if business_ids is not None:
+                account.business_ids = list(dict.fromkeys(business_ids))
+            if label is not None:
+                account.label = label
+            if enabled is not None:
+                account.enabled = enabled
+            self._accounts[user_id] = account
+            self._save()
+            return account
+
+    def remove(self, user_id: str) -> None:
+        with self._lock:
+            if self._accounts.pop(user_id, None) is not None:
+                self._save()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {"accounts": [asdict(account) for account in self._accounts.values()]},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        os.replace(tmp_path, self.path)
+
+    def _load(self) -> None:
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+
+        for item in data.get("accounts", []):
+            if not isinstance(item, dict) or not item.get("user_id"):
+                continue
+            account = Account(
+                user_id=str(item["user_id"]),
+                business_ids=[str(b) for b in item.get("business_ids", [])],
+                label=str(item.get("label", "")),
+                enabled=bool(item.get("enabled", True)),
+            )
+            self._accounts[account.user_id] = account
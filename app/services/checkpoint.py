@@ -0,0 +1,173 @@
+"""Per-store stage checkpoints so an interrupted run can be resumed.
+
+Each orchestration run gets a run ID. After every stage (enumerate, crawl,
+generate, submit) the stage output for a store is written to
+``runs/checkpoints/<run_id>/stores/<booking_id>.json``. A later run started
+with the same run ID restores finished stages from disk instead of calling
+the SmartPlace API or the LLM again.
+
+Runs are keyed by the owner account and its business IDs, so another owner
+with the same business list never picks up someone else's run. Only the
+most recent completed runs are kept on disk.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+STAGE_ENUMERATED = "enumerated"
+STAGE_CRAWLED = "crawled"
+STAGE_GENERATED = "generated"
+STAGE_SUBMITTED = "submitted"
+
+STAGES = (STAGE_ENUMERATED, STAGE_CRAWLED, STAGE_GENERATED, STAGE_SUBMITTED)
+
+DEFAULT_CHECKPOINT_DIR = Path("runs/checkpoints")
+
+# 디스크에 남겨 둘 완료된 실행 수
+DEFAULT_KEEP_COMPLETED = 20
+
+
+class RunCheckpointStore:
+    """실행 ID 단위로 매장별 단계 결과를 파일에 저장/복원합니다."""
+
+    def __init__(
+        self,
+        root: Path | str = DEFAULT_CHECKPOINT_DIR,
+        keep_completed: int = DEFAULT_KEEP_COMPLETED,
+    ) -> None:
+        self.root = Path(root)
+        self.keep_completed = keep_completed
+
+    @staticmethod
+    def new_run_id() -> str:
+        """새 실행 ID를 생성합니다. (시간순 정렬 가능)"""
+        return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+    def start_run(
+        self, run_id: str, business_ids: list[str], user_id: str = ""
+    ) -> None:
+        """실행 매니페스트를 기록합니다. 이미 존재하면 그대로 둡니다."""
+        manifest_path = self._manifest_path(run_id)
+        if manifest_path.exists():
+            return
+        self._write_json(
+            manifest_path,
+            {
+                "run_id": run_id,
+                "user_id": user_id,
+                "business_ids": list(business_ids),
+                "created_at": datetime.now().isoformat(),
+                "completed": False,
+            },
+        )
+
+    def mark_completed(self, run_id: str) -> None:
+        """모든 매장이 마지막 단계까지 끝난 실행을 완료로 표시합니다."""
+        manifest = self._read_json(self._manifest_path(run_id))
+        if manifest is None:
+            return
+        manifest["completed"] = True
+        manifest["completed_at"] = datetime.now().isoformat()
+        self._write_json(self._manifest_path(run_id), manifest)
+        self.prune_completed()
+
+    def prune_completed(self, keep: int | None = None) -> list[str]:
+        """가장 최근 ``keep``개를 제외한 완료된 실행을 삭제하고 삭제한 ID를 반환합니다."""
+        keep = self.keep_completed if keep is None else keep
+        if not self.root.exists():
+            return []
+
+        completed = []
+        for run_dir in sorted(self.root.iterdir(), reverse=True):
+            manifest = self._read_json(run_dir / "manifest.json")
+            if manifest and manifest.get("completed"):
+                completed.append(run_dir)
+
+        removed = []
+        for run_dir in completed[max(0, keep) :]:
+            shutil.rmtree(run_dir, ignore_errors=True)
+            removed.append(run_dir.name)
+        return removed
+
+    def discard_run(self, run_id: str) -> None:
+        """재개하지 않기로 한 실행의 체크포인트를 삭제합니다."""
+        shutil.rmtree(self.root / run_id, ignore_errors=True)
+
+    def find_resumable_run(
+        self, business_ids: list[str], user_id: str = ""
+    ) -> str | None:
+        """같은 계정과 사업장 목록으로 시작했다가 끝나지 않은 가장 최근 실행 ID를 찾습니다."""
+        if not self.root.exists():
+            return None
+
+        wanted = sorted(business_ids)
+        for run_dir in sorted(self.root.iterdir(), reverse=True):
+            manifest = self._read_json(run_dir / "manifest.json")
+            if not manifest or manifest.get("completed"):
+                continue
+            if manifest.get("user_id", "") != user_id:
+                continue
+            if sorted(manifest.get("business_ids", [])) == wanted:
+                return manifest.get("run_id", run_dir.name)
+        return None
+
+    def load_stage(self, run_id: str, booking_id: str, stage: str) -> Any | None:
+        """매장의 특정 단계 결과를 반환합니다. 없으면 None."""
+        data = self._read_json(self._store_path(run_id, booking_id))
+        if not data:
+            return None
+        return data.get("stages", {}).get(stage)
+
+    def save_stage(
+        self, run_id: str, booking_id: str, stage: str, payload: Any
+    ) -> None:
+        """매장의 특정 단계 결과를 저장합니다."""
+        if stage not in STAGES:
+            raise ValueError(f"알 수 없는 체크포인트 단계: {stage}")
+
+        path = self._store_path(run_id, booking_id)
+        data = self._read_json(path) or {"booking_id": booking_id, "stages": {}}
+        data["stages"][stage] = payload
+        data["updated_at"] = datetime.now().isoformat()
+        self._write_json(path, data)
+
+    def last_stage(self, run_id: str, booking_id: str) -> str | None:
+        """매장이 마지막으로 완료한 단계 이름을 반환합니다."""
+        data = self._read_json(self._store_path(run_id, booking_id))
+        if not data:
+            return None
+        completed = data.get("stages", {})
+        for stage in reversed(STAGES):
+            if stage in completed:
+                return stage
+        return None
+
+    def _manifest_path(self, run_id: str) -> Path:
+        return self.root / run_id / "manifest.json"
+
+    def _store_path(self, run_id: str, booking_id: str) -> Path:
+        return self.root / run_id / "stores" / f"{booking_id}.json"
+
+    @staticmethod
+    def _read_json(path: Path) -> dict[str, Any] | None:
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _write_json(path: Path, data: dict[str, Any]) -> None:
+        # 중간에 프로세스가 죽어도 파일이 깨지지 않도록 임시 파일 후 교체
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
@@ -3,15 +3,24 @@
 from __future__ import annotations
 
 import json
-import re
+import logging
 from dataclasses import dataclass
 from pathlib import Path
-from time import sleep
 
 import httpx
 
 from app.core.errors import LoginError
-from app.infra.browser import BrowserClient
+from app.utils.secret_store import CSRF_COOKIE_NAME, get_secret_store
+from app.infra.browser import (
+    BrowserClient,
+    BrowserPool,
+    find_cookie,
+    goto_and_wait_for_response,
+    wait_for_cookie,
+    wait_for_url,
+)
+
+logger = logging.getLogger(__name__)
 
 NAVER_LOGIN_URL = "https://nid.naver.com/nidlogin.login?mode=form&url=https://new.smartplace.naver.com/"
 NAVER_PROFILE_URL = "https://nid.naver.com/user2/help/myInfoV2?lang=ko_KR"
@@ -21,6 +30,43 @@ USER_AGENT = (
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 )
 
+# 네이버 로그인 세션 쿠키 (로그인 성공 시 nid.naver.com 응답이 설정)
+SESSION_COOKIE_NAMES = ("NID_AUT", "NID_SES")
+
+# 대기 시간 상한 (ms). 조건이 먼저 만족되면 즉시 다음 단계로 진행
+PROFILE_REDIRECT_GRACE_MS = 1000  # 쿠키 만료 시 로그인 페이지로의 스크립트 이동
+LOGIN_REDIRECT_TIMEOUT_MS = 10000  # 로그인 버튼 클릭 후 로그인 폼을 벗어날 때까지
+SESSION_COOKIE_TIMEOUT_MS = 3000  # 리다이렉트 후 세션 쿠키가 저장될 때까지
+SMARTPLACE_READY_TIMEOUT_MS = 15000  # 스마트플레이스 앱의 첫 API 응답까지
+WARMUP_COOKIE_TIMEOUT_MS = 1000  # 워밍업 요청 후 CSRF 쿠키가 저장될 때까지
+CSRF_CAPTURE_TIMEOUT_MS = 2000  # 앱 준비 후 CSRF 토큰이 요청/쿠키에 나타날 때까지
+
+
+def _is_login_url(url: str) -> bool:
+    return "login" in url
+
+
+def _is_session_cookie(cookie: dict) -> bool:
+    return cookie.get("name") in SESSION_COOKIE_NAMES and bool(cookie.get("value"))
+
+
+def _is_csrf_cookie(cookie: dict) -> bool:
+    name = cookie.get("name", "")
+    return bool(name) and "csrf" in name.lower() and bool(cookie.get("value"))
+
+
+def _is_fresh_csrf_cookie(cookie: dict) -> bool:
+    # 이전 로그인에서 직접 저장한 쿠키는 오래된 토큰일 수 있어 제외
+    return _is_csrf_cookie(cookie) and cookie.get("name") != CSRF_COOKIE_NAME
+
+
+def _is_smartplace_api_response(response) -> bool:
+    """스마트플레이스 앱이 세션으로 호출하는 API 응답인지 (앱 초기화 완료 신호)"""
+    url = response.url
+    return url.startswith(SMARTPLACE_HOME_URL) and (
+        "/graphql" in url or "/api/" in url
+    )
+
 
 @dataclass
 class LoginResult:
@@ -30,18 +76,62 @@ class LoginResult:
     csrf_token: str | None = None
 
 
+class CsrfTokenCapture:
+    """스마트플레이스 앱이 보내는 요청 헤더나 새로 설정된 쿠키에서 CSRF 토큰을 가로챕니다.
+
+    페이지 이동 전에 만들어야 앱의 첫 요청부터 확인할 수 있습니다.
+    """
+
+    def __init__(self, page) -> None:
+        self.token: str | None = None
+        self._page = page
+        page.on("request", self._on_request)
+
+    def _on_request(self, request) -> None:
+        if self.token or not request.url.startswith(SMARTPLACE_HOME_URL):
+            return
+        for name, value in request.headers.items():
+            if "csrf" in name.lower() or "xsrf" in name.lower():
+                value = (value or "").strip()
+                if value:
+                    self.token = value
+                    return
+
+    def wait(self, page, timeout_ms: float, poll_ms: float = 50) -> str | None:
+        """토큰이 잡히면 즉시 반환합니다. 시간 안에 못 찾으면 None."""
+        remaining = timeout_ms
+        try:
+            while True:
+                if self.token:
+                    return self.token
+                cookie = find_cookie(page.context, _is_fresh_csrf_cookie)
+                if cookie is not None:
+                    return cookie["value"]
+                if remaining <= 0:
+                    return None
+                # 기다리는 동안에도 요청 이벤트가 처리됨
+                page.wait_for_timeout(min(poll_ms, remaining))
+                remaining -= poll_ms
+        finally:
+            self._page.remove_listener("request", self._on_request)
+
+
 class NaverLoginService:
     def __init__(
         self,
         storage_path: Path | str = ".auth/cookies.json",
         headless: bool = False,
         browser_type: str | None = None,
+        pool: BrowserPool | None = None,
     ) -> None:
         self.storage_path = Path(storage_path)
         self.headless = headless
         self.browser_type = browser_type
-        self._csrf_token_path = self.storage_path.parent / "csrf_token.txt"
+        # 풀이 있으면 띄워 둔 브라우저에서 로그인 (브라우저 시작 비용 절약)
+        self.pool = pool
         self._csrf_token: str | None = None
+        # 쿠키/CSRF 토큰은 복호화된 내용을 메모리에 캐시해 실행마다 다시 읽지 않음
+        self._secrets = get_secret_store()
 
     def get_authenticated_client(self) -> httpx.Client:
         """Create and return an authenticated httpx client using stored session data."""
@@ -50,12 +140,9 @@ class NaverLoginService:
                 "쿠키 파일이 없습니다. 먼저 로그인을 성공적으로 수행해야 합니다."
             )
 
-        try:
-            with self.storage_path.open("r", encoding="utf-8") as f:
-                cookie_data = json.load(f)
-            cookies = cookie_data.get("cookies", [])
-        except (OSError, json.JSONDecodeError) as e:
-            raise LoginError(f"쿠키 파일을 읽거나 파싱하는 데 실패했습니다: {e}") from e
+        if self._secrets.storage_state(self.storage_path) is None:
+            raise LoginError("쿠키 파일을 읽거나 파싱하는 데 실패했습니다.")
+        cookies = self._secrets.cookies(self.storage_path)
 
         client = httpx.Client()
         for cookie in cookies:
@@ -69,25 +156,57 @@ class NaverLoginService:
     def login(
         self, user_id: str, password: str, force_credential_login: bool = False
     ) -> LoginResult:
+        if self.pool is not None:
+            return self.pool.run(
+                lambda client: self._login_with(
+                    client, user_id, password, force_credential_login
+                )
+            )
+
         client = BrowserClient()
         client.initialize(
             headless=self.headless, slow_mo_ms=100, browser_type=self.browser_type
         )
+        try:
+            return self._login_with(client, user_id, password, force_credential_login)
+        finally:
+            client.close()
+
+    def _login_with(
+        self,
+        client: BrowserClient,
+        user_id: str,
+        password: str,
+        force_credential_login: bool,
+    ) -> LoginResult:
+        """주어진 브라우저에서 쿠키 로그인 또는 아이디/비밀번호 로그인을 수행합니다."""
         try:
             # 1) Try cookie-based session first if available and not forcing credential login
-            if not force_credential_login and self.storage_path.exists():
-                context = client.new_context(self.storage_path)
+            storage_state = (
+                None
+                if force_credential_login
+                else self._secrets.storage_state(self.storage_path)
+            )
+            if storage_state is not None:
+                # 쿠키 확인에는 이미지/폰트/미디어가 필요 없음
+                context = client.new_context(storage_state, block_resources=True)
                 page = context.new_page()
 
-                # Navigate to profile page to validate cookies (same as original)
-                page.goto(NAVER_PROFILE_URL, wait_until="load")
-                sleep(3.0)  # Wait for potential redirection like original
+                # 만료된 세션 쿠키는 불러올 때 제외되므로 페이지를 열지 않고도 판단 가능
+                session_valid = find_cookie(context, _is_session_cookie) is not None
+                if session_valid:
+                    # Navigate to profile page to validate cookies (same as original)
+                    page.goto(NAVER_PROFILE_URL, wait_until="domcontentloaded")
+                    # 서버 리다이렉트는 이미 반영됨. 스크립트 이동만 잠시 기다림
+                    session_valid = not wait_for_url(
+                        page, _is_login_url, PROFILE_REDIRECT_GRACE_MS
+                    )
 
                 # Check if redirected to login page - if not, cookies are valid
-                if "login" not in page.url:
+                if session_valid:
                     # Cookies are valid, ensure SmartPlace session and persist state
                     self._ensure_smartplace_session(page)
-                    client.save_storage_state(context, self.storage_path)
+                    self._save_session(context)
                     context.close()
                     return LoginResult(
                         True, True, "저장된 쿠키로 로그인되었습니다.", self._csrf_token
@@ -97,6 +216,7 @@ class NaverLoginService:
                 context.close()
 
             # 2) Perform credential login exactly like original
+            # (보안문자 이미지가 보여야 하므로 리소스 차단 없이 로그인)
             context = client.new_context()
             page = context.new_page()
 
@@ -117,299 +237,318 @@ class NaverLoginService:
 
             # Click login button using exact selector from original
             page.click("#log\\.login")
-            sleep(1.0)
-
-            # Wait for redirect to naver.com like original
-            try:
-                page.wait_for_url(re.compile(r".*naver\.com.*"), timeout=10000)
-                sleep(1.0)  # Additional wait for stability
-
-                # Ensure SmartPlace session is established
-                self._ensure_smartplace_session(page)
 
-                # Save cookies to storage
-                client.save_storage_state(context, self.storage_path)
-                context.close()
-                return LoginResult(
-                    True, False, "아이디/비밀번호로 로그인 성공", self._csrf_token
-                )
-
-            except Exception:
-                current_url = page.url
+            # 로그인 폼을 벗어나고 세션 쿠키가 저장되면 바로 진행
+            # (보안문자/2단계 인증 등으로 폼에 머무르면 시간 초과)
+            redirected = wait_for_url(
+                page, lambda url: not _is_login_url(url), LOGIN_REDIRECT_TIMEOUT_MS
+            )
+            if not redirected or not wait_for_cookie(
+                page, _is_session_cookie, SESSION_COOKIE_TIMEOUT_MS
+            ):
                 raise LoginError(
-                    f"로그인 실패: 예상 도메인으로 리다이렉트되지 않음 (현재 URL: {current_url})"
+                    f"로그인 실패: 예상 도메인으로 리다이렉트되지 않음 (현재 URL: {page.url})"
                 )
 
+            # Ensure SmartPlace session is established
+            self._ensure_smartplace_session(page)
+
+            # Save cookies to storage
+            self._save_session(context)
+            context.close()
+            return LoginResult(
+                True, False, "아이디/비밀번호로 로그인 성공", self._csrf_token
+            )
+
         except LoginError as e:
             return LoginResult(False, False, str(e))
         except Exception as e:  # noqa: BLE001 - surface to UI
             return LoginResult(False, False, f"알 수 없는 오류: {e}")
-        finally:
-            client.close()
+
+    def _save_session(self, context) -> None:
+        """컨텍스트의 쿠키/스토리지를 (가능하면 암호화해) 저장합니다."""
+        self._secrets.write_json(self.storage_path, context.storage_state())
 
     def _ensure_smartplace_session(self, page) -> None:
         """Ensure SmartPlace domain cookies (e.g., csrf_token) are populated."""
-        page.goto(SMARTPLACE_HOME_URL, wait_until="domcontentloaded")
-        page.wait_for_load_state("networkidle")
-        sleep(2.0)  # Wait for session to be established
+        capture = CsrfTokenCapture(page)
+
+        # 앱이 세션으로 첫 API를 호출하면 세션이 준비된 것으로 판단
+        ready = goto_and_wait_for_response(
+            page,
+            SMARTPLACE_HOME_URL,
+            _is_smartplace_api_response,
+            SMARTPLACE_READY_TIMEOUT_MS,
+        )
+        if ready is None:
+            logger.debug("SmartPlace API response not observed before timeout")
+            page.wait_for_load_state("domcontentloaded")
 
         # Extract CSRF token from page
         try:
-            csrf_token = None
-
-            try:
-                state_summary = page.evaluate(
-                    """
-                    () => {
-                        const state = window.__SMARTPLACE_INIT_STATE__ || window.__APOLLO_STATE__ || null;
-                        if (!state) return null;
-                        const json = JSON.stringify(state);
-                        return json.slice(0, 2000);
-                    }
-                    """
-                )
-                if state_summary:
-                    print("[DEBUG] SMARTPLACE state snapshot available")
-            except Exception as snapshot_exc:
-                print(
-                    f"[DEBUG] Failed to capture SmartPlace state snapshot: {snapshot_exc}"
+            csrf_token = capture.wait(page, CSRF_CAPTURE_TIMEOUT_MS)
+            if csrf_token:
+                logger.debug("CSRF token captured from network")
+            else:
+                # 네트워크에서 찾지 못한 경우에만 DOM 검색
+                csrf_token = self._scan_page_for_csrf(page)
+
+            if csrf_token:
+                csrf_token = (csrf_token or "").strip()
+
+            if csrf_token:
+                # Store the token for later use (could be stored in a class variable)
+                self._csrf_token = csrf_token
+                # Add the token to the browser context so it's saved with other cookies
+                page.context.add_cookies(
+                    [
+                        {
+                            "name": CSRF_COOKIE_NAME,
+                            "value": csrf_token,
+                            "domain": ".naver.com",
+                            "path": "/",
+                        }
+                    ]
                 )
+                logger.debug("CSRF token injected into browser context for persistence")
+            else:
+                logger.warning("CSRF token not found on SmartPlace page")
+                self._csrf_token = None
 
-            # Method 1: Check for meta tag
-            csrf_meta = page.query_selector('meta[name="csrf-token"]')
-            if csrf_meta:
-                csrf_token = (csrf_meta.get_attribute("content") or "").strip()
-                if csrf_token:
-                    print("[DEBUG] CSRF token from meta tag")
-
-            if not csrf_token:
-                csrf_token = page.evaluate(
-                    """
-                    () => {
-                        const sources = [window.__SMARTPLACE_INIT_STATE__, window.__APOLLO_STATE__, window.__NUXT__];
-                        const visited = new WeakSet();
-                        const normalize = (value, depth = 0) => {
-                            if (!value || depth > 8) return null;
-                            if (typeof value === "string") {
-                                const trimmed = value.trim();
-                                if (!trimmed) return null;
-                                if (trimmed.length > 8 && trimmed.toLowerCase().includes("csrf")) return trimmed;
-                                return null;
-                            }
-                            if (typeof value === "number" || typeof value === "boolean") {
-                                return String(value);
-                            }
-                            if (typeof value === "object") {
-                                if (visited.has(value)) return null;
-                                visited.add(value);
-                                if (typeof value.csrfToken === "string") return value.csrfToken;
-                                if (typeof value.token === "string" && value.token.toLowerCase().includes("csrf")) return value.token;
-                                for (const [key, nested] of Object.entries(value)) {
-                                    if (!key) continue;
-                                    if (key.toLowerCase().includes("csrf")) {
-                                        const extracted = normalize(nested, depth + 1);
-                                        if (extracted) return extracted;
-                                    }
+        except Exception as e:
+            logger.debug("Error extracting CSRF token: %s", e)
+            self._csrf_token = None
+        finally:
+            if not self._csrf_token:
+                self._warm_up_smartplace_csrf(page)
+
+    def _scan_page_for_csrf(self, page) -> str | None:
+        """페이지 DOM/스토리지/쿠키를 차례로 검색해 CSRF 토큰을 찾습니다. (대체 경로)"""
+        csrf_token = None
+
+        try:
+            state_summary = page.evaluate(
+                """
+                () => {
+                    const state = window.__SMARTPLACE_INIT_STATE__ || window.__APOLLO_STATE__ || null;
+                    if (!state) return null;
+                    const json = JSON.stringify(state);
+                    return json.slice(0, 2000);
+                }
+                """
+            )
+            if state_summary:
+                logger.debug("SMARTPLACE state snapshot available")
+        except Exception as snapshot_exc:
+            logger.debug(
+                "Failed to capture SmartPlace state snapshot: %s", snapshot_exc
+            )
+
+        # Method 1: Check for meta tag
+        csrf_meta = page.query_selector('meta[name="csrf-token"]')
+        if csrf_meta:
+            csrf_token = (csrf_meta.get_attribute("content") or "").strip()
+            if csrf_token:
+                logger.debug("CSRF token from meta tag")
+
+        if not csrf_token:
+            csrf_token = page.evaluate(
+                """
+                () => {
+                    const sources = [window.__SMARTPLACE_INIT_STATE__, window.__APOLLO_STATE__, window.__NUXT__];
+                    const visited = new WeakSet();
+                    const normalize = (value, depth = 0) => {
+                        if (!value || depth > 8) return null;
+                        if (typeof value === "string") {
+                            const trimmed = value.trim();
+                            if (!trimmed) return null;
+                            if (trimmed.length > 8 && trimmed.toLowerCase().includes("csrf")) return trimmed;
+                            return null;
+                        }
+                        if (typeof value === "number" || typeof value === "boolean") {
+                            return String(value);
+                        }
+                        if (typeof value === "object") {
+                            if (visited.has(value)) return null;
+                            visited.add(value);
+                            if (typeof value.csrfToken === "string") return value.csrfToken;
+                            if (typeof value.token === "string" && value.token.toLowerCase().includes("csrf")) return value.token;
+                            for (const [key, nested] of Object.entries(value)) {
+                                if (!key) continue;
+                                if (key.toLowerCase().includes("csrf")) {
                                     const extracted = normalize(nested, depth + 1);
                                     if (extracted) return extracted;
                                 }
+                                const extracted = normalize(nested, depth + 1);
+                                if (extracted) return extracted;
                             }
-                            return null;
-                        };
-
-                        for (const source of sources) {
-                            const extracted = normalize(source);
-                            if (extracted) return extracted;
                         }
                         return null;
-                    }
-                    """
-                )
-                if csrf_token:
-                    print("[DEBUG] CSRF token from bootstrapped state")
-
-            # Method 2: Check for JavaScript variables
-            if not csrf_token:
-                csrf_token = page.evaluate("""() => {
-                    // Look for common CSRF token patterns in window object
-                    if (window.csrfToken) return window.csrfToken;
-                    if (window._csrf) return window._csrf;
-                    if (window.__CSRF_TOKEN__) return window.__CSRF_TOKEN__;
-
-                    // Look in script tags
-                    const scripts = document.querySelectorAll('script');
-                    for (const script of scripts) {
-                        const text = script.textContent;
-                        if (!text) continue;
-
-                        // Common patterns for CSRF token
-                        const patterns = [
-                            /csrfToken["']?\s*:\s*["']([^"']+)["']/,
-                            /_token["']?\s*:\s*["']([^"']+)["']/,
-                            /csrf["']?\s*:\s*["']([^"']+)["']/,
-                        ];
-
-                        for (const pattern of patterns) {
-                            const match = text.match(pattern);
-                            if (match) return match[1];
-                        }
+                    };
+
+                    for (const source of sources) {
+                        const extracted = normalize(source);
+                        if (extracted) return extracted;
                     }
                     return null;
-                }""")
-                if csrf_token:
-                    print("[DEBUG] CSRF token from script inspection")
-
-            # Method 3: Inspect browser storage and known globals
-            if not csrf_token:
-                csrf_token = page.evaluate(
-                    """
-                    () => {
-                        const visited = new WeakSet();
-                        const normalize = (value, depth = 0) => {
-                            if (!value || depth > 6) return null;
-                            if (typeof value === "string") {
-                                const trimmed = value.trim();
-                                if (!trimmed || trimmed === "null" || trimmed === "undefined") {
-                                    return null;
-                                }
-                                return trimmed;
+                }
+                """
+            )
+            if csrf_token:
+                logger.debug("CSRF token from bootstrapped state")
+
+        # Method 2: Check for JavaScript variables
+        if not csrf_token:
+            csrf_token = page.evaluate("""() => {
+                // Look for common CSRF token patterns in window object
+                if (window.csrfToken) return window.csrfToken;
+                if (window._csrf) return window._csrf;
+                if (window.__CSRF_TOKEN__) return window.__CSRF_TOKEN__;
+
+                // Look in script tags
+                const scripts = document.querySelectorAll('script');
+                for (const script of scripts) {
+                    const text = script.textContent;
+                    if (!text) continue;
+
+                    // Common patterns for CSRF token
+                    const patterns = [
+                        /csrfToken["']?\s*:\s*["']([^"']+)["']/,
+                        /_token["']?\s*:\s*["']([^"']+)["']/,
+                        /csrf["']?\s*:\s*["']([^"']+)["']/,
+                    ];
+
+                    for (const pattern of patterns) {
+                        const match = text.match(pattern);
+                        if (match) return match[1];
+                    }
+                }
+                return null;
+            }""")
+            if csrf_token:
+                logger.debug("CSRF token from script inspection")
+
+        # Method 3: Inspect browser storage and known globals
+        if not csrf_token:
+            csrf_token = page.evaluate(
+                """
+                () => {
+                    const visited = new WeakSet();
+                    const normalize = (value, depth = 0) => {
+                        if (!value || depth > 6) return null;
+                        if (typeof value === "string") {
+                            const trimmed = value.trim();
+                            if (!trimmed || trimmed === "null" || trimmed === "undefined") {
+                                return null;
                             }
-                            if (typeof value === "number" || typeof value === "boolean") {
-                                return String(value);
+                            return trimmed;
+                        }
+                        if (typeof value === "number" || typeof value === "boolean") {
+                            return String(value);
+                        }
+                        if (typeof value === "object") {
+                            if (visited.has(value)) return null;
+                            visited.add(value);
+                            if (typeof value.csrfToken === "string") {
+                                const extracted = normalize(value.csrfToken, depth + 1);
+                                if (extracted) return extracted;
                             }
-                            if (typeof value === "object") {
-                                if (visited.has(value)) return null;
-                                visited.add(value);
-                                if (typeof value.csrfToken === "string") {
-                                    const extracted = normalize(value.csrfToken, depth + 1);
-                                    if (extracted) return extracted;
-                                }
-                                if (typeof value.token === "string") {
-                                    const extracted = normalize(value.token, depth + 1);
-                                    if (extracted) return extracted;
-                                }
-                                for (const [key, nested] of Object.entries(value)) {
-                                    if (key && key.toLowerCase().includes("csrf")) {
-                                        const extracted = normalize(nested, depth + 1);
-                                        if (extracted) return extracted;
-                                    }
-                                }
+                            if (typeof value.token === "string") {
+                                const extracted = normalize(value.token, depth + 1);
+                                if (extracted) return extracted;
                             }
-                            return null;
-                        };
-
-                        const storages = [window.localStorage, window.sessionStorage];
-                        for (const storage of storages) {
-                            if (!storage) continue;
-                            for (let i = 0; i < storage.length; i += 1) {
-                                const key = storage.key(i);
-                                try {
-                                    const raw = storage.getItem(key);
-                                    if (!raw) continue;
-                                    let extracted = normalize(raw);
+                            for (const [key, nested] of Object.entries(value)) {
+                                if (key && key.toLowerCase().includes("csrf")) {
+                                    const extracted = normalize(nested, depth + 1);
                                     if (extracted) return extracted;
-                                    try {
-                                        const parsed = JSON.parse(raw);
-                                        extracted = normalize(parsed);
-                                        if (extracted) return extracted;
-                                    } catch {
-                                        // ignore JSON parse error
-                                    }
-                                } catch {
-                                    continue;
                                 }
                             }
                         }
+                        return null;
+                    };
 
-                        const globals = [
-                            window.__APOLLO_STATE__,
-                            window.__SMARTPLACE_INIT_STATE__,
-                            window.__SMARTPLACE_STORE__,
-                            window.__NUXT__,
-                        ];
-                        for (const state of globals) {
-                            const extracted = normalize(state);
-                            if (extracted) return extracted;
-                        }
-
-                        if (typeof window.getCsrfToken === "function") {
+                    const storages = [window.localStorage, window.sessionStorage];
+                    for (const storage of storages) {
+                        if (!storage) continue;
+                        for (let i = 0; i < storage.length; i += 1) {
+                            const key = storage.key(i);
                             try {
-                                const maybe = window.getCsrfToken();
-                                const extracted = normalize(maybe);
+                                const raw = storage.getItem(key);
+                                if (!raw) continue;
+                                let extracted = normalize(raw);
                                 if (extracted) return extracted;
+                                try {
+                                    const parsed = JSON.parse(raw);
+                                    extracted = normalize(parsed);
+                                    if (extracted) return extracted;
+                                } catch {
+                                    // ignore JSON parse error
+                                }
                             } catch {
-                                // ignore errors from custom getters
+                                continue;
                             }
                         }
+                    }
 
-                        return null;
+                    const globals = [
+                        window.__APOLLO_STATE__,
+                        window.__SMARTPLACE_INIT_STATE__,
+                        window.__SMARTPLACE_STORE__,
+                        window.__NUXT__,
+                    ];
+                    for (const state of globals) {
+                        const extracted = normalize(state);
+                        if (extracted) return extracted;
                     }
-                    """
-                )
 
-            # Method 4: Check non-httpOnly cookies via document.cookie
-            if not csrf_token:
-                csrf_token = page.evaluate(
-                    """
-                    () => {
-                        const parts = document.cookie.split(";");
-                        for (const part of parts) {
-                            const trimmed = part.trim();
-                            if (!trimmed) continue;
-                            if (!trimmed.toLowerCase().includes("csrf")) continue;
-                            const index = trimmed.indexOf("=");
-                            if (index === -1) continue;
-                            const value = trimmed.slice(index + 1).trim();
-                            if (value && value !== "null" && value !== "undefined") {
-                                return value;
-                            }
+                    if (typeof window.getCsrfToken === "function") {
+                        try {
+                            const maybe = window.getCsrfToken();
+                            const extracted = normalize(maybe);
+                            if (extracted) return extracted;
+                        } catch {
+                            // ignore errors from custom getters
                         }
-                        return null;
                     }
-                    """
-                )
-
-            # Method 5: Check cookies for csrf token
-            if not csrf_token:
-                cookies = page.context.cookies()
-                for cookie in cookies:
-                    name = cookie.get("name", "")
-                    value = cookie.get("value")
-                    if name and "csrf" in name.lower() and value:
-                        csrf_token = value
-                        break
 
-            if csrf_token:
-                csrf_token = (csrf_token or "").strip()
+                    return null;
+                }
+                """
+            )
 
-            if csrf_token:
-                print(f"[DEBUG] CSRF token found: {csrf_token[:10]}...")
-                # Store the token for later use (could be stored in a class variable)
-                self._csrf_token = csrf_token
-                # Add the token to the browser context so it's saved with other cookies
-                page.context.add_cookies(
-                    [
-                        {
-                            "name": "csrf_token",
-                            "value": csrf_token,
-                            "domain": ".naver.com",
-                            "path": "/",
+        # Method 4: Check non-httpOnly cookies via document.cookie
+        if not csrf_token:
+            csrf_token = page.evaluate(
+                """
+                () => {
+                    const parts = document.cookie.split(";");
+                    for (const part of parts) {
+                        const trimmed = part.trim();
+                        if (!trimmed) continue;
+                        if (!trimmed.toLowerCase().includes("csrf")) continue;
+                        const index = trimmed.indexOf("=");
+                        if (index === -1) continue;
+                        const value = trimmed.slice(index + 1).trim();
+                        if (value && value !== "null" && value !== "undefined") {
+                            return value;
                         }
-                    ]
-                )
-                print(
-                    "[DEBUG] CSRF token injected into browser context for persistence."
-                )
-            else:
-                print("[WARNING] CSRF token not found on SmartPlace page")
-                self._csrf_token = None
+                    }
+                    return null;
+                }
+                """
+            )
 
-        except Exception as e:
-            print(f"[DEBUG] Error extracting CSRF token: {e}")
-            self._csrf_token = None
-        finally:
-            if not self._csrf_token:
-                self._warm_up_smartplace_csrf(page)
+        # Method 5: Check cookies for csrf token
+        if not csrf_token:
+            cookies = page.context.cookies()
+            for cookie in cookies:
+                name = cookie.get("name", "")
+                value = cookie.get("value")
+                if name and "csrf" in name.lower() and value:
+                    csrf_token = value
+                    break
+
+        return csrf_token
 
     def _warm_up_smartplace_csrf(self, page) -> None:
         """Attempt to trigger SmartPlace to issue a CSRF token via background fetch."""
@@ -437,9 +576,11 @@ class NaverLoginService:
             )
             if isinstance(warmup_result, dict):
                 text = warmup_result.get("text") or ""
-                snippet = text[:200]
-                print(
-                    f"[DEBUG] Warm-up request status: {warmup_result.get('ok')} body snippet: {snippet}"
+                # 응답 본문에 토큰이 있을 수 있으므로 길이만 기록
+                logger.debug(
+                    "Warm-up request status: %s (%d chars)",
+                    warmup_result.get("ok"),
+                    len(text),
                 )
                 if text:
                     try:
@@ -459,20 +600,15 @@ class NaverLoginService:
                             token_from_body = token_from_body.strip()
                             if token_from_body and "csrf" in token_from_body.lower():
                                 self._csrf_token = token_from_body
-                                print("[DEBUG] CSRF token extracted from warm-up body")
+                                logger.debug("CSRF token extracted from warm-up body")
                     except Exception as parse_exc:  # noqa: BLE001 - diagnostic only
-                        print(f"[DEBUG] Warm-up response parse failed: {parse_exc}")
-            sleep(1.0)
-            cookies = page.context.cookies()
-            for cookie in cookies:
-                name = cookie.get("name", "")
-                value = cookie.get("value", "")
-                if name and "csrf" in name.lower() and value:
-                    self._csrf_token = value
-                    print("[DEBUG] CSRF token obtained from warm-up request")
-                    break
+                        logger.debug("Warm-up response parse failed: %s", parse_exc)
+            cookie = wait_for_cookie(page, _is_csrf_cookie, WARMUP_COOKIE_TIMEOUT_MS)
+            if cookie is not None:
+                self._csrf_token = cookie["value"]
+                logger.debug("CSRF token obtained from warm-up request")
         except Exception as exc:
-            print(f"[DEBUG] CSRF warm-up failed: {exc}")
+            logger.debug("CSRF warm-up failed: %s", exc)
         finally:
             if not self._csrf_token:
-                print("[WARNING] CSRF token still missing after warm-up attempt")
+                logger.warning("CSRF token still missing after warm-up attempt")
@@ -0,0 +1,148 @@
+"""Generate replies for a checkpointed run through the OpenAI Batch API.
+
+Reviews that are not urgent can be answered overnight at the Batch API's
+lower price. ``submit_run`` reads the crawled reviews of an interrupted run
+from its checkpoints and submits them as one batch job. ``collect_run`` later
+waits for the job and saves the replies as the run's ``generated`` stage, so
+resuming the run in the app goes straight to submission.
+
+The submitted batch ID and store list are kept in
+``runs/batches/<run_id>.json`` between the two steps.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable
+
+from app.services.checkpoint import STAGE_CRAWLED, STAGE_GENERATED, RunCheckpointStore
+from app.services.reply_generator import DEFAULT_BATCH_DIR, ReplyGenerator
+
+LogCallback = Callable[[str, str], None]
+
+
+def submit_run(
+    run_id: str,
+    generator: ReplyGenerator,
+    checkpoints: RunCheckpointStore,
+    batch_dir: Path = DEFAULT_BATCH_DIR,
+    log: LogCallback | None = None,
+) -> str | None:
+    """답변이 아직 없는 매장의 수집된 리뷰를 하나의 Batch 작업으로 제출합니다.
+
+    제출한 batch ID를 반환합니다. 제출할 리뷰가 없으면 None을 반환합니다.
+    """
+
+    def emit(level: str, message: str) -> None:
+        if log:
+            log(level, message)
+
+    stores = _pending_stores(run_id, checkpoints)
+    if not stores:
+        emit("WARNING", f"실행 '{run_id}'에 답변을 생성할 매장이 없습니다.")
+        return None
+
+    reviews = [review for store_reviews in stores.values() for review in store_reviews]
+    batch_id = generator.submit_offline_batch(reviews, batch_dir=batch_dir, log=log)
+    _write_state(
+        _state_path(batch_dir, run_id),
+        {"run_id": run_id, "batch_id": batch_id, "booking_ids": list(stores)},
+    )
+    return batch_id
+
+
+def collect_run(
+    run_id: str,
+    generator: ReplyGenerator,
+    checkpoints: RunCheckpointStore,
+    batch_dir: Path = DEFAULT_BATCH_DIR,
+    poll_interval: float = 30.0,
+    timeout: float | None = None,
+    log: LogCallback | None = None,
+) -> dict[str, int]:
+    """제출한 Batch 작업을 기다려 매장별 답변을 ``generated`` 단계로 저장합니다.
+
+    답변은 매장별로 온라인 생성과 같은 품질 검증을 거친 뒤 저장됩니다.
+    매장 ID → 생성에 성공한 답변 수를 반환합니다. 실패한 리뷰는 온라인 생성과
+    마찬가지로 ``error``가 채워진 채 저장됩니다.
+    """
+
+    def emit(level: str, message: str) -> None:
+        if log:
+            log(level, message)
+
+    state_path = _state_path(batch_dir, run_id)
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        raise FileNotFoundError(f"실행 '{run_id}'의 Batch 제출 기록이 없습니다.") from e
+
+    stores: dict[str, list[dict[str, Any]]] = {}
+    for booking_id in state["booking_ids"]:
+        crawled = checkpoints.load_stage(run_id, booking_id, STAGE_CRAWLED)
+        stores[booking_id] = crawled["reviews"] if crawled else []
+
+    reviews = [review for store_reviews in stores.values() for review in store_reviews]
+    pairs = generator.collect_offline_batch(
+        state["batch_id"],
+        reviews,
+        poll_interval=poll_interval,
+        timeout=timeout,
+        log=log,
+    )
+
+    # 리뷰 순서대로 매장별로 다시 나눔
+    succeeded: dict[str, int] = {}
+    offset = 0
+    for booking_id, store_reviews in stores.items():
+        store_pairs = pairs[offset : offset + len(store_reviews)]
+        offset += len(store_reviews)
+        generator.validate_replies(store_pairs, store_reviews, log=log)
+        checkpoints.save_stage(
+            run_id,
+            booking_id,
+            STAGE_GENERATED,
+            {"replies": [asdict(pair) for pair in store_pairs]},
+        )
+        succeeded[booking_id] = len([p for p in store_pairs if p.error is None])
+        emit(
+            "INFO",
+            f"매장 '{booking_id}' 답변 {succeeded[booking_id]}/{len(store_pairs)}개 저장",
+        )
+
+    state_path.unlink(missing_ok=True)
+    return succeeded
+
+
+def _pending_stores(
+    run_id: str, checkpoints: RunCheckpointStore
+) -> dict[str, list[dict[str, Any]]]:
+    """수집은 끝났지만 답변이 없는 매장 ID → 리뷰 목록"""
+    stores_dir = checkpoints.root / run_id / "stores"
+    if not stores_dir.exists():
+        return {}
+
+    stores: dict[str, list[dict[str, Any]]] = {}
+    for path in sorted(stores_dir.glob("*.json")):
+        booking_id = path.stem
+        if checkpoints.load_stage(run_id, booking_id, STAGE_GENERATED) is not None:
+            continue
+        crawled = checkpoints.load_stage(run_id, booking_id, STAGE_CRAWLED)
+        if crawled and crawled.get("reviews"):
+            stores[booking_id] = crawled["reviews"]
+    return stores
+
+
+def _state_path(batch_dir: Path, run_id: str) -> Path:
+    return Path(batch_dir) / f"{run_id}.json"
+
+
+def _write_state(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
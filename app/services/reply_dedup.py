@@ -0,0 +1,210 @@
+"""Persistent MinHash/LSH index of generated replies, one per ``place_id``.
+
+Flags a new reply that is nearly identical to a reply generated for the same
+place in an earlier run. Signatures use one-permutation MinHash (each shingle
+hash is hashed once and goes into one of ``bands * rows`` bins), so building a
+signature costs O(shingles). Candidates come from LSH band buckets, so a
+query does not scan the history. Each bucket keeps only its most recent
+replies, because one member of a near-duplicate cluster is enough to flag a
+new reply. This keeps a query well under a millisecond in pure Python, even
+with tens of thousands of stored replies.
+
+Replies are shingled after ``reply_body`` (the same normalization as
+``ReplyValidator``), so a copy that only changes the reviewer's name in the
+greeting is still caught.
+"""
+
+from __future__ import annotations
+
+import json
+import operator
+import os
+import re
+from collections import Counter
+from pathlib import Path
+
+from app.services.reply_validator import reply_body, shingle_hashes
+
+DEFAULT_DEDUP_DIR = Path("runs/dedup")
+
+_MASK32 = 0xFFFFFFFF
+_EMPTY = _MASK32 + 1
+# 홀수 곱셈 상수로 CRC 해시 비트를 섞음
+_MIX_A = 0x9E3779B1
+_MIX_B = 0x85EBCA77
+
+_SAFE_NAME = re.compile(r"[^0-9A-Za-z_-]")
+
+# 시그니처 계산 방식이 바뀌면 올려서 이전 색인을 버림 (2: reply_body로 정규화)
+SIGNATURE_VERSION = 2
+
+
+def minhash_signature(text: str, num_bins: int, shingle_size: int = 3) -> list[int]:
+    """One-permutation MinHash 시그니처를 계산합니다. (빈 구간은 회전 채움)
+
+    인사말과 작성자 호칭은 ``reply_body``로 정규화한 뒤 비교합니다.
+    """
+    bins = [_EMPTY] * num_bins
+    for shingle in shingle_hashes(reply_body(text), shingle_size):
+        mixed = ((shingle ^ (shingle >> 15)) * _MIX_A) & _MASK32
+        mixed = ((mixed ^ (mixed >> 13)) * _MIX_B) & _MASK32
+        index = mixed % num_bins
+        value = mixed // num_bins
+        if value < bins[index]:
+            bins[index] = value
+
+    if all(value == _EMPTY for value in bins):
+        return bins
+
+    # 짧은 답변은 빈 구간이 생기므로 오른쪽의 채워진 구간 값을 빌려 채움
+    signature = list(bins)
+    for i in range(num_bins):
+        if signature[i] != _EMPTY:
+            continue
+        offset = 1
+        while bins[(i + offset) % num_bins] == _EMPTY:
+            offset += 1
+        signature[i] = bins[(i + offset) % num_bins] + offset * _EMPTY
+    return signature
+
+
+class ReplyDedupIndex:
+    """장소(place_id) 하나의 과거 답변 MinHash/LSH 색인"""
+
+    def __init__(
+        self,
+        place_id: str,
+        root: Path | str = DEFAULT_DEDUP_DIR,
+        threshold: float = 0.7,
+        bands: int = 8,
+        rows: int = 4,
+        max_entries: int = 20000,
+        bucket_size: int = 16,
+    ) -> None:
+        self.place_id = str(place_id)
+        self.path = Path(root) / f"{_SAFE_NAME.sub('_', self.place_id)}.json"
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.max_entries = max_entries
+        self.bucket_size = bucket_size
+
+        # 삽입 순서를 유지해 오래된 답변부터 제거
+        self._signatures: dict[str, list[int]] = {}
+        self._buckets: list[dict[tuple[int, ...], list[str]]] = [
+            {} for _ in range(bands)
+        ]
+        self._dirty = False
+        self._load()
+
+    @property
+    def num_bins(self) -> int:
+        return self.bands * self.rows
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, text: str) -> list[int]:
+        return minhash_signature(text, self.num_bins)
+
+    def query(
+        self, text: str, exclude_key: str | None = None, limit: int = 3
+    ) -> list[tuple[str, float]]:
+        """유사도가 임계값 이상인 과거 답변의 (키, 추정 유사도)를 높은 순으로 반환합니다."""
+        return self.query_signature(self.signature(text), exclude_key, limit)
+
+    def query_signature(
+        self, signature: list[int], exclude_key: str | None = None, limit: int = 3
+    ) -> list[tuple[str, float]]:
+        band_hits: Counter[str] = Counter()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            band_hits.update(self._buckets[band].get(band_key, ()))
+        band_hits.pop(exclude_key, None)
+
+        # 겹치는 밴드가 많은 후보부터 검증하고 ``limit``개를 찾으면 중단
+        matches = []
+        for key, _ in band_hits.most_common():
+            agreeing = sum(map(operator.eq, signature, self._signatures[key]))
+            similarity = agreeing / self.num_bins
+            if similarity >= self.threshold:
+                matches.append((key, similarity))
+                if len(matches) >= limit:
+                    break
+        matches.sort(key=lambda item: item[1], reverse=True)
+        return matches
+
+    def add(self, key: str, text: str) -> None:
+        """답변을 색인에 추가합니다. 같은 키가 있으면 교체합니다."""
+        self.remove(key)
+        signature = self.signature(text)
+        self._signatures[key] = signature
+        self._index(key, signature)
+
+        while len(self._signatures) > self.max_entries:
+            self.remove(next(iter(self._signatures)))
+        self._dirty = True
+
+    def remove(self, key: str) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None and key in bucket:
+                bucket.remove(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+        self._dirty = True
+
+    def save(self) -> None:
+        """변경된 경우에만 색인을 디스크에 기록합니다."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "place_id": self.place_id,
+                    "version": SIGNATURE_VERSION,
+                    "bands": self.bands,
+                    "rows": self.rows,
+                    "signatures": self._signatures,
+                },
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def _index(self, key: str, signature: list[int]) -> None:
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].setdefault(band_key, [])
+            bucket.append(key)
+            if len(bucket) > self.bucket_size:
+                del bucket[0]
+
+    def _band_keys(self, signature: list[int]) -> list[tuple[int, ...]]:
+        return [
+            tuple(signature[band * self.rows : (band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    def _load(self) -> None:
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+
+        # 계산 방식이나 밴드 구성이 바뀌었으면 기존 시그니처와 호환되지 않으므로 버림
+        if (
+            data.get("version") != SIGNATURE_VERSION
+            or data.get("bands") != self.bands
+            or data.get("rows") != self.rows
+        ):
+            return
+
+        for key, signature in data.get("signatures", {}).items():
+            self._signatures[key] = signature
+            self._index(key, signature)
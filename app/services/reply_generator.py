@@ -2,16 +2,44 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from pathlib import Path
 from typing import Any, Callable
 
+from app.core.retry import RetryPolicy
 from app.domain.prompts import (
     DEFAULT_BUSINESS_TYPE,
+    DEFAULT_REPLY_LENGTH_LIMIT,
     DEFAULT_TONE,
-    build_reply_prompt,
+    build_batch_user_message,
+    build_reply_messages,
+    build_system_prompt,
     clean_reply_text,
+    parse_batch_reply_response,
+)
+from app.domain.reply_templates import is_trivial_review, render_template_reply
+from app.domain.token_budget import TokenBudget
+from app.infra.llm_openai import BatchJobResult
+from app.infra.llm_router import (
+    DEFAULT_MODEL,
+    DEFAULT_PROVIDER,
+    BackendSpec,
+    create_llm_client,
+    normalize_provider,
+)
+from app.services.reply_dedup import DEFAULT_DEDUP_DIR, ReplyDedupIndex
+from app.services.reply_history import DEFAULT_HISTORY_DIR, ReplyHistoryStore
+from app.services.reply_validator import ISSUE_NEAR_DUPLICATE, ReplyValidator
+from app.services.triage import (
+    PRIORITY_HIGH,
+    TriageResult,
+    prioritize_reviews,
+    triage_review,
 )
-from app.infra.llm_openai import LLMClient
 
 
 @dataclass
@@ -21,10 +49,42 @@ class ReplyConfig:
     tone: str = DEFAULT_TONE
     business_type: str = DEFAULT_BUSINESS_TYPE
     store_name: str | None = None
-    max_tokens: int = 300
+    # None이면 답변 글자수 제한(length_limit)에서 계산
+    max_tokens: int | None = None
+    length_limit: int = DEFAULT_REPLY_LENGTH_LIMIT
+    # 리뷰 본문 입력 토큰 상한 (초과 시 가운데 생략)
+    max_review_tokens: int = 800
     temperature: float = 0.7
     openai_api_key: str | None = None
     custom_prompt: str = ""
+    # 한 번의 요청에 묶어 보낼 리뷰 수 (1이면 리뷰마다 개별 요청)
+    batch_size: int = 1
+    # 텍스트 없음/짧은 칭찬 리뷰는 LLM 대신 템플릿으로 답변
+    enable_template_replies: bool = True
+    template_max_chars: int = 10
+    # 부정/긴급 리뷰를 먼저 처리하고, 지정 시 더 강한 모델로 답변
+    enable_triage: bool = True
+    priority_model: str | None = None
+    # 생성 후 품질 검증 (금지어/길이/유사 답변/프롬프트 반복), 실패 항목만 재생성
+    enable_validation: bool = True
+    banned_words: list[str] = field(default_factory=list)
+    max_regenerations: int = 2
+    # 같은 장소의 과거 답변과 거의 같은 답변도 재생성 (검증 단계에서 수행)
+    enable_history_dedup: bool = True
+    history_dedup_threshold: float = 0.7
+    dedup_dir: Path = DEFAULT_DEDUP_DIR
+    # 사장님의 과거 답변 중 비슷한 리뷰의 답변을 few-shot 예시로 사용 (0이면 사용 안 함)
+    history_examples: int = 3
+    history_dir: Path = DEFAULT_HISTORY_DIR
+    # LLM 공급자/모델 ("openai" 또는 OpenAI 호환 "local" 서버)
+    provider: str = DEFAULT_PROVIDER
+    model: str = DEFAULT_MODEL
+    # OpenAI 호환 엔드포인트 (비우면 공급자 기본값)
+    base_url: str | None = None
+    # 장애/지연 시 넘겨받을 대체 백엔드 ({"provider", "model", "base_url"})
+    fallback_backends: list[dict[str, Any]] = field(default_factory=list)
+    # 실행 단위 재시도 예산을 공유하는 정책 (None이면 기본 정책)
+    retry_policy: RetryPolicy | None = None
 
 
 @dataclass
@@ -37,9 +97,14 @@ class ReviewReplyPair:
     review_author: str | None = None
     generated_reply: str = ""
     error: str | None = None
+    priority: str | None = None
 
 
 LogCallback = Callable[[str, str], None]
+# (리뷰 ID, 지금까지 생성된 답변 텍스트)
+PartialCallback = Callable[[str, str], None]
+
+DEFAULT_BATCH_DIR = Path("runs/batches")
 
 
 class ReplyGenerator:
@@ -48,16 +113,59 @@ class ReplyGenerator:
     def __init__(self, config: ReplyConfig):
         self.config = config
         try:
-            self.llm_client = LLMClient(
-                model="gpt-4o-mini", api_key=config.openai_api_key
+            primary = BackendSpec(
+                provider=normalize_provider(config.provider),
+                model=config.model or DEFAULT_MODEL,
+                base_url=config.base_url,
+            )
+            fallbacks = [
+                BackendSpec.from_dict(backend) for backend in config.fallback_backends
+            ]
+            self.llm_client = create_llm_client(
+                primary,
+                fallbacks,
+                default_api_key=config.openai_api_key,
+                retry_policy=config.retry_policy,
             )
         except Exception as e:
-            raise RuntimeError(f"OpenAI 클라이언트 초기화 실패: {e}")
+            raise RuntimeError(f"LLM 클라이언트 초기화 실패: {e}")
+
+        self.token_budget = TokenBudget(
+            model=self.llm_client.model, max_review_tokens=config.max_review_tokens
+        )
+        self.validator = ReplyValidator(
+            banned_words=config.banned_words,
+            length_limit=config.length_limit,
+            prompt_text=build_system_prompt(
+                config.tone,
+                config.business_type,
+                config.store_name,
+                config.custom_prompt,
+            ),
+        )
+        # 재생성 스레드들이 함께 채우는 장소별 캐시
+        self._cache_lock = threading.Lock()
+        self._dedup_indexes: dict[str, ReplyDedupIndex] = {}
+        self._history_stores: dict[str, ReplyHistoryStore] = {}
 
     def generate(
-        self, review_text: str, review_author: str | None = None, log: LogCallback | None = None
+        self,
+        review_text: str,
+        review_author: str | None = None,
+        log: LogCallback | None = None,
+        model: str | None = None,
+        on_partial: Callable[[str], None] | None = None,
+        feedback: str | None = None,
+        temperature: float | None = None,
+        place_id: str | None = None,
     ) -> str:
-        """단일 리뷰에 대한 답변을 생성합니다."""
+        """단일 리뷰에 대한 답변을 생성합니다.
+
+        ``on_partial``을 지정하면 스트리밍으로 생성하며, 조각이 도착할 때마다
+        지금까지의 텍스트를 전달합니다. ``feedback``은 재생성 시 이전 답변의
+        문제점을 알려주는 문구이고, ``temperature``는 이번 호출에만 적용됩니다.
+        ``place_id``를 주면 그 장소의 과거 답변을 few-shot 예시로 넣습니다.
+        """
         if not review_text.strip():
             return ""
 
@@ -65,43 +173,116 @@ class ReplyGenerator:
             if log:
                 log(level, message)
 
+        if temperature is None:
+            temperature = self.config.temperature
+
         try:
-            # 사용자 정의 프롬프트가 있으면 사용, 없으면 기본 프롬프트 시스템 사용
-            if self.config.custom_prompt.strip():
-                # {작성자}를 실제 리뷰어 이름으로 교체
-                custom_prompt = self.config.custom_prompt
-                if review_author:
-                    custom_prompt = custom_prompt.replace("{작성자}", review_author)
-                prompt = f"{custom_prompt}\n\n리뷰:\n{review_text}\n\n답변:"
-            else:
-                prompt = build_reply_prompt(
-                    review_text=review_text,
-                    tone=self.config.tone,
-                    business_type=self.config.business_type,
-                    store_name=self.config.store_name,
-                )
+            messages = self._build_messages(
+                review_text, review_author, feedback, place_id
+            )
 
-            # 최종 프롬프트 디버그 로그
+            # 최종 프롬프트 디버그 로그 (고정 시스템 메시지는 생략)
             emit(
                 "DEBUG",
-                f"Final prompt for review by '{review_author}':\n{prompt}",
-            )
-
-            raw_reply = self.llm_client.generate(
-                prompt=prompt,
-                max_tokens=self.config.max_tokens,
-                temperature=self.config.temperature,
+                f"Final prompt for review by '{review_author}':\n{messages[-1]['content']}",
             )
 
-            return clean_reply_text(raw_reply)
+            if on_partial is None:
+                raw_reply = self.llm_client.generate(
+                    messages=messages,
+                    max_tokens=self._reply_max_tokens(),
+                    temperature=temperature,
+                    model=model,
+                )
+            else:
+                raw_reply = ""
+                for delta in self.llm_client.generate_stream(
+                    messages=messages,
+                    max_tokens=self._reply_max_tokens(),
+                    temperature=temperature,
+                    model=model,
+                ):
+                    raw_reply += delta
+                    on_partial(raw_reply)
+
+            return clean_reply_text(raw_reply, self.config.length_limit)
 
         except Exception as e:
             raise RuntimeError(f"답변 생성 실패: {e}")
 
+    def _build_messages(
+        self,
+        review_text: str,
+        review_author: str | None,
+        feedback: str | None = None,
+        place_id: str | None = None,
+    ) -> list[dict[str, str]]:
+        """단일 리뷰에 대한 채팅 메시지(고정 시스템 메시지 + 리뷰별 사용자 메시지)를 구성합니다."""
+        examples = self._history_examples(place_id, review_text)
+
+        # 너무 긴 리뷰는 토큰 예산에 맞게 가운데를 생략
+        review_text = self.token_budget.fit_review_text(review_text)
+
+        # 사용자 정의 프롬프트가 있으면 사용, 없으면 기본 프롬프트 시스템 사용
+        messages = build_reply_messages(
+            review_text=review_text,
+            tone=self.config.tone,
+            business_type=self.config.business_type,
+            store_name=self.config.store_name,
+            custom_prompt=self.config.custom_prompt,
+            review_author=review_author,
+            examples=examples,
+        )
+        if feedback:
+            # 시스템 메시지(캐시 접두부)는 그대로 두고 사용자 메시지에만 덧붙임
+            messages[-1] = {
+                "role": "user",
+                "content": f"{messages[-1]['content']}\n\n[재작성 요청] 이전 답변의 "
+                f"문제: {feedback}\n문제를 고쳐 완전히 새로 작성해주세요.",
+            }
+        return messages
+
+    def _history_examples(
+        self, place_id: str | None, review_text: str
+    ) -> list[tuple[str, str]]:
+        """장소의 과거 답변 중 리뷰와 비슷한 (리뷰, 답변) 쌍을 가져옵니다."""
+        if not place_id or self.config.history_examples <= 0:
+            return []
+        with self._cache_lock:
+            store = self._history_stores.get(place_id)
+            if store is None:
+                store = self._history_stores[place_id] = ReplyHistoryStore(
+                    place_id, root=self.config.history_dir
+                )
+        return [
+            (
+                self.token_budget.fit_review_text(example.review_text),
+                example.reply_text,
+            )
+            for example in store.similar(
+                review_text, k=self.config.history_examples
+            )
+        ]
+
+    def _reply_max_tokens(self, items: int = 1) -> int:
+        """답변 글자수 제한에서 completion ``max_tokens``를 계산합니다."""
+        if self.config.max_tokens is not None:
+            return self.config.max_tokens * items
+        return self.token_budget.max_tokens_for_reply(
+            self.config.length_limit, items=items
+        )
+
     def generate_batch(
-        self, reviews: list[dict[str, Any]], log: LogCallback | None = None
+        self,
+        reviews: list[dict[str, Any]],
+        log: LogCallback | None = None,
+        on_partial: PartialCallback | None = None,
     ) -> list[ReviewReplyPair]:
-        """여러 리뷰에 대한 답변을 일괄 생성합니다."""
+        """여러 리뷰에 대한 답변을 일괄 생성합니다.
+
+        ``on_partial``을 지정하면 개별 생성 답변은 스트리밍 중간 텍스트를,
+        템플릿/일괄 답변은 완성되는 즉시 최종 텍스트를 리뷰 ID와 함께 전달합니다.
+        """
 
         def emit(level: str, message: str) -> None:
             if log:
@@ -110,6 +291,23 @@ class ReplyGenerator:
         emit("INFO", f"{len(reviews)}개 리뷰에 대한 답변 생성을 시작합니다.")
 
         results: list[ReviewReplyPair] = []
+        template_ids: set[str] = set()
+        place_by_id = {
+            review.get("id", f"review_{i}"): (review.get("placeDetail") or {}).get("id")
+            for i, review in enumerate(reviews, 1)
+        }
+
+        # 우선순위 분류: 부정/긴급 리뷰를 먼저 처리
+        triage_by_id: dict[str, TriageResult] = {}
+        if self.config.enable_triage:
+            reviews, triage_by_id = self._triage(reviews, emit)
+
+        # 일괄 모드: 여러 리뷰를 한 요청으로 생성하고, 누락된 항목만 개별 생성으로 대체
+        batched_replies: dict[str, str] = {}
+        if self.config.batch_size > 1:
+            batched_replies = self._generate_in_batches(
+                reviews, emit, triage_by_id, on_partial=on_partial
+            )
 
         for i, review in enumerate(reviews, 1):
             review_id = review.get("id", f"review_{i}")
@@ -117,7 +315,28 @@ class ReplyGenerator:
             review_rating = review.get("rating")
             review_author = self._extract_author_name(review)
 
-            emit("INFO", f"[{i}/{len(reviews)}] 리뷰 '{review_id}' 답변 생성 중...")
+            template_reply = self._template_reply(review, review_id)
+            if template_reply:
+                results.append(
+                    ReviewReplyPair(
+                        review_id=review_id,
+                        review_text=review_text,
+                        review_rating=review_rating,
+                        review_author=review_author,
+                        generated_reply=template_reply,
+                    )
+                )
+                template_ids.add(review_id)
+                if on_partial:
+                    on_partial(review_id, template_reply)
+                emit(
+                    "SUCCESS",
+                    f"리뷰 '{review_id}' 템플릿 답변 적용: {template_reply[:50]}...",
+                )
+                continue
+
+            if review_id not in batched_replies:
+                emit("INFO", f"[{i}/{len(reviews)}] 리뷰 '{review_id}' 답변 생성 중...")
 
             try:
                 if not review_text.strip():
@@ -131,7 +350,15 @@ class ReplyGenerator:
                     )
                     continue
 
-                generated_reply = self.generate(review_text, review_author, log=emit)
+                stream_to = partial(on_partial, review_id) if on_partial else None
+                generated_reply = batched_replies.get(review_id) or self.generate(
+                    review_text,
+                    review_author,
+                    log=emit,
+                    model=self._model_for(triage_by_id.get(review_id)),
+                    on_partial=stream_to,
+                    place_id=place_by_id.get(review_id),
+                )
 
                 if not generated_reply:
                     emit("WARNING", f"리뷰 '{review_id}': 답변 생성 실패")
@@ -155,6 +382,9 @@ class ReplyGenerator:
                         generated_reply=generated_reply,
                     )
                 )
+                if on_partial:
+                    # 스트리밍 원문 대신 정리된 최종 답변으로 교체
+                    on_partial(review_id, generated_reply)
 
                 emit(
                     "SUCCESS",
@@ -174,11 +404,461 @@ class ReplyGenerator:
                     )
                 )
 
+        if self.config.enable_validation:
+            self._validate_and_regenerate(
+                results, template_ids, emit, triage_by_id, on_partial, place_by_id
+            )
+
+        for pair in results:
+            if pair.review_id in triage_by_id:
+                pair.priority = triage_by_id[pair.review_id].priority
+
         success_count = len([r for r in results if r.error is None])
         emit("SUCCESS", f"답변 생성 완료: {success_count}/{len(reviews)}개 성공")
 
         return results
 
+    def _validate_and_regenerate(
+        self,
+        results: list[ReviewReplyPair],
+        template_ids: set[str],
+        emit: LogCallback,
+        triage_by_id: dict[str, TriageResult],
+        on_partial: PartialCallback | None = None,
+        place_by_id: dict[str, str | None] | None = None,
+    ) -> None:
+        """매장의 답변 전체를 검증하고 실패한 답변만 병렬로 다시 생성합니다.
+
+        같은 장소의 과거 답변과 거의 같은 답변도 실패로 보고, 표현을 바꾸도록
+        온도를 높여 재생성합니다. 재생성 횟수를 넘겨도 통과하지 못한 답변은
+        내용을 남긴 채 ``error``를 설정해 자동 제출 대상에서 제외합니다.
+        """
+        place_by_id = place_by_id or {}
+        pairs_by_id = {pair.review_id: pair for pair in results}
+        review_texts = {pair.review_id: pair.review_text for pair in results}
+        max_regenerations = max(0, self.config.max_regenerations)
+
+        failing: dict[str, list[str]] = {}
+        for attempt in range(max_regenerations + 1):
+            candidates = {
+                pair.review_id: pair.generated_reply
+                for pair in results
+                if pair.generated_reply and not pair.error
+            }
+            issues = self.validator.validate_batch(
+                candidates, review_texts, skip_duplicate_check=template_ids
+            )
+            if self.config.enable_history_dedup:
+                for review_id, reply in candidates.items():
+                    index = self._dedup_index(place_by_id.get(review_id))
+                    if index is None or review_id in template_ids:
+                        continue
+                    matches = index.query(reply, exclude_key=review_id, limit=1)
+                    if matches:
+                        issues[review_id].append(
+                            f"{ISSUE_NEAR_DUPLICATE}: 이전에 작성한 답변과 "
+                            f"{matches[0][1]:.0%} 유사 (문장 구조와 표현을 바꿔주세요)"
+                        )
+            failing = {
+                review_id: problems for review_id, problems in issues.items() if problems
+            }
+            if not failing or attempt == max_regenerations:
+                break
+
+            emit(
+                "WARNING",
+                f"답변 {len(failing)}개가 품질 검증에 실패해 해당 답변만 다시 생성합니다.",
+            )
+            with ThreadPoolExecutor(max_workers=min(4, len(failing))) as pool:
+                futures = {
+                    pool.submit(
+                        self.generate,
+                        pairs_by_id[review_id].review_text,
+                        pairs_by_id[review_id].review_author,
+                        log=emit,
+                        model=self._model_for(triage_by_id.get(review_id)),
+                        feedback="; ".join(problems),
+                        temperature=self._regeneration_temperature(problems),
+                        place_id=place_by_id.get(review_id),
+                    ): review_id
+                    for review_id, problems in failing.items()
+                }
+                for future in as_completed(futures):
+                    review_id = futures[future]
+                    try:
+                        reply = future.result()
+                    except Exception as e:
+                        emit("WARNING", f"리뷰 '{review_id}' 답변 재생성 실패: {e}")
+                        continue
+                    if reply:
+                        pairs_by_id[review_id].generated_reply = reply
+                        template_ids.discard(review_id)
+                        if on_partial:
+                            on_partial(review_id, reply)
+
+        for review_id, problems in failing.items():
+            pairs_by_id[review_id].error = f"품질 검증 실패: {'; '.join(problems)}"
+            emit(
+                "WARNING",
+                f"리뷰 '{review_id}' 답변이 품질 검증을 통과하지 못했습니다: "
+                f"{'; '.join(problems)}",
+            )
+
+        if self.config.enable_history_dedup:
+            self._remember_replies(results, template_ids, place_by_id)
+
+    def _regeneration_temperature(self, problems: list[str]) -> float | None:
+        """유사 답변 때문에 재생성할 때는 표현이 달라지도록 온도를 높입니다."""
+        if any(problem.startswith(ISSUE_NEAR_DUPLICATE) for problem in problems):
+            return min(self.config.temperature + 0.3, 1.2)
+        return None
+
+    def _dedup_index(self, place_id: str | None) -> ReplyDedupIndex | None:
+        if not place_id:
+            return None
+        with self._cache_lock:
+            index = self._dedup_indexes.get(place_id)
+            if index is None:
+                index = self._dedup_indexes[place_id] = ReplyDedupIndex(
+                    place_id,
+                    root=self.config.dedup_dir,
+                    threshold=self.config.history_dedup_threshold,
+                )
+        return index
+
+    def _remember_replies(
+        self,
+        results: list[ReviewReplyPair],
+        template_ids: set[str],
+        place_by_id: dict[str, str | None],
+    ) -> None:
+        """검증을 통과한 LLM 답변을 장소별 색인에 추가하고 저장합니다."""
+        touched: dict[str, ReplyDedupIndex] = {}
+        for pair in results:
+            if not pair.generated_reply or pair.error or pair.review_id in template_ids:
+                continue
+            index = self._dedup_index(place_by_id.get(pair.review_id))
+            if index is None:
+                continue
+            index.add(pair.review_id, pair.generated_reply)
+            touched[index.place_id] = index
+
+        for index in touched.values():
+            try:
+                index.save()
+            except OSError:
+                # 색인 저장 실패는 답변 생성 결과에 영향을 주지 않음
+                pass
+
+    def submit_offline_batch(
+        self,
+        reviews: list[dict[str, Any]],
+        batch_dir: Path = DEFAULT_BATCH_DIR,
+        log: LogCallback | None = None,
+    ) -> str | None:
+        """급하지 않은 리뷰를 OpenAI Batch API 작업으로 제출하고 batch ID를 반환합니다.
+
+        요청의 ``custom_id``는 리뷰 ID이며, 텍스트가 없거나 템플릿으로 답변할
+        리뷰는 제외됩니다. 제출할 리뷰가 없으면 None을 반환합니다.
+        """
+
+        def emit(level: str, message: str) -> None:
+            if log:
+                log(level, message)
+
+        requests = []
+        for i, review in enumerate(reviews, 1):
+            review_id = str(review.get("id", f"review_{i}"))
+            review_text = self._extract_review_text(review)
+            if not review_text.strip() or self._template_reply(review, review_id):
+                continue
+            messages = self._build_messages(
+                review_text,
+                self._extract_author_name(review),
+                place_id=(review.get("placeDetail") or {}).get("id"),
+            )
+            requests.append(
+                self.llm_client.build_batch_request(
+                    custom_id=review_id,
+                    messages=messages,
+                    max_tokens=self._reply_max_tokens(),
+                    temperature=self.config.temperature,
+                )
+            )
+
+        if not requests:
+            emit("WARNING", "Batch 작업으로 제출할 리뷰가 없습니다.")
+            return None
+
+        jsonl_path = batch_dir / f"replies-{datetime.now().strftime('%Y%m%d-%H%M%S')}.jsonl"
+        batch_id = self.llm_client.submit_batch_job(requests, jsonl_path)
+        emit(
+            "INFO",
+            f"{len(requests)}개 리뷰를 Batch 작업으로 제출했습니다. (batch_id: {batch_id})",
+        )
+        return batch_id
+
+    def collect_offline_batch(
+        self,
+        batch_id: str | None,
+        reviews: list[dict[str, Any]],
+        poll_interval: float = 30.0,
+        timeout: float | None = None,
+        log: LogCallback | None = None,
+    ) -> list[ReviewReplyPair]:
+        """Batch 작업 완료를 기다린 뒤 결과를 리뷰 ID 기준으로 ``ReviewReplyPair``에 매핑합니다."""
+
+        def emit(level: str, message: str) -> None:
+            if log:
+                log(level, message)
+
+        if batch_id is None:
+            # 제출된 요청이 없으면 템플릿 답변만 채움
+            job = BatchJobResult(batch_id="", status="skipped")
+        else:
+            job = self.llm_client.wait_for_batch_job(
+                batch_id,
+                poll_interval=poll_interval,
+                timeout=timeout,
+                on_status=lambda status: emit("INFO", f"Batch 작업 상태: {status}"),
+            )
+
+        results: list[ReviewReplyPair] = []
+        for i, review in enumerate(reviews, 1):
+            review_id = str(review.get("id", f"review_{i}"))
+            review_text = self._extract_review_text(review)
+            pair = ReviewReplyPair(
+                review_id=review_id,
+                review_text=review_text,
+                review_rating=review.get("rating"),
+                review_author=self._extract_author_name(review),
+            )
+
+            template_reply = self._template_reply(review, review_id)
+            if template_reply:
+                pair.generated_reply = template_reply
+            elif not review_text.strip():
+                pair.error = "리뷰 텍스트 없음"
+            elif review_id in job.outputs:
+                pair.generated_reply = clean_reply_text(
+                    job.outputs[review_id], self.config.length_limit
+                )
+                if not pair.generated_reply:
+                    pair.error = "답변 생성 실패"
+            else:
+                pair.error = job.errors.get(
+                    review_id, f"Batch 결과 없음 (상태: {job.status})"
+                )
+            results.append(pair)
+
+        success_count = len([r for r in results if r.error is None])
+        emit("SUCCESS", f"Batch 답변 수집 완료: {success_count}/{len(reviews)}개 성공")
+        return results
+
+    def generate_offline(
+        self,
+        reviews: list[dict[str, Any]],
+        batch_dir: Path = DEFAULT_BATCH_DIR,
+        poll_interval: float = 30.0,
+        timeout: float | None = None,
+        log: LogCallback | None = None,
+    ) -> list[ReviewReplyPair]:
+        """Batch API로 제출하고 완료까지 기다려 결과를 반환합니다. (야간 일괄 처리용)"""
+        batch_id = self.submit_offline_batch(reviews, batch_dir=batch_dir, log=log)
+        results = self.collect_offline_batch(
+            batch_id, reviews, poll_interval=poll_interval, timeout=timeout, log=log
+        )
+        self.validate_replies(results, reviews, log=log)
+        return results
+
+    def validate_replies(
+        self,
+        pairs: list[ReviewReplyPair],
+        reviews: list[dict[str, Any]],
+        log: LogCallback | None = None,
+    ) -> None:
+        """Batch API로 받은 한 매장의 답변을 ``generate_batch``와 같은 방식으로 검증합니다.
+
+        ``pairs``는 ``reviews``와 같은 순서여야 합니다. 검증에 실패한 답변은
+        온라인으로 다시 생성하고, 끝내 통과하지 못하면 ``error``를 설정합니다.
+        """
+        if not self.config.enable_validation:
+            return
+
+        def emit(level: str, message: str) -> None:
+            if log:
+                log(level, message)
+
+        template_ids: set[str] = set()
+        place_by_id: dict[str, str | None] = {}
+        for i, review in enumerate(reviews, 1):
+            review_id = str(review.get("id", f"review_{i}"))
+            place_by_id[review_id] = (review.get("placeDetail") or {}).get("id")
+            if self._template_reply(review, review_id):
+                template_ids.add(review_id)
+
+        self._validate_and_regenerate(
+            pairs, template_ids, emit, {}, place_by_id=place_by_id
+        )
+
+    def _triage(
+        self, reviews: list[dict[str, Any]], emit: LogCallback
+    ) -> tuple[list[dict[str, Any]], dict[str, TriageResult]]:
+        """리뷰를 위험도 점수 순으로 정렬하고 리뷰 ID별 판정 결과를 반환합니다."""
+        triage = [
+            triage_review(
+                review,
+                review.get("id", f"review_{i}"),
+                self._extract_review_text(review),
+            )
+            for i, review in enumerate(reviews, 1)
+        ]
+        ordered = prioritize_reviews(reviews, triage)
+
+        high_count = len([t for t in triage if t.priority == PRIORITY_HIGH])
+        if high_count:
+            emit("INFO", f"우선 처리 대상 리뷰 {high_count}건을 먼저 생성합니다.")
+
+        return (
+            [review for review, _ in ordered],
+            {result.review_id: result for _, result in ordered},
+        )
+
+    def _model_for(self, triage: TriageResult | None) -> str | None:
+        """우선순위가 높은 리뷰는 ``priority_model``로, 나머지는 기본 모델로 생성합니다."""
+        if triage and triage.priority == PRIORITY_HIGH and self.config.priority_model:
+            return self.config.priority_model
+        return None
+
+    def _generate_in_batches(
+        self,
+        reviews: list[dict[str, Any]],
+        emit: LogCallback,
+        triage_by_id: dict[str, TriageResult] | None = None,
+        on_partial: PartialCallback | None = None,
+    ) -> dict[str, str]:
+        """리뷰를 ``batch_size``개씩 묶어 한 번의 요청으로 답변을 생성합니다.
+
+        응답 형식이 잘못되었거나 누락된 리뷰는 결과에 포함되지 않으며,
+        ``generate_batch``에서 개별 요청으로 다시 생성합니다. 과거 답변 예시는
+        리뷰마다 JSON 항목의 ``examples``로 함께 보냅니다.
+        """
+        entries = []
+        for i, review in enumerate(reviews, 1):
+            review_id = review.get("id", f"review_{i}")
+            review_text = self._extract_review_text(review)
+            if not review_text.strip() or self._template_reply(review, review_id):
+                continue
+            entries.append(
+                {
+                    "review_id": review_id,
+                    "author": self._extract_author_name(review),
+                    "text": self.token_budget.fit_review_text(review_text),
+                    "model": self._model_for((triage_by_id or {}).get(review_id)),
+                    # 단건 생성과 같은 과거 답변 few-shot 예시
+                    "examples": self._history_examples(
+                        (review.get("placeDetail") or {}).get("id"), review_text
+                    ),
+                }
+            )
+
+        batch_size = self.config.batch_size
+        system_prompt = build_system_prompt(
+            self.config.tone,
+            self.config.business_type,
+            self.config.store_name,
+            self.config.custom_prompt,
+        )
+        # 같은 모델로 생성할 리뷰끼리만 묶음 (우선순위 리뷰는 별도 요청)
+        chunks: list[list[dict[str, Any]]] = []
+        for entry in entries:
+            if (
+                chunks
+                and len(chunks[-1]) < batch_size
+                and chunks[-1][0]["model"] == entry["model"]
+            ):
+                chunks[-1].append(entry)
+            else:
+                chunks.append([entry])
+
+        replies: dict[str, str] = {}
+        start = 0
+        for chunk in chunks:
+            # 프롬프트에는 짧은 순번 ID를 사용해 토큰을 절약하고 ID 훼손을 방지
+            local_ids = [str(n) for n in range(1, len(chunk) + 1)]
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {
+                    "role": "user",
+                    "content": build_batch_user_message(
+                        [
+                            {
+                                "id": local_id,
+                                "author": entry["author"],
+                                "text": entry["text"],
+                                "examples": entry["examples"],
+                            }
+                            for local_id, entry in zip(local_ids, chunk)
+                        ]
+                    ),
+                },
+            ]
+            emit(
+                "INFO",
+                f"리뷰 {start + 1}~{start + len(chunk)}/{len(entries)} 일괄 답변 생성 중...",
+            )
+            emit("DEBUG", f"Final batch prompt:\n{messages[-1]['content']}")
+            start += len(chunk)
+
+            try:
+                raw_response = self.llm_client.generate(
+                    messages=messages,
+                    max_tokens=self._reply_max_tokens(items=len(chunk)),
+                    temperature=self.config.temperature,
+                    model=chunk[0]["model"],
+                )
+            except Exception as e:
+                emit("WARNING", f"일괄 답변 생성 실패, 개별 생성으로 대체합니다: {e}")
+                continue
+
+            parsed = parse_batch_reply_response(
+                raw_response, local_ids, self.config.length_limit
+            )
+            for local_id, entry in zip(local_ids, chunk):
+                if local_id in parsed:
+                    replies[entry["review_id"]] = parsed[local_id]
+                    if on_partial:
+                        on_partial(entry["review_id"], parsed[local_id])
+
+            missing = len(chunk) - len(parsed)
+            if missing:
+                emit(
+                    "WARNING",
+                    f"일괄 응답에서 {missing}개 답변이 누락/손상되어 개별 생성으로 대체합니다.",
+                )
+
+        return replies
+
+    def _template_reply(self, review: dict[str, Any], review_id: str) -> str | None:
+        """텍스트 없음/짧은 칭찬 리뷰이면 템플릿 답변을, 아니면 None을 반환합니다."""
+        if not self.config.enable_template_replies:
+            return None
+
+        if not is_trivial_review(
+            self._extract_review_text(review),
+            rating=review.get("rating"),
+            max_chars=self.config.template_max_chars,
+            has_negative_grade=bool(review.get("hasNegativeTextGrade")),
+        ):
+            return None
+
+        return render_template_reply(
+            str(review_id),
+            business_type=self.config.business_type,
+            tone=self.config.tone,
+            review_author=self._extract_author_name(review),
+        )
+
     def _extract_review_text(self, review: dict[str, Any]) -> str:
         """리뷰 데이터에서 텍스트 내용을 추출합니다."""
         # GraphQL API 응답 구조에 맞춰 텍스트 추출
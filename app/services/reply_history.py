@@ -0,0 +1,230 @@
+"""Local store of the owner's past replies, used as few-shot examples.
+
+Already-answered reviews of a place are stored under
+``runs/history/<place_id>.json``. Each past review is vectorized as TF-IDF
+over hashed character 2/3-grams. At generation time the most similar past
+review/reply pairs are retrieved, so new replies follow the owner's own
+wording. With NumPy installed the vectors are one matrix cached in a ``.npz``
+file and a lookup is a single matrix-vector product. Without NumPy the same
+weights are kept as sparse dicts.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+import time
+import zlib
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+DEFAULT_HISTORY_DIR = Path("runs/history")
+
+# 공백/문장부호를 하나의 공백으로 정리 (n-gram이 단어 경계를 넘지 않도록)
+_NON_WORD_PATTERN = re.compile(r"[\W_]+", re.UNICODE)
+_SAFE_NAME = re.compile(r"[^0-9A-Za-z_-]")
+
+
+@dataclass
+class HistoryExample:
+    """과거 리뷰와 사장님 답변 한 쌍"""
+
+    review_id: str
+    review_text: str
+    reply_text: str
+    score: float = 0.0
+
+
+def char_ngram_counts(text: str, dim: int, sizes: tuple[int, ...] = (2, 3)) -> Counter:
+    """단어별 문자 n-gram을 ``dim``개 구간으로 해시해 빈도를 셉니다."""
+    counts: Counter = Counter()
+    for word in _NON_WORD_PATTERN.sub(" ", text or "").lower().split():
+        padded = f" {word} "
+        for size in sizes:
+            for i in range(len(padded) - size + 1):
+                counts[zlib.crc32(padded[i : i + size].encode("utf-8")) % dim] += 1
+    return counts
+
+
+class ReplyHistoryStore:
+    """장소(place_id) 하나의 과거 리뷰/답변 유사도 검색 색인"""
+
+    def __init__(
+        self, place_id: str, root: Path | str = DEFAULT_HISTORY_DIR, dim: int = 2048
+    ) -> None:
+        self.place_id = str(place_id)
+        name = _SAFE_NAME.sub("_", self.place_id)
+        self.path = Path(root) / f"{name}.json"
+        self.vectors_path = Path(root) / f"{name}.npz"
+        self.dim = dim
+
+        self._examples: list[HistoryExample] = []
+        self._idf: list[float] = []
+        self._matrix = None  # NumPy (문서 수, dim) 행렬
+        self._sparse: list[dict[int, float]] = []  # NumPy가 없을 때 사용
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._examples)
+
+    def is_stale(self, max_age: float = 24 * 3600) -> bool:
+        """마지막 수집 후 ``max_age``초가 지났거나 수집한 적이 없으면 True."""
+        try:
+            return time.time() - self.path.stat().st_mtime > max_age
+        except OSError:
+            return True
+
+    def ingest(self, reviews: list[dict[str, Any]]) -> int:
+        """답글이 달린 리뷰를 추가(같은 ID는 갱신)하고 색인을 다시 만듭니다.
+
+        새로 추가된 쌍의 수를 반환합니다. 변경이 없어도 수집 시각은 갱신됩니다.
+        """
+        by_id = {example.review_id: example for example in self._examples}
+        added = 0
+        for review in reviews:
+            reply = review.get("reply") or {}
+            reply_text = (reply.get("text") or "").strip()
+            content = review.get("content") or {}
+            review_text = (content.get("text") or "").strip()
+            review_id = str(review.get("id") or "")
+            if not review_id or not reply_text or not review_text:
+                continue
+            if reply.get("isDeleted") or reply.get("isSuspended"):
+                continue
+            if review_id not in by_id:
+                added += 1
+            by_id[review_id] = HistoryExample(review_id, review_text, reply_text)
+
+        self._examples = list(by_id.values())
+        self._build_index()
+        self._save()
+        return added
+
+    def similar(
+        self, review_text: str, k: int = 3, min_score: float = 0.15
+    ) -> list[HistoryExample]:
+        """리뷰와 가장 비슷한 과거 리뷰/답변 쌍을 최대 ``k``개 반환합니다."""
+        if not self._examples or not review_text.strip() or k <= 0:
+            return []
+
+        query = self._weights(char_ngram_counts(review_text, self.dim))
+        if not query:
+            return []
+
+        if self._matrix is not None:
+            vector = np.zeros(self.dim, dtype=np.float32)
+            for index, weight in query.items():
+                vector[index] = weight
+            scores = self._matrix @ vector
+            top = min(k, len(scores))
+            candidates = np.argpartition(-scores, top - 1)[:top]
+            ranked = [(int(i), float(scores[i])) for i in candidates]
+        else:
+            ranked = [
+                (i, sum(weight * doc.get(index, 0.0) for index, weight in query.items()))
+                for i, doc in enumerate(self._sparse)
+            ]
+
+        ranked = sorted(ranked, key=lambda item: item[1], reverse=True)[:k]
+        return [
+            HistoryExample(**{**asdict(self._examples[i]), "score": score})
+            for i, score in ranked
+            if score >= min_score
+        ]
+
+    def _weights(self, counts: Counter) -> dict[int, float]:
+        """n-gram 빈도를 L2 정규화된 TF-IDF 가중치로 변환합니다."""
+        if not self._idf:
+            return {}
+        weights = {
+            index: (1.0 + math.log(count)) * self._idf[index]
+            for index, count in counts.items()
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        if norm == 0:
+            return {}
+        return {index: w / norm for index, w in weights.items()}
+
+    def _build_index(self) -> None:
+        doc_counts = [
+            char_ngram_counts(example.review_text, self.dim) for example in self._examples
+        ]
+        document_frequency = Counter()
+        for counts in doc_counts:
+            document_frequency.update(counts.keys())
+
+        total = len(doc_counts)
+        self._idf = [
+            math.log((1 + total) / (1 + document_frequency.get(index, 0))) + 1.0
+            for index in range(self.dim)
+        ]
+        sparse = [self._weights(counts) for counts in doc_counts]
+
+        if NUMPY_AVAILABLE:
+            self._matrix = np.zeros((total, self.dim), dtype=np.float32)
+            for row, weights in enumerate(sparse):
+                for index, weight in weights.items():
+                    self._matrix[row, index] = weight
+            self._sparse = []
+        else:
+            self._sparse = sparse
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "place_id": self.place_id,
+                    "examples": [asdict(example) for example in self._examples],
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.path)
+
+        if self._matrix is not None:
+            np.savez(
+                self.vectors_path,
+                matrix=self._matrix,
+                idf=np.asarray(self._idf, dtype=np.float32),
+            )
+
+    def _load(self) -> None:
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+
+        self._examples = [
+            HistoryExample(**example) for example in data.get("examples", [])
+        ]
+        if not self._examples:
+            return
+
+        # 저장된 행렬이 현재 예시/차원과 맞으면 재계산 없이 사용
+        if NUMPY_AVAILABLE and self.vectors_path.exists():
+            try:
+                with np.load(self.vectors_path) as cached:
+                    matrix = cached["matrix"]
+                    idf = cached["idf"]
+                if matrix.shape == (len(self._examples), self.dim):
+                    self._matrix = matrix
+                    self._idf = idf.tolist()
+                    return
+            except (OSError, ValueError, KeyError):
+                pass
+
+        self._build_index()
@@ -0,0 +1,160 @@
+"""Post-generation quality checks for generated replies.
+
+Runs once over all replies of a store: banned words (one compiled regex
+alternation), the configured length limit, near-duplicate replies (Jaccard
+similarity of hashed character shingles of ``reply_body``, so a greeting that
+only differs by the reviewer's name does not hide a copy) and replies that echo
+the prompt or the review. ``ReplyGenerator`` regenerates only the replies that fail.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+
+# 정규화 시 제거할 문자 (공백/문장부호/이모지 등 비문자)
+_NON_WORD_PATTERN = re.compile(r"[\W_]+", re.UNICODE)
+
+# 답변이 아니라 지시문/역할 설명을 그대로 출력한 경우의 표지
+ECHO_MARKERS = re.compile(
+    r"^(답변|리뷰|작성자|응답)\s*[:：]|AI\s*(로서|언어\s*모델)|언어\s*모델로서|"
+    r"다음\s*(리뷰|지침)에\s*(대한|따라)|\{[^}]*\}"
+)
+
+# 답변 첫머리의 인사말 ("안녕하세요, ", "반갑습니다! " 등)
+_GREETING_PATTERN = re.compile(r"^\s*(안녕하세요|안녕하십니까|반갑습니다)[\s,.!~]*")
+# 호칭 ("홍길동님", "hong***님", "김철수 고객님")
+_ADDRESSEE_PATTERN = re.compile(r"[0-9A-Za-z가-힣*]+(\s*고객)?\s*님")
+
+ISSUE_BANNED_WORD = "banned_word"
+ISSUE_LENGTH = "length"
+ISSUE_NEAR_DUPLICATE = "near_duplicate"
+ISSUE_PROMPT_ECHO = "prompt_echo"
+
+
+def _normalize(text: str) -> str:
+    return _NON_WORD_PATTERN.sub("", text or "").lower()
+
+
+def reply_body(text: str) -> str:
+    """유사도 비교용으로 인사말을 떼고 작성자 호칭을 "님"으로 통일합니다."""
+    body = _GREETING_PATTERN.sub("", text or "")
+    return _ADDRESSEE_PATTERN.sub("님", body)
+
+
+def shingle_hashes(text: str, size: int = 3) -> set[int]:
+    """정규화한 텍스트의 문자 ``size``-gram을 해시한 집합을 반환합니다."""
+    normalized = _normalize(text)
+    if len(normalized) < size:
+        return {zlib.crc32(normalized.encode("utf-8"))} if normalized else set()
+    return {
+        zlib.crc32(normalized[i : i + size].encode("utf-8"))
+        for i in range(len(normalized) - size + 1)
+    }
+
+
+def jaccard(a: set[int], b: set[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class ReplyValidator:
+    """매장 단위로 생성된 답변들을 한 번에 검증합니다."""
+
+    def __init__(
+        self,
+        banned_words: list[str] | None = None,
+        length_limit: int = 250,
+        min_length: int = 10,
+        prompt_text: str = "",
+        duplicate_threshold: float = 0.8,
+        echo_threshold: float = 0.5,
+        shingle_size: int = 3,
+        echo_shingle_size: int = 8,
+    ) -> None:
+        words = sorted({w.strip() for w in banned_words or [] if w.strip()}, key=len)
+        # 긴 단어를 먼저 시도하도록 역순으로 묶은 단일 정규식
+        self._banned_pattern = (
+            re.compile("|".join(re.escape(w) for w in reversed(words)), re.IGNORECASE)
+            if words
+            else None
+        )
+        self.length_limit = length_limit
+        self.min_length = min_length
+        self.duplicate_threshold = duplicate_threshold
+        self.echo_threshold = echo_threshold
+        self.shingle_size = shingle_size
+        self.echo_shingle_size = echo_shingle_size
+        self._prompt_shingles = shingle_hashes(prompt_text, echo_shingle_size)
+
+    def validate_batch(
+        self,
+        replies: dict[str, str],
+        review_texts: dict[str, str] | None = None,
+        skip_duplicate_check: set[str] | None = None,
+    ) -> dict[str, list[str]]:
+        """리뷰 ID → 답변 매핑을 검증해 리뷰 ID → 문제 목록을 반환합니다.
+
+        문제가 없는 답변은 빈 목록입니다. 중복 검사에서는 먼저 나온 답변을
+        기준으로 삼고, 뒤에 나온 비슷한 답변에 문제를 표시합니다.
+        """
+        review_texts = review_texts or {}
+        skip_duplicate_check = skip_duplicate_check or set()
+
+        issues: dict[str, list[str]] = {}
+        accepted_shingles: list[tuple[str, set[int]]] = []
+
+        for review_id, reply in replies.items():
+            found = self._check_single(reply, review_texts.get(review_id, ""))
+
+            shingles = shingle_hashes(reply_body(reply), self.shingle_size)
+            if review_id not in skip_duplicate_check:
+                for other_id, other in accepted_shingles:
+                    similarity = jaccard(shingles, other)
+                    if similarity >= self.duplicate_threshold:
+                        found.append(
+                            f"{ISSUE_NEAR_DUPLICATE}: 리뷰 '{other_id}' 답변과 "
+                            f"{similarity:.0%} 유사"
+                        )
+                        break
+                if not found:
+                    accepted_shingles.append((review_id, shingles))
+
+            issues[review_id] = found
+
+        return issues
+
+    def _check_single(self, reply: str, review_text: str) -> list[str]:
+        found = []
+
+        if self._banned_pattern is not None:
+            matches = sorted({m.group(0) for m in self._banned_pattern.finditer(reply)})
+            if matches:
+                found.append(f"{ISSUE_BANNED_WORD}: {', '.join(matches)}")
+
+        # clean_reply_text는 제한을 넘는 답변을 잘라 "..."으로 끝냄
+        if len(reply) > self.length_limit or (
+            reply.endswith("...") and len(reply) >= self.length_limit
+        ):
+            found.append(f"{ISSUE_LENGTH}: {self.length_limit}자 초과")
+        elif len(reply.strip()) < self.min_length:
+            found.append(f"{ISSUE_LENGTH}: {self.min_length}자 미만")
+
+        if self._is_echo(reply, review_text):
+            found.append(f"{ISSUE_PROMPT_ECHO}: 프롬프트/리뷰 문구 반복")
+
+        return found
+
+    def _is_echo(self, reply: str, review_text: str) -> bool:
+        if ECHO_MARKERS.search(reply):
+            return True
+
+        reply_shingles = shingle_hashes(reply, self.echo_shingle_size)
+        if not reply_shingles:
+            return False
+        source = self._prompt_shingles | shingle_hashes(
+            review_text, self.echo_shingle_size
+        )
+        overlap = len(reply_shingles & source) / len(reply_shingles)
+        return overlap >= self.echo_threshold
@@ -10,7 +10,14 @@ from typing import Any, Callable
 
 import httpx
 
-from app.core.errors import ReviewAPIAuthError
+from app.core.errors import CircuitOpenError, ReviewAPIAuthError
+from app.core.logging import log_context
+from app.core.retry import RetryPolicy
+from app.infra.smartplace_graphql import (
+    CircuitBreaker,
+    RequestLimiter,
+    SmartPlaceGraphQL,
+)
 from app.services.stop_signal import StopSignal
 
 # GraphQL API 엔드포인트
@@ -160,15 +167,35 @@ class ReviewCrawler:
     Fetches SmartPlace reviews via the new GraphQL API.
     """
 
-    def __init__(self, client: httpx.Client, stop_signal: StopSignal | None = None):
+    def __init__(
+        self,
+        client: httpx.Client,
+        stop_signal: StopSignal | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        limiter: RequestLimiter | None = None,
+        limiter_key: str = "",
+    ):
         self.client = client
         self.stop_signal = stop_signal
+        self.retry_policy = retry_policy or RetryPolicy()
+        # 제출기와 같은 브레이커를 공유하면 장애 시 남은 호출이 즉시 실패
+        self.graphql = SmartPlaceGraphQL(client, breaker, limiter, limiter_key)
 
     def fetch_reviews(
         self,
         stores: list[dict[str, str]],
         log: LogCallback | None = None,
+        has_reply: bool = False,
+        page_size: int = 10,
     ) -> CrawlResult:
+        """매장별 리뷰를 수집합니다.
+
+        기본은 답글 없는 리뷰이며, ``has_reply=True``이면 과거 답변 색인용으로
+        이미 답글이 달린 리뷰를 가져옵니다.
+        """
+        reply_label = "답글 있는" if has_reply else "답글 없는"
+
         def emit(level: str, message: str) -> None:
             if log:
                 log(level, message)
@@ -186,60 +213,80 @@ class ReviewCrawler:
             booking_id = store_map["booking_id"]
             place_seq = store_map["place_seq"]
             place_id = store_map["place_id"]
-
-            emit(
-                "INFO",
-                f"[{i}/{len(stores)}] 플레이스 {booking_id} (placeId: {place_id}) 리뷰 API 호출",
-            )
-
-            try:
-                response_data = self._fetch_reviews_for_store(
-                    booking_id, place_id, place_seq, emit
-                )
-
-                reviews = (
-                    response_data.get("data", {}).get("reviews", {}).get("items", [])
+            with log_context(store_id=booking_id):
+                emit(
+                    "INFO",
+                    f"[{i}/{len(stores)}] 플레이스 {booking_id} "
+                    f"(placeId: {place_id}) 리뷰 API 호출",
                 )
 
-                # 서버에서 필터링했으므로 클라이언트 필터링은 불필요합니다.
-                review_count = len(reviews)
+                try:
+                    response_data = self._fetch_reviews_for_store(
+                        booking_id,
+                        place_id,
+                        place_seq,
+                        emit,
+                        has_reply=has_reply,
+                        page_size=page_size,
+                    )
 
-                result = StoreCrawlResult(
-                    booking_id=booking_id,
-                    place_id=place_id,
-                    place_seq=place_seq,
-                    review_count=review_count,
-                    reviews=reviews,
-                )
-                crawl_results.append(result)
+                    reviews = (
+                        response_data.get("data", {})
+                        .get("reviews", {})
+                        .get("items", [])
+                    )
 
-                emit(
-                    "SUCCESS",
-                    f"플레이스 {booking_id} 답글 없는 리뷰 {review_count}건 수집 완료",
-                )
+                    # 서버에서 필터링했으므로 클라이언트 필터링은 불필요합니다.
+                    review_count = len(reviews)
 
-            except (httpx.HTTPStatusError, ReviewAPIAuthError) as e:
-                error_message = str(e)
-                emit("ERROR", f"플레이스 {booking_id} 리뷰 수집 실패: {error_message}")
-                crawl_results.append(
-                    StoreCrawlResult(
+                    result = StoreCrawlResult(
                         booking_id=booking_id,
                         place_id=place_id,
                         place_seq=place_seq,
-                        error=error_message,
+                        review_count=review_count,
+                        reviews=reviews,
                     )
-                )
-            except Exception as e:
-                error_message = f"알 수 없는 오류: {e}"
-                emit("ERROR", f"플레이스 {booking_id} 리뷰 수집 실패: {error_message}")
-                crawl_results.append(
-                    StoreCrawlResult(
-                        booking_id=booking_id,
-                        place_id=place_id,
-                        place_seq=place_seq,
-                        error=error_message,
+                    crawl_results.append(result)
+
+                    emit(
+                        "SUCCESS",
+                        f"플레이스 {booking_id} {reply_label} 리뷰 {review_count}건 수집 완료",
+                    )
+
+                except CircuitOpenError as e:
+                    # 엔드포인트 장애로 판단되어 타임아웃을 기다리지 않고 건너뜀
+                    error_message = str(e)
+                    emit("WARNING", f"플레이스 {booking_id} 리뷰 수집 건너뜀: {error_message}")
+                    crawl_results.append(
+                        StoreCrawlResult(
+                            booking_id=booking_id,
+                            place_id=place_id,
+                            place_seq=place_seq,
+                            error=error_message,
+                        )
+                    )
+                except (httpx.HTTPStatusError, ReviewAPIAuthError) as e:
+                    error_message = str(e)
+                    emit("ERROR", f"플레이스 {booking_id} 리뷰 수집 실패: {error_message}")
+                    crawl_results.append(
+                        StoreCrawlResult(
+                            booking_id=booking_id,
+                            place_id=place_id,
+                            place_seq=place_seq,
+                            error=error_message,
+                        )
+                    )
+                except Exception as e:
+                    error_message = f"알 수 없는 오류: {e}"
+                    emit("ERROR", f"플레이스 {booking_id} 리뷰 수집 실패: {error_message}")
+                    crawl_results.append(
+                        StoreCrawlResult(
+                            booking_id=booking_id,
+                            place_id=place_id,
+                            place_seq=place_seq,
+                            error=error_message,
+                        )
                     )
-                )
 
         total_reviews = sum(res.review_count for res in crawl_results)
         emit(
@@ -255,6 +302,8 @@ class ReviewCrawler:
         place_id: str,
         place_seq: str,
         emit: LogCallback,
+        has_reply: bool = False,
+        page_size: int = 10,
     ) -> dict[str, Any]:
         """Fetch all reviews for a single store using the GraphQL API."""
 
@@ -263,12 +312,12 @@ class ReviewCrawler:
         start_date = today - datetime.timedelta(days=365 * 2)  # 2년 전
         variables = {
             "input": {
-                "size": 10,  # 한 번에 최대 n개 요청
+                "size": page_size,  # 한 번에 최대 n개 요청
                 "startDate": start_date.strftime("%Y-%m-%d"),
                 "endDate": today.strftime("%Y-%m-%d"),
                 "isSuspended": False,
                 "placeId": place_id,
-                "hasReply": False,  # 답글 없는 리뷰만 가져오기
+                "hasReply": has_reply,  # 기본은 답글 없는 리뷰만 가져오기
             }
         }
 
@@ -289,8 +338,8 @@ class ReviewCrawler:
         emit("DEBUG", f"GraphQL Payload: {payload}")
         emit("DEBUG", f"GraphQL Headers: {headers}")
 
-        try:
-            response = self.client.post(
+        def post() -> httpx.Response:
+            response = self.graphql.post(
                 GRAPHQL_API_URL, json=payload, headers=headers, timeout=30.0
             )
 
@@ -300,6 +349,18 @@ class ReviewCrawler:
                 )
 
             response.raise_for_status()
+            return response
+
+        def on_retry(attempt: int, delay: float, exc: BaseException) -> None:
+            emit(
+                "WARNING",
+                f"플레이스 {booking_id} 리뷰 API 일시 오류, {delay:.1f}초 후 재시도 "
+                f"({attempt}회 실패): {exc}",
+            )
+
+        try:
+            # 5xx/429/타임아웃은 재시도, 인증 오류는 즉시 실패
+            response = self.retry_policy.call(post, on_retry=on_retry)
 
             data = response.json()
             if "errors" in data:
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable
 
 import httpx
 
+from app.core.errors import CircuitOpenError
+from app.core.logging import bind_log_context
+from app.core.retry import RetryPolicy
+from app.infra.smartplace_graphql import (
+    CircuitBreaker,
+    RequestLimiter,
+    SmartPlaceGraphQL,
+)
+from app.services.stop_signal import StopSignal
+
+GRAPHQL_CREATE_REPLY_URL = "https://new.smartplace.naver.com/graphql?opName=createReply"
+
 # The GraphQL mutation query for creating a reply.
 # This is extracted from the network request analysis.
 CREATE_REPLY_MUTATION = """
@@ -46,24 +59,106 @@ class SubmissionResult:
     submitted_text: str = ""
 
 
+@dataclass
+class StoreSubmission:
+    """한 매장에서 제출할 답변 목록"""
+
+    booking_id: str
+    place_seq: str
+    reply_pairs: list[dict[str, Any]] = field(default_factory=list)
+
+
 LogCallback = Callable[[str, str], None]
 
 
+def build_create_reply_request(
+    pair: dict[str, Any], place_seq: str, booking_id: str
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """createReply 뮤테이션의 (payload, headers)를 만듭니다."""
+    # Construct the payload for the GraphQL mutation
+    variables = {
+        "input": {
+            "text": pair.get("reply_text", ""),
+            "reviewId": pair.get("review_id"),
+            "bookingBusinessId": int(booking_id),
+        }
+    }
+    # Add placeId if it exists in the pair (for receipt reviews, etc.)
+    if pair.get("place_id"):
+        variables["input"]["placeId"] = pair["place_id"]
+    payload = {
+        "operationName": "createReply",
+        "variables": variables,
+        "query": CREATE_REPLY_MUTATION,
+    }
+
+    # Construct headers, mimicking the captured request
+    headers = {
+        "accept": "*/*",
+        "accept-language": "ko-KR,ko;q=0.9",
+        "content-type": "application/json",
+        "from-system": "smartplace",
+        "origin": "https://new.smartplace.naver.com",
+        "referer": f"https://new.smartplace.naver.com/bizes/place/{place_seq}/reviews?bookingBusinessId={booking_id}&menu=visitor",
+        # user-agent is set on the client by LoginService
+    }
+    return payload, headers
+
+
+def _retry_logger(emit: LogCallback, review_id: str):
+    def on_retry(attempt: int, delay: float, exc: BaseException) -> None:
+        emit(
+            "WARNING",
+            f"리뷰 '{review_id}' 답변 제출 일시 오류, {delay:.1f}초 후 재시도 "
+            f"({attempt}회 실패): {exc}",
+        )
+
+    return on_retry
+
+
+def check_create_reply_response(response: httpx.Response) -> None:
+    """createReply 응답을 검사하고, 실패면 ``httpx.HTTPError``를 발생시킵니다."""
+    response.raise_for_status()
+
+    response_data = response.json()
+
+    if "errors" in response_data:
+        error_detail = response_data["errors"][0]["message"]
+        raise httpx.HTTPError(f"GraphQL API Error: {error_detail}")
+
+    if not response_data.get("data", {}).get("createReviewReply"):
+        raise httpx.HTTPError("Unexpected GraphQL response format.")
+
+
 class ReplySubmitter:
     """Submits replies to Naver SmartPlace automatically via its internal GraphQL API."""
 
-    def __init__(self, client: httpx.Client):
+    def __init__(
+        self,
+        client: httpx.Client,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        limiter: RequestLimiter | None = None,
+        limiter_key: str = "",
+    ):
         """
         Initializes the submitter with an authenticated httpx client.
 
         Args:
             client: An httpx.Client instance that has been authenticated
                     (i.e., contains the necessary login cookies).
+            retry_policy: Retry policy for transient errors. Replies are not
+                    idempotent, so only errors where the request surely was
+                    not processed are retried.
+            breaker: Circuit breaker shared with the crawler. While it is
+                    open, remaining replies fail fast without a request.
+            limiter: Concurrency limiter shared by accounts running in
+                    parallel; ``limiter_key`` identifies this account.
         """
         self.client = client
-        self.graphql_endpoint = (
-            "https://new.smartplace.naver.com/graphql?opName=createReply"
-        )
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.graphql = SmartPlaceGraphQL(client, breaker, limiter, limiter_key)
+        self.graphql_endpoint = GRAPHQL_CREATE_REPLY_URL
 
     def submit_batch(
         self,
@@ -119,62 +214,41 @@ class ReplySubmitter:
             emit("INFO", f"[{i}/{len(reply_pairs)}] 리뷰 '{review_id}' 답변 제출 중...")
 
             try:
-                # Construct the payload for the GraphQL mutation
-                variables = {
-                    "input": {
-                        "text": reply_text,
-                        "reviewId": review_id,
-                        "bookingBusinessId": int(booking_id),
-                    }
-                }
-                # Add placeId if it exists in the pair (for receipt reviews, etc.)
-                if pair.get("place_id"):
-                    variables["input"]["placeId"] = pair["place_id"]
-                payload = {
-                    "operationName": "createReply",
-                    "variables": variables,
-                    "query": CREATE_REPLY_MUTATION,
-                }
-
-                # Construct headers, mimicking the captured request
-                headers = {
-                    "accept": "*/*",
-                    "accept-language": "ko-KR,ko;q=0.9",
-                    "content-type": "application/json",
-                    "from-system": "smartplace",
-                    "origin": "https://new.smartplace.naver.com",
-                    "referer": f"https://new.smartplace.naver.com/bizes/place/{place_seq}/reviews?bookingBusinessId={booking_id}&menu=visitor",
-                    # user-agent is set on the client by LoginService
-                }
-
-                # Make the API call
-                response = self.client.post(
-                    self.graphql_endpoint,
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0,
+                payload, headers = build_create_reply_request(
+                    pair, place_seq, booking_id
                 )
-                response.raise_for_status()
 
-                response_data = response.json()
+                def post() -> None:
+                    response = self.graphql.post(
+                        self.graphql_endpoint,
+                        json=payload,
+                        headers=headers,
+                        timeout=30.0,
+                    )
+                    check_create_reply_response(response)
 
-                if "errors" in response_data:
-                    error_detail = response_data["errors"][0]["message"]
-                    raise httpx.HTTPError(f"GraphQL API Error: {error_detail}")
+                # Make the API call
+                self.retry_policy.call(
+                    post,
+                    idempotent=False,
+                    on_retry=_retry_logger(emit, review_id),
+                )
 
-                if response_data.get("data", {}).get("createReviewReply"):
-                    emit(
-                        "SUCCESS",
-                        f"리뷰 '{review_id}' 답변이 성공적으로 제출되었습니다.",
-                    )
-                    results.append(
-                        SubmissionResult(
-                            review_id=review_id, success=True, submitted_text=reply_text
-                        )
+                emit(
+                    "SUCCESS",
+                    f"리뷰 '{review_id}' 답변이 성공적으로 제출되었습니다.",
+                )
+                results.append(
+                    SubmissionResult(
+                        review_id=review_id, success=True, submitted_text=reply_text
                     )
-                else:
-                    raise httpx.HTTPError("Unexpected GraphQL response format.")
+                )
 
+            except CircuitOpenError as e:
+                emit("WARNING", f"리뷰 '{review_id}' 답변 제출 건너뜀: {e}")
+                results.append(
+                    SubmissionResult(review_id=review_id, success=False, error=str(e))
+                )
             except (httpx.HTTPStatusError, httpx.RequestError, httpx.HTTPError) as e:
                 error_msg = f"API call failed: {e}"
                 emit("ERROR", f"리뷰 '{review_id}' 답변 제출 실패. {error_msg}")
@@ -196,3 +270,214 @@ class ReplySubmitter:
         emit("SUCCESS", f"API 제출 완료: {success_count}/{len(reply_pairs)}개 성공")
 
         return results
+
+
+class AsyncReplySubmitter:
+    """여러 매장의 답변을 ``httpx.AsyncClient``로 병렬 제출합니다.
+
+    매장별 동시 요청 수와 전체 동시 요청 수를 각각 제한하고, 같은 매장의
+    연속 요청 사이에는 ``request_interval``초 간격을 둡니다. 결과는
+    ``ReplySubmitter.submit_batch``와 같은 ``SubmissionResult`` 목록(입력 순서)입니다.
+    """
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        per_store_concurrency: int = 2,
+        global_concurrency: int = 6,
+        request_interval: float = 0.5,
+        stop_signal: StopSignal | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        limiter: RequestLimiter | None = None,
+        limiter_key: str = "",
+    ):
+        # 로그인된 동기 클라이언트의 쿠키/헤더(CSRF 토큰 포함)를 그대로 사용
+        self.client = client
+        self.graphql = SmartPlaceGraphQL(client, breaker, limiter, limiter_key)
+        self.per_store_concurrency = max(1, per_store_concurrency)
+        self.global_concurrency = max(1, global_concurrency)
+        self.request_interval = request_interval
+        self.stop_signal = stop_signal
+        self.retry_policy = retry_policy or RetryPolicy()
+
+    def submit_stores(
+        self,
+        stores: list[StoreSubmission],
+        log: LogCallback | None = None,
+        on_store_done: Callable[[StoreSubmission, list[SubmissionResult]], None]
+        | None = None,
+    ) -> dict[str, list[SubmissionResult]]:
+        """모든 매장의 답변을 제출하고 ``booking_id`` → 결과 목록을 반환합니다.
+
+        ``on_store_done``은 매장 하나의 제출이 끝날 때마다 호출됩니다.
+        (이벤트 루프가 없는 작업 스레드에서 호출하는 동기 진입점)
+        """
+        return asyncio.run(self.submit_stores_async(stores, log, on_store_done))
+
+    async def submit_stores_async(
+        self,
+        stores: list[StoreSubmission],
+        log: LogCallback | None = None,
+        on_store_done: Callable[[StoreSubmission, list[SubmissionResult]], None]
+        | None = None,
+    ) -> dict[str, list[SubmissionResult]]:
+        def emit(level: str, message: str) -> None:
+            if log:
+                log(level, message)
+
+        total = sum(len(store.reply_pairs) for store in stores)
+        emit(
+            "INFO",
+            f"{len(stores)}개 매장, {total}개 답변 병렬 제출을 시작합니다. "
+            f"(매장당 {self.per_store_concurrency}, 전체 {self.global_concurrency})",
+        )
+
+        if "csrf_token" not in self.client.cookies:
+            emit(
+                "ERROR",
+                "CSRF 토큰을 쿠키에서 찾을 수 없습니다. 로그인 과정이 올바른지 확인하세요.",
+            )
+            results = {
+                store.booking_id: [
+                    SubmissionResult(
+                        review_id=pair.get("review_id", "unknown"),
+                        success=False,
+                        error="CSRF token not found in cookies.",
+                    )
+                    for pair in store.reply_pairs
+                ]
+                for store in stores
+            }
+            if on_store_done:
+                for store in stores:
+                    on_store_done(store, results[store.booking_id])
+            return results
+
+        global_limit = asyncio.Semaphore(self.global_concurrency)
+        limits = httpx.Limits(
+            max_connections=self.global_concurrency,
+            max_keepalive_connections=self.global_concurrency,
+        )
+        async with httpx.AsyncClient(
+            cookies=self.client.cookies,
+            headers=self.client.headers,
+            follow_redirects=self.client.follow_redirects,
+            limits=limits,
+            timeout=30.0,
+        ) as async_client:
+
+            async def run_store(store: StoreSubmission) -> list[SubmissionResult]:
+                store_results = await self._submit_store(
+                    async_client, store, global_limit, emit
+                )
+                if on_store_done:
+                    on_store_done(store, store_results)
+                return store_results
+
+            gathered = await asyncio.gather(*(run_store(store) for store in stores))
+
+        results = {
+            store.booking_id: store_results
+            for store, store_results in zip(stores, gathered)
+        }
+        success_count = sum(
+            1 for store_results in gathered for r in store_results if r.success
+        )
+        emit("SUCCESS", f"API 제출 완료: {success_count}/{total}개 성공")
+        return results
+
+    async def _submit_store(
+        self,
+        async_client: httpx.AsyncClient,
+        store: StoreSubmission,
+        global_limit: asyncio.Semaphore,
+        emit: LogCallback,
+    ) -> list[SubmissionResult]:
+        store_limit = asyncio.Semaphore(self.per_store_concurrency)
+
+        async def submit_one(index: int, pair: dict[str, Any]) -> SubmissionResult:
+            review_id = pair.get("review_id")
+            reply_text = pair.get("reply_text", "")
+            # 작업마다 컨텍스트가 복사되므로 다른 리뷰의 로그에 섞이지 않음
+            bind_log_context(store_id=store.booking_id, review_id=review_id)
+
+            if not review_id or not reply_text.strip():
+                emit(
+                    "WARNING",
+                    f"리뷰 '{review_id or 'N/A'}': 리뷰 ID 또는 답변 텍스트가 비어있어 건너뜁니다.",
+                )
+                return SubmissionResult(
+                    review_id=review_id or f"unknown_{index}",
+                    success=False,
+                    error="Review ID or reply text is empty.",
+                )
+
+            async with store_limit:
+                if self.stop_signal and self.stop_signal.is_set():
+                    return SubmissionResult(
+                        review_id=review_id, success=False, error="Submission stopped."
+                    )
+
+                async with global_limit:
+                    result = await self._post_reply(
+                        async_client, pair, store, emit
+                    )
+
+                # 같은 매장의 다음 요청까지 간격 유지 (레이트 리밋 대비)
+                if self.request_interval > 0:
+                    await asyncio.sleep(self.request_interval)
+                return result
+
+        return list(
+            await asyncio.gather(
+                *(
+                    submit_one(index, pair)
+                    for index, pair in enumerate(store.reply_pairs, 1)
+                )
+            )
+        )
+
+    async def _post_reply(
+        self,
+        async_client: httpx.AsyncClient,
+        pair: dict[str, Any],
+        store: StoreSubmission,
+        emit: LogCallback,
+    ) -> SubmissionResult:
+        review_id = pair["review_id"]
+        reply_text = pair["reply_text"]
+        try:
+            payload, headers = build_create_reply_request(
+                pair, store.place_seq, store.booking_id
+            )
+
+            async def post() -> None:
+                response = await self.graphql.post_async(
+                    async_client,
+                    GRAPHQL_CREATE_REPLY_URL,
+                    json=payload,
+                    headers=headers,
+                )
+                check_create_reply_response(response)
+
+            await self.retry_policy.call_async(
+                post, idempotent=False, on_retry=_retry_logger(emit, review_id)
+            )
+        except CircuitOpenError as e:
+            emit("WARNING", f"리뷰 '{review_id}' 답변 제출 건너뜀: {e}")
+            return SubmissionResult(review_id=review_id, success=False, error=str(e))
+        except (httpx.HTTPStatusError, httpx.RequestError, httpx.HTTPError) as e:
+            emit("ERROR", f"리뷰 '{review_id}' 답변 제출 실패. API call failed: {e}")
+            return SubmissionResult(review_id=review_id, success=False, error=str(e))
+        except Exception as e:
+            emit(
+                "ERROR",
+                f"리뷰 '{review_id}' 답변 제출 실패. An unexpected error occurred: {e}",
+            )
+            return SubmissionResult(review_id=review_id, success=False, error=str(e))
+
+        emit("SUCCESS", f"리뷰 '{review_id}' 답변이 성공적으로 제출되었습니다.")
+        return SubmissionResult(
+            review_id=review_id, success=True, submitted_text=reply_text
+        )
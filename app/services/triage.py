@@ -0,0 +1,94 @@
+"""Cheap local triage that orders reviews before reply generation.
+
+Scores each review from its rating, the ``hasNegativeTextGrade`` flag of the
+GraphQL response and small Korean keyword lexicons, so negative or urgent
+reviews are answered first (and optionally by a stronger model) instead of
+waiting behind 5-star reviews in API order.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from app.domain.reply_templates import NEGATIVE_KEYWORDS
+
+# 위생/안전/금전 문제처럼 즉시 대응이 필요한 표현
+URGENT_KEYWORDS = (
+    "벌레",
+    "머리카락",
+    "이물질",
+    "식중독",
+    "배탈",
+    "위생",
+    "상했",
+    "환불",
+    "신고",
+    "사기",
+    "부작용",
+    "다쳤",
+    "화상",
+    "무례",
+    "욕설",
+)
+
+PRIORITY_HIGH = "high"
+PRIORITY_NORMAL = "normal"
+PRIORITY_LOW = "low"
+
+HIGH_PRIORITY_THRESHOLD = 3.0
+
+
+@dataclass
+class TriageResult:
+    """리뷰 한 건의 우선순위 판정 결과"""
+
+    review_id: str
+    score: float
+    priority: str
+
+
+def score_review(review: dict[str, Any], review_text: str) -> float:
+    """리뷰의 위험도 점수를 계산합니다. 높을수록 먼저, 신중하게 답변해야 합니다."""
+    score = 0.0
+
+    rating = review.get("rating")
+    if isinstance(rating, (int, float)):
+        # 1점 → 6점, 2점 → 4점, 3점 → 2점
+        score += max(0.0, 4 - rating) * 2
+
+    if review.get("hasNegativeTextGrade"):
+        score += 3.0
+
+    text = review_text or ""
+    negative_hits = sum(1 for keyword in NEGATIVE_KEYWORDS if keyword in text)
+    score += min(negative_hits, 3) * 1.5
+
+    urgent_hits = sum(1 for keyword in URGENT_KEYWORDS if keyword in text)
+    score += urgent_hits * 4.0
+
+    return score
+
+
+def triage_review(
+    review: dict[str, Any], review_id: str, review_text: str
+) -> TriageResult:
+    """리뷰 한 건의 점수와 우선순위 등급을 판정합니다."""
+    score = score_review(review, review_text)
+    if score >= HIGH_PRIORITY_THRESHOLD:
+        priority = PRIORITY_HIGH
+    elif score == 0 and not (review_text or "").strip():
+        priority = PRIORITY_LOW
+    else:
+        priority = PRIORITY_NORMAL
+    return TriageResult(review_id=review_id, score=score, priority=priority)
+
+
+def prioritize_reviews(
+    reviews: list[dict[str, Any]],
+    triage: list[TriageResult],
+) -> list[tuple[dict[str, Any], TriageResult]]:
+    """점수가 높은 리뷰부터 정렬합니다. 점수가 같으면 원래(API) 순서를 유지합니다."""
+    paired = list(zip(reviews, triage))
+    paired.sort(key=lambda item: item[1].score, reverse=True)
+    return paired
@@ -2,7 +2,17 @@
 UI 모듈 - PySide6 기반 사용자 인터페이스
 """
 
-from .main_window import MainWindow
-from .viewmodel import ViewModel
-
 __all__ = ["MainWindow", "ViewModel"]
+
+
+def __getattr__(name: str):
+    # 하위 모듈만 필요한 경우(예: app.ui.viewmodel) 메인 윈도우를 불러오지 않음
+    if name == "MainWindow":
+        from .main_window import MainWindow
+
+        return MainWindow
+    if name == "ViewModel":
+        from .viewmodel import ViewModel
+
+        return ViewModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
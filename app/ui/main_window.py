@@ -2,8 +2,13 @@
 메인 윈도우 - 네이버 스마트플레이스 리뷰 자동응답 시스템의 메인 UI
 """
 
-from PySide6.QtCore import QObject, QThread
-from PySide6.QtCore import Signal as pyqtSignal
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import QThread, QTimer
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -14,18 +19,14 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from app.core.config import CrawlConfig
-from app.core.errors import LoginError, StoreEnumerationError
-from app.services.login_service import LoginResult, NaverLoginService
-from app.services.reply_generator import ReplyConfig, ReplyGenerator
-from app.services.review_crawler import CrawlResult, ReviewCrawler
+from app.core.config import STYLE_RELOAD_ENV, AppSettings, ConfigStore, CrawlConfig
+from app.core.errors import ConfigurationError
+from app.infra.llm_router import DEFAULT_PROVIDER, normalize_provider
+from app.services.accounts import AccountRegistry
+from app.services.checkpoint import RunCheckpointStore
 from app.services.stop_signal import StopSignal
-from app.services.store_enumerator import StoreEnumerator
-from app.services.submitter import ReplySubmitter
 from app.utils.auth import get_openai_api_key
 
-import httpx
-
 from .styles import Theme, ThemeManager
 from .viewmodel import ViewModel
 from .widgets import (
@@ -33,217 +34,12 @@ from .widgets import (
     ConfigWidget,
     ControlWidget,
     LoginWidget,
-    ResultsWindow,
 )
 from .widgets.log_widget import LogWidget
 
-
-class _LoginWorker(QObject):
-    """로그인 과정을 처리하는 워커"""
-
-    finished = pyqtSignal()
-    success = pyqtSignal(LoginResult)
-    failure = pyqtSignal(str)
-
-    def __init__(self, user_id: str, password: str, force_credential_login: bool):
-        super().__init__()
-        self._user_id = user_id
-        self._password = password
-        self._force_credential_login = force_credential_login
-        self._login_service = NaverLoginService(headless=False)
-
-    def run(self) -> None:
-        """로그인 실행"""
-        try:
-            result = self._login_service.login(
-                self._user_id, self._password, self._force_credential_login
-            )
-            if result.success:
-                self.success.emit(result)
-            else:
-                self.failure.emit(result.message)
-        except Exception as e:
-            self.failure.emit(f"알 수 없는 오류 발생: {e}")
-        finally:
-            self.finished.emit()
-
-
-class _OrchestrationWorker(QObject):
-    """전체 실행 흐름(열거->크롤링->답변생성->제출)을 관리하는 워커"""
-
-    finished = pyqtSignal()
-    success = pyqtSignal(CrawlResult)
-    failure = pyqtSignal(str)
-    log_emitted = pyqtSignal(str, str)
-    progress = pyqtSignal(int, int)
-    counts = pyqtSignal(int, int, int)
-    reply_generation_started = pyqtSignal()
-    reply_submission_started = pyqtSignal()
-
-    def __init__(self, config: CrawlConfig, stop_signal: StopSignal | None = None) -> None:
-        super().__init__()
-        self._config = config
-        self._stop_signal = stop_signal
-        self._login_service = NaverLoginService(headless=not config.browser_visible)
-
-    def run(self) -> None:
-        """실행의 메인 로직"""
-        try:
-            # 1. 인증된 HTTP 클라이언트 생성 (로그인은 이미 완료되었다고 가정)
-            self.log_emitted.emit(
-                "INFO", "저장된 인증 정보로 API 클라이언트를 생성합니다."
-            )
-            client = self._login_service.get_authenticated_client()
-
-            try:
-                # 2. 가게 ID 매핑
-                enumerator = StoreEnumerator(client)
-                store_mappings = []
-                total_stores = len(self._config.business_ids)
-                self.log_emitted.emit(
-                    "INFO", f"{total_stores}개 사업장의 ID를 확인합니다."
-                )
-                for i, booking_id in enumerate(self._config.business_ids):
-                    self.progress.emit(i, total_stores)
-                    try:
-                        id_map = enumerator.get_store_ids(
-                            booking_business_id=booking_id, user_id=self._config.user_id
-                        )
-                        store_mappings.append({"booking_id": booking_id, **id_map})
-                    except StoreEnumerationError as e:
-                        self.log_emitted.emit(
-                            "ERROR", f"사업장 ID '{booking_id}' 확인 실패: {e}"
-                        )
-                        continue
-
-                self.progress.emit(total_stores, total_stores)
-                if not store_mappings:
-                    raise ValueError("리뷰를 수집할 유효한 사업장이 없습니다.")
-
-                # 3. 리뷰 크롤링
-                crawler = ReviewCrawler(client, self._stop_signal)
-                crawl_result = crawler.fetch_reviews(
-                    stores=store_mappings, log=self.log_emitted.emit
-                )
-
-                # 4. 답변 생성 (활성화된 경우)
-                if self._config.enable_reply_generation and self._config.openai_api_key:
-                    self.reply_generation_started.emit()
-                    crawl_result = self._generate_replies(crawl_result)
-
-                # 5. 답변 제출 (활성화된 경우)
-                if self._config.auto_submit_replies and crawl_result:
-                    self.reply_submission_started.emit()
-                    self._submit_replies(crawl_result, client)
-
-                # 6. 결과 처리
-                self.success.emit(crawl_result)
-
-            finally:
-                # HTTP 클라이언트 세션 종료
-                client.close()
-
-        except LoginError as exc:
-            self.log_emitted.emit(
-                "ERROR", "로그인 정보가 유효하지 않습니다. 다시 로그인해주세요."
-            )
-            self.failure.emit(str(exc))
-        except Exception as exc:
-            self.failure.emit(str(exc))
-        finally:
-            self.finished.emit()
-
-    def _generate_replies(self, crawl_result: CrawlResult) -> CrawlResult:
-        """크롤링된 리뷰에 대한 답변을 생성합니다."""
-        self.log_emitted.emit("INFO", "리뷰 답변 생성을 시작합니다.")
-
-        try:
-            # 답변 생성 설정
-            reply_config = ReplyConfig(
-                tone=self._config.tone,
-                business_type=self._config.business_type,
-                openai_api_key=self._config.openai_api_key,
-                custom_prompt=self._config.custom_prompt,
-            )
-
-            # 답변 생성기 초기화
-            reply_generator = ReplyGenerator(reply_config)
-
-            # 각 매장별로 답변 생성
-            for store in crawl_result.stores:
-                if store.error or not store.reviews:
-                    continue
-
-                self.log_emitted.emit(
-                    "INFO", f"매장 '{store.booking_id}' 리뷰 답변 생성 중..."
-                )
-
-                # 답변 생성
-                reply_pairs = reply_generator.generate_batch(
-                    reviews=store.reviews, log=self.log_emitted.emit
-                )
-
-                # 생성된 답변을 매장 데이터에 추가
-                store.generated_replies = reply_pairs
-
-            self.log_emitted.emit("SUCCESS", "리뷰 답변 생성이 완료되었습니다.")
-            return crawl_result
-
-        except Exception as e:
-            self.log_emitted.emit("ERROR", f"답변 생성 중 오류 발생: {e}")
-            return crawl_result
-
-    def _submit_replies(self, crawl_result: CrawlResult, client: httpx.Client) -> None:
-        """생성된 답변을 네이버 스마트플레이스에 제출합니다."""
-        self.log_emitted.emit("INFO", "리뷰 답변 제출을 시작합니다.")
-
-        try:
-            # 답변 제출기 초기화 (API 클라이언트 사용)
-            submitter = ReplySubmitter(client)
-
-            for store in crawl_result.stores:
-                if not hasattr(store, "generated_replies") or store.error:
-                    continue
-
-                # Create a lookup map for review_id -> place_id
-                review_id_to_place_id = {
-                    review['id']: review.get('placeDetail', {}).get('id')
-                    for review in store.reviews
-                }
-
-                # 제출할 답변이 있는 경우만 처리
-                valid_replies = []
-                for reply in store.generated_replies:
-                    if reply.generated_reply and not reply.error:
-                        specific_place_id = review_id_to_place_id.get(reply.review_id)
-                        valid_replies.append({
-                            "review_id": reply.review_id,
-                            "reply_text": reply.generated_reply,
-                            "place_id": specific_place_id,  # Add the specific place_id
-                        })
-
-                if not valid_replies:
-                    continue
-
-                self.log_emitted.emit(
-                    "INFO", f"매장 '{store.booking_id}' 답변 API 제출 중..."
-                )
-
-                # 답변 일괄 제출
-                submission_results = submitter.submit_batch(
-                    reply_pairs=valid_replies,
-                    place_seq=store.place_seq,
-                    booking_id=store.booking_id,
-                    log=self.log_emitted.emit,
-                )
-
-                # 제출 결과를 매장 데이터에 추가
-                store.submission_results = submission_results
-
-            self.log_emitted.emit("SUCCESS", "리뷰 답변 제출이 완료되었습니다.")
-
-        except Exception as e:
-            self.log_emitted.emit("ERROR", f"답변 제출 중 오류 발생: {e}")
+if TYPE_CHECKING:
+    from app.services.login_service import LoginResult
+    from app.services.review_crawler import CrawlResult
 
 
 class MainWindow(QMainWindow):
@@ -255,12 +51,18 @@ class MainWindow(QMainWindow):
         # 뷰모델 및 테마 매니저 초기화
         self.viewmodel = ViewModel()
         self.theme_manager = ThemeManager()
+        self.config_store = ConfigStore()
 
         self.init_ui()
         self.setup_menu()
         self.setup_status_bar()
         self.apply_styles()
         self.connect_viewmodel()
+        self._setup_style_hot_reload()
+
+        # 저장된 설정이 있으면 반영
+        if self.config_store.path.exists():
+            self.load_config()
 
         # 서비스 초기화
         self._login_thread = None
@@ -334,6 +136,8 @@ class MainWindow(QMainWindow):
 
         # 도구 메뉴
         tools_menu = menubar.addMenu("도구(&T)")
+        tools_menu.addAction("모든 계정 실행", self.on_run_all_accounts_requested)
+        tools_menu.addSeparator()
         tools_menu.addAction("로그 폴더 열기", self.open_log_folder)
         tools_menu.addAction("데이터베이스 초기화", self.reset_database)
         tools_menu.addAction("셀렉터 테스트", self.test_selectors)
@@ -360,12 +164,26 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage(message)
 
     def load_config(self):
-        """설정 불러오기 (향후 구현)"""
-        self.update_status("설정 불러오기 - 구현 예정")
+        """설정 파일에서 설정 불러오기"""
+        try:
+            settings = self.config_store.get()
+        except ConfigurationError as e:
+            QMessageBox.warning(self, "설정 오류", str(e))
+            return
+        self._apply_settings(settings)
+        self.update_status(f"설정을 불러왔습니다: {self.config_store.path}")
 
     def save_config(self):
-        """설정 저장 (향후 구현)"""
-        self.update_status("설정 저장 - 구현 예정")
+        """현재 설정을 설정 파일에 저장"""
+        try:
+            changes = self.config_store.save(self._collect_settings())
+        except ConfigurationError as e:
+            QMessageBox.warning(self, "설정 오류", str(e))
+            return
+        if changes:
+            self.update_status(f"설정 저장 완료 (변경: {', '.join(changes)})")
+        else:
+            self.update_status("변경된 설정이 없습니다.")
 
     def open_log_folder(self):
         """로그 폴더 열기 (향후 구현)"""
@@ -389,13 +207,39 @@ class MainWindow(QMainWindow):
 
     def apply_styles(self):
         """스타일 적용"""
-        stylesheet = self.theme_manager.get_stylesheet()
-        self.setStyleSheet(stylesheet)
-
-        # 위젯별 추가 스타일 적용
+        # 위젯별 추가 스타일 (스타일시트 적용 전에 지정해야 한 번에 반영됨)
         self.control_widget.start_button.setProperty("class", "success")
         self.control_widget.stop_button.setProperty("class", "danger")
 
+        # 미리 컴파일된 스타일시트 사용, 같으면 전체 위젯 재스타일링 생략
+        stylesheet = self.theme_manager.get_stylesheet()
+        if stylesheet != self.styleSheet():
+            self.setStyleSheet(stylesheet)
+
+    def _setup_style_hot_reload(self):
+        """개발 모드(dev.py)에서 스타일 파일이 바뀌면 재시작 없이 다시 적용"""
+        reload_file = os.environ.get(STYLE_RELOAD_ENV)
+        if not reload_file:
+            return
+
+        reload_path = Path(reload_file)
+        last_mtime = reload_path.stat().st_mtime_ns if reload_path.exists() else 0
+
+        def poll():
+            nonlocal last_mtime
+            try:
+                mtime = reload_path.stat().st_mtime_ns
+            except OSError:
+                return
+            if mtime != last_mtime:
+                last_mtime = mtime
+                self.theme_manager.reload()
+                self.viewmodel.add_log("DEBUG", "스타일시트를 다시 적용했습니다.")
+
+        self._style_reload_timer = QTimer(self)
+        self._style_reload_timer.timeout.connect(poll)
+        self._style_reload_timer.start(300)
+
     def connect_viewmodel(self):
         """뷰모델 시그널 연결"""
         # 로그인 상태 연결
@@ -421,6 +265,7 @@ class MainWindow(QMainWindow):
 
         # 테마 변경 연결
         self.theme_manager.theme_changed.connect(self.on_theme_changed)
+        self.theme_manager.stylesheet_reloaded.connect(self.apply_styles)
 
         # 사업장 리스트 연결
         self.business_list_widget.business_list_changed.connect(
@@ -437,8 +282,11 @@ class MainWindow(QMainWindow):
             "testing", "로그인 테스트 중...", f"{user_id} 계정으로 로그인을 시도합니다."
         )
 
+        # 서비스/HTTP 모듈은 첫 요청 때 불러옴 (시작 시간 단축)
+        from .workers import LoginWorker
+
         self._login_thread = QThread()
-        self._login_worker = _LoginWorker(
+        self._login_worker = LoginWorker(
             user_id, password, force_credential_login=False
         )
         self._login_worker.moveToThread(self._login_thread)
@@ -455,13 +303,19 @@ class MainWindow(QMainWindow):
 
     def _on_login_success(self, result: LoginResult):
         """로그인 성공 처리"""
-        self.viewmodel.set_login_user(
-            self.login_widget.get_credentials()[0], result.used_cookies
-        )
+        user_id = self.login_widget.get_credentials()[0]
+        self.viewmodel.set_login_user(user_id, result.used_cookies)
         self.viewmodel.update_login_status("success", "로그인 성공", result.message)
         self.viewmodel.add_log("SUCCESS", result.message)
         self.login_widget.login_success(result.message)
 
+        # 로그인한 계정과 현재 사업장 목록을 등록 (모든 계정 실행에 사용)
+        business_ids = self.business_list_widget.get_business_list()
+        try:
+            AccountRegistry().upsert(user_id, business_ids=business_ids or None)
+        except OSError as e:
+            self.viewmodel.add_log("WARNING", f"계정 등록 실패: {e}")
+
     def _on_login_failure(self, error_message: str):
         """로그인 실패 처리"""
         self.viewmodel.update_login_status("error", "로그인 실패", error_message)
@@ -483,6 +337,26 @@ class MainWindow(QMainWindow):
         if not config:
             return
 
+        # 끝나지 않은 이전 실행이 있으면 이어서 진행할지 확인
+        resumable_run_id = RunCheckpointStore().find_resumable_run(
+            config.business_ids, config.user_id
+        )
+        if resumable_run_id:
+            reply = QMessageBox.question(
+                self,
+                "이전 실행 재개",
+                f"완료되지 않은 이전 실행({resumable_run_id})이 있습니다.\n"
+                "완료된 단계는 건너뛰고 이어서 진행하시겠습니까?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                config.run_id = resumable_run_id
+                self.viewmodel.add_log(
+                    "INFO", f"이전 실행 '{resumable_run_id}'을 이어서 진행합니다."
+                )
+            else:
+                RunCheckpointStore().discard_run(resumable_run_id)
+
         self.viewmodel.add_log(
             "DEBUG", f"CrawlConfig.auto_submit_replies = {config.auto_submit_replies}"
         )
@@ -495,8 +369,61 @@ class MainWindow(QMainWindow):
         self.viewmodel.update_progress(0, len(config.business_ids))
         self.update_status("리뷰 수집을 시작합니다.")
 
+        from .workers import OrchestrationWorker
+
+        self._start_execution_worker(OrchestrationWorker(config, self._stop_signal))
+
+    def on_run_all_accounts_requested(self):
+        """등록된 모든 계정을 각자의 세션으로 동시에 실행"""
+        if self._execution_thread and self._execution_thread.isRunning():
+            self.viewmodel.add_log("WARNING", "리뷰 수집이 이미 진행 중입니다.")
+            return
+
+        accounts = [
+            account
+            for account in AccountRegistry().list(enabled_only=True)
+            if account.business_ids
+        ]
+        if not accounts:
+            QMessageBox.information(
+                self,
+                "계정 없음",
+                "실행할 계정이 없습니다.\n"
+                "계정별로 사업장 ID를 입력한 뒤 한 번씩 로그인하면 등록됩니다.",
+            )
+            return
+
+        missing = [a.display_name for a in accounts if not a.has_session()]
+        if missing:
+            self.viewmodel.add_log(
+                "WARNING",
+                f"저장된 세션이 없는 계정은 실패합니다: {', '.join(missing)}",
+            )
+
+        settings = self._snapshot_settings()
+        if settings is None:
+            return
+        # 계정/사업장은 계정별 설정으로 채우고 나머지 설정은 공유
+        config = self._crawl_config_from_settings(settings, "", "", [])
+
+        self._stop_signal = StopSignal()
+        total_stores = sum(len(account.business_ids) for account in accounts)
+
+        self.viewmodel.clear_results()
+        self.viewmodel.start_execution()
+        self.viewmodel.update_progress(0, total_stores)
+        self.update_status(f"{len(accounts)}개 계정의 리뷰 수집을 시작합니다.")
+
+        from .workers import MultiAccountWorker
+
+        self._start_execution_worker(
+            MultiAccountWorker(config, accounts, self._stop_signal)
+        )
+
+    def _start_execution_worker(self, worker) -> None:
+        """실행 워커를 새 스레드에서 시작하고 UI 시그널을 연결합니다."""
         self._execution_thread = QThread()
-        self._execution_worker = _OrchestrationWorker(config, self._stop_signal)
+        self._execution_worker = worker
         self._execution_worker.moveToThread(self._execution_thread)
 
         self._execution_thread.started.connect(self._execution_worker.run)
@@ -505,6 +432,10 @@ class MainWindow(QMainWindow):
         self._execution_worker.log_emitted.connect(self._handle_execution_log)
         self._execution_worker.progress.connect(self.viewmodel.update_progress)
         self._execution_worker.counts.connect(self.viewmodel.update_counts)
+        self._execution_worker.reviews_collected.connect(
+            self._handle_reviews_collected
+        )
+        self._execution_worker.reply_partial.connect(self._handle_reply_partial)
         self._execution_worker.success.connect(self._handle_execution_success)
         self._execution_worker.failure.connect(self._handle_execution_failure)
         self._execution_thread.finished.connect(self._cleanup_execution_thread)
@@ -526,8 +457,25 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "로그인 필요", "아이디와 비밀번호를 입력하세요.")
             return None
 
+        # 설정은 실행마다 한 번만 수집해 불변 스냅샷으로 전달
+        settings = self._snapshot_settings()
+        if settings is None:
+            return None
+        return self._crawl_config_from_settings(
+            settings, user_id, password, business_ids
+        )
+
+    def _crawl_config_from_settings(
+        self,
+        settings: AppSettings,
+        user_id: str,
+        password: str,
+        business_ids: list[str],
+    ) -> CrawlConfig:
+        """설정 스냅샷과 계정 정보로 실행 설정을 만듭니다."""
         # API 키 자동 로드
         openai_api_key = get_openai_api_key()
+        uses_openai = normalize_provider(settings.llm_provider) == DEFAULT_PROVIDER
 
         return CrawlConfig(
             user_id=user_id,
@@ -536,14 +484,56 @@ class MainWindow(QMainWindow):
             browser_visible=False,  # 실행 시에는 브라우저 숨김
             # 답변 생성 설정
             openai_api_key=openai_api_key or "",
-            business_type=self.config_widget.get_config()["business_type"],
-            tone=self.config_widget.get_config()["tone"],
-            custom_prompt=self.config_widget.get_config()["custom_prompt"],
-            # 답변 생성 활성화 (API 키가 있을 때만)
-            enable_reply_generation=bool(openai_api_key),
+            business_type=settings.business_type,
+            tone=settings.tone,
+            custom_prompt=settings.custom_prompt,
+            reply_batch_size=settings.reply_batch_size,
+            reply_length_limit=settings.length_limit,
+            enable_template_replies=settings.template_replies,
+            priority_model=settings.priority_model,
+            banned_words=list(settings.banned_words),
+            use_reply_history=settings.use_reply_history,
+            llm_provider=settings.llm_provider,
+            llm_model=settings.llm_model or "gpt-4o-mini",
+            llm_base_url=settings.llm_base_url,
+            llm_fallbacks=[dict(fallback) for fallback in settings.llm_fallbacks],
+            # 답변 생성 활성화 (API 키가 있거나 로컬 서버를 쓸 때만)
+            enable_reply_generation=bool(openai_api_key) or not uses_openai,
             auto_submit_replies=self.control_widget.is_auto_submit_enabled(),
+            submit_per_store_concurrency=settings.submit_per_store_concurrency,
+            submit_global_concurrency=settings.submit_global_concurrency,
+            retry_budget=settings.retry_budget,
+            max_parallel_accounts=settings.max_parallel_accounts,
+            global_request_concurrency=settings.global_request_concurrency,
         )
 
+    def _collect_settings(self) -> AppSettings:
+        """위젯과 뷰모델의 현재 값을 한 번에 읽어 설정 스냅샷을 만듭니다."""
+        widget_config = self.config_widget.get_config()
+        return AppSettings.from_dict({**self.viewmodel.get_config(), **widget_config})
+
+    def _snapshot_settings(self) -> AppSettings | None:
+        """설정 스냅샷을 만들고 바뀐 값이 있으면 설정 파일에 저장합니다."""
+        try:
+            settings = self._collect_settings()
+        except ConfigurationError as e:
+            self.viewmodel.add_log("ERROR", str(e))
+            QMessageBox.warning(self, "설정 오류", str(e))
+            return None
+        try:
+            changes = self.config_store.save(settings)
+        except (ConfigurationError, OSError) as e:
+            self.viewmodel.add_log("WARNING", f"설정 저장 실패: {e}")
+            return settings
+        if changes:
+            self.viewmodel.add_log("DEBUG", f"변경된 설정 저장: {', '.join(changes)}")
+        return settings
+
+    def _apply_settings(self, settings: AppSettings) -> None:
+        """저장된 설정을 뷰모델과 위젯에 반영합니다."""
+        self.viewmodel.import_config(settings.to_dict())
+        self.config_widget.set_config(settings.to_dict())
+
     def on_stop_requested(self):
         """실행 정지 요청"""
         if self._execution_thread and self._execution_thread.isRunning():
@@ -562,9 +552,14 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "알림", "먼저 리뷰를 수집해주세요.")
             return
 
-        # OpenAI API 키 확인
+        settings = self._snapshot_settings()
+        if settings is None:
+            return
+
+        # OpenAI API 키 확인 (로컬 서버는 키 불필요)
         openai_api_key = get_openai_api_key()
-        if not openai_api_key:
+        uses_openai = normalize_provider(settings.llm_provider) == DEFAULT_PROVIDER
+        if not openai_api_key and uses_openai:
             QMessageBox.warning(
                 self,
                 "API 키 필요",
@@ -575,13 +570,24 @@ class MainWindow(QMainWindow):
         self.viewmodel.add_log("INFO", "기존 리뷰에 대한 답변 생성을 시작합니다.")
 
         try:
+            from app.services.reply_generator import ReplyConfig, ReplyGenerator
+
             # 답변 생성 설정
-            config = self.config_widget.get_config()
             reply_config = ReplyConfig(
-                tone=config["tone"],
-                business_type=config["business_type"],
+                tone=settings.tone,
+                business_type=settings.business_type,
                 openai_api_key=openai_api_key,
-                custom_prompt=config["custom_prompt"],
+                custom_prompt=settings.custom_prompt,
+                batch_size=settings.reply_batch_size,
+                length_limit=settings.length_limit,
+                enable_template_replies=settings.template_replies,
+                priority_model=settings.priority_model or None,
+                banned_words=list(settings.banned_words),
+                history_examples=3 if settings.use_reply_history else 0,
+                provider=settings.llm_provider,
+                model=settings.llm_model or "gpt-4o-mini",
+                base_url=settings.llm_base_url or None,
+                fallback_backends=[dict(f) for f in settings.llm_fallbacks],
             )
 
             # 답변 생성기 초기화
@@ -626,6 +632,17 @@ class MainWindow(QMainWindow):
     def _handle_execution_log(self, level: str, message: str) -> None:
         self.viewmodel.add_log(level, message)
 
+    def _handle_reviews_collected(self, result: CrawlResult) -> None:
+        """수집이 끝나면 답변 생성 전에도 결과창에서 리뷰를 볼 수 있게 합니다."""
+        self._last_crawl_result = result
+        if self._results_window and self._results_window.isVisible():
+            self._results_window.populate_data(result)
+
+    def _handle_reply_partial(self, review_id: str, reply_text: str) -> None:
+        """생성 중인 답변을 열려 있는 결과창에 실시간으로 표시합니다."""
+        if self._results_window and self._results_window.isVisible():
+            self._results_window.update_reply(review_id, reply_text)
+
     def _handle_execution_success(self, result: CrawlResult) -> None:
         self._last_crawl_result = result
         stores = result.stores or []
@@ -674,6 +691,8 @@ class MainWindow(QMainWindow):
             return
 
         if not self._results_window:
+            from .widgets.results_window import ResultsWindow
+
             self._results_window = ResultsWindow(self)
 
         self._results_window.populate_data(self._last_crawl_result)
@@ -707,4 +726,9 @@ class MainWindow(QMainWindow):
 
         self.viewmodel.stop_execution()
         self.update_status("시스템 종료 중...")
+
+        # 로그인 때 띄워 둔 브라우저 종료
+        from app.infra.browser import close_browser_pools
+
+        close_browser_pools()
         event.accept()
@@ -2,7 +2,8 @@
 스타일 모듈 - Qt 스타일시트 및 테마 관리
 """
 
+from .compiler import StylesheetCompiler
 from .main_style import get_main_stylesheet
 from .theme import Theme, ThemeManager
 
-__all__ = ["get_main_stylesheet", "Theme", "ThemeManager"]
+__all__ = ["get_main_stylesheet", "StylesheetCompiler", "Theme", "ThemeManager"]
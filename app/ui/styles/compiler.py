@@ -0,0 +1,107 @@
+"""
+스타일시트 컴파일러 - 테마별 최종 QSS를 한 번만 만들어 디스크에 캐시
+
+원본에서 주석/공백과 Qt가 지원하지 않는 속성을 제거한 결과를
+``runs/cache/qss/<테마>-<해시>.qss``에 저장합니다. 해시는 스타일 원본 파일과
+컴파일러 버전으로 계산하므로 ``main_style.py``나 ``<테마>.qss``를 고치면 캐시가
+자동으로 무효화됩니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Callable
+
+DEFAULT_QSS_CACHE_DIR = Path("runs/cache/qss")
+STYLE_SOURCE = Path(__file__).with_name("main_style.py")
+
+# 출력 형식이 바뀌면 올려서 기존 캐시를 무효화
+COMPILER_VERSION = "1"
+
+# Qt 스타일시트가 지원하지 않아 경고만 남기는 CSS 속성
+UNSUPPORTED_PROPERTIES = ("box-shadow", "transition")
+
+_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_PUNCTUATION_PATTERN = re.compile(r"\s*([{};,])\s*")
+_COLON_PATTERN = re.compile(r":\s+")
+_UNSUPPORTED_PATTERN = re.compile(
+    r"(?<=[{;])(?:" + "|".join(UNSUPPORTED_PROPERTIES) + r"):[^;}]*;?"
+)
+
+
+def compile_stylesheet(source: str) -> str:
+    """QSS 원본을 Qt가 바로 파싱할 수 있는 최소 형태로 변환합니다."""
+    qss = _COMMENT_PATTERN.sub("", source)
+    qss = _WHITESPACE_PATTERN.sub(" ", qss)
+    qss = _PUNCTUATION_PATTERN.sub(r"\1", qss)
+    qss = _COLON_PATTERN.sub(":", qss)
+    qss = _UNSUPPORTED_PATTERN.sub("", qss)
+    return qss.replace(";}", "}").strip()
+
+
+class StylesheetCompiler:
+    """테마 이름별 컴파일된 스타일시트를 메모리와 디스크에 캐시합니다."""
+
+    def __init__(
+        self,
+        cache_dir: Path | str = DEFAULT_QSS_CACHE_DIR,
+        source_path: Path = STYLE_SOURCE,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.source_path = source_path
+        self._source_hash: str | None = None
+        self._compiled: dict[str, str] = {}
+
+    @property
+    def source_hash(self) -> str:
+        """스타일 원본 파일, 같은 폴더의 ``.qss`` 파일, 컴파일러 버전의 해시 (앞 16자리)"""
+        if self._source_hash is None:
+            digest = hashlib.sha256(COMPILER_VERSION.encode("utf-8"))
+            sources = [self.source_path, *sorted(self.source_path.parent.glob("*.qss"))]
+            for path in sources:
+                try:
+                    digest.update(path.name.encode("utf-8"))
+                    digest.update(path.read_bytes())
+                except OSError:
+                    pass
+            self._source_hash = digest.hexdigest()[:16]
+        return self._source_hash
+
+    def clear(self) -> None:
+        """메모리 캐시를 비우고 다음 요청 때 원본 해시를 다시 계산합니다."""
+        self._source_hash = None
+        self._compiled.clear()
+
+    def get(self, name: str, build: Callable[[], str]) -> str:
+        """``name`` 테마의 컴파일된 스타일시트를 반환합니다.
+
+        캐시가 없거나 원본이 바뀐 경우에만 ``build``로 원본을 만들어 컴파일합니다.
+        """
+        if name in self._compiled:
+            return self._compiled[name]
+
+        path = self.cache_dir / f"{name}-{self.source_hash}.qss"
+        try:
+            qss = path.read_text(encoding="utf-8")
+        except OSError:
+            qss = compile_stylesheet(build())
+            self._save(name, path, qss)
+
+        self._compiled[name] = qss
+        return qss
+
+    def _save(self, name: str, path: Path, qss: str) -> None:
+        # 캐시는 최적화일 뿐이므로 쓰기 실패는 무시
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self.cache_dir.glob(f"{name}-*.qss"):
+                stale.unlink()
+            tmp_path = path.with_suffix(".qss.tmp")
+            tmp_path.write_text(qss, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
@@ -2,9 +2,13 @@
 테마 관리 모듈 - 라이트/다크 테마 전환 및 테마 설정 관리
 """
 
+from __future__ import annotations
+
+import importlib
 from enum import Enum
 from PySide6.QtCore import QObject, Signal as pyqtSignal
-from .main_style import get_main_stylesheet, get_dark_stylesheet
+from . import main_style
+from .compiler import STYLE_SOURCE, StylesheetCompiler
 
 
 class Theme(Enum):
@@ -20,14 +24,14 @@ class ThemeManager(QObject):
 
     # 시그널
     theme_changed = pyqtSignal(Theme)
+    stylesheet_reloaded = pyqtSignal()
 
-    def __init__(self):
+    def __init__(self, compiler: StylesheetCompiler | None = None):
         super().__init__()
         self._current_theme = Theme.LIGHT
-        self._stylesheets = {
-            Theme.LIGHT: get_main_stylesheet(),
-            Theme.DARK: get_dark_stylesheet(),
-        }
+        self._compiler = compiler or StylesheetCompiler()
+        self._sources = {}
+        self._load_sources()
 
     @property
     def current_theme(self) -> Theme:
@@ -49,7 +53,39 @@ class ThemeManager(QObject):
             # 시스템 테마 감지 로직 (향후 구현)
             theme = Theme.LIGHT
 
-        return self._stylesheets.get(theme, self._stylesheets[Theme.LIGHT])
+        if theme not in self._sources:
+            theme = Theme.LIGHT
+        return self._compiler.get(theme.value, self._sources[theme])
+
+    def reload(self):
+        """스타일 원본을 다시 읽어 재컴파일합니다. (개발 모드 스타일 핫 리로드)"""
+        importlib.reload(main_style)
+        self._compiler.clear()
+        self._load_sources()
+        self.stylesheet_reloaded.emit()
+
+    def _load_sources(self):
+        # 원본 생성 함수 (컴파일 캐시가 없을 때만 호출)
+        builders = {
+            Theme.LIGHT: main_style.get_main_stylesheet,
+            Theme.DARK: main_style.get_dark_stylesheet,
+        }
+        self._sources = {
+            theme: self._with_override(theme, build) for theme, build in builders.items()
+        }
+
+    def _with_override(self, theme: Theme, build):
+        # 스타일 폴더의 "<테마>.qss" 파일이 있으면 기본 스타일 뒤에 덧붙임
+        override_path = STYLE_SOURCE.with_name(f"{theme.value}.qss")
+
+        def build_with_override() -> str:
+            try:
+                override = override_path.read_text(encoding="utf-8")
+            except OSError:
+                override = ""
+            return build() + override
+
+        return build_with_override
 
     def toggle_theme(self):
         """테마 토글 (라이트 ↔ 다크)"""
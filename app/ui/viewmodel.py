@@ -5,6 +5,30 @@
 from PySide6.QtCore import QObject, Signal as pyqtSignal
 from datetime import datetime
 
+from app.core.config import AppSettings
+
+# 뷰모델이 보관하는 ``AppSettings`` 키
+SETTINGS_KEYS = (
+    "tone",
+    "length_limit",
+    "banned_words",
+    "mode",
+    "max_reviews",
+    "llm_provider",
+    "llm_model",
+    "reply_batch_size",
+    "template_replies",
+    "priority_model",
+    "llm_base_url",
+    "llm_fallbacks",
+    "submit_per_store_concurrency",
+    "submit_global_concurrency",
+    "use_reply_history",
+    "retry_budget",
+    "max_parallel_accounts",
+    "global_request_concurrency",
+)
+
 
 class ViewModel(QObject):
     """메인 뷰모델 - UI 상태 관리 및 데이터 바인딩"""
@@ -44,16 +68,11 @@ class ViewModel(QObject):
             "counts": {"processed": 0, "success": 0, "failed": 0},
         }
 
-        # 설정
+        # 설정 (기본값은 사용자 설정 스키마에서 가져옴)
+        defaults = AppSettings().to_dict()
         self.config = {
             "prompt_template": "",
-            "tone": "친절하고 정중한",
-            "length_limit": 350,
-            "banned_words": [],
-            "mode": "assist",
-            "max_reviews": 10,
-            "llm_provider": "OpenAI",
-            "llm_model": "gpt-4o-mini",
+            **{key: defaults[key] for key in SETTINGS_KEYS},
         }
 
         # 결과 데이터
@@ -256,16 +275,7 @@ class ViewModel(QObject):
     def import_config(self, config_data: dict):
         """설정 불러오기"""
         # 안전하게 설정 병합
-        safe_keys = {
-            "prompt_template",
-            "tone",
-            "length_limit",
-            "banned_words",
-            "mode",
-            "max_reviews",
-            "llm_provider",
-            "llm_model",
-        }
+        safe_keys = {"prompt_template", *SETTINGS_KEYS}
 
         filtered_config = {k: v for k, v in config_data.items() if k in safe_keys}
         self.update_config(filtered_config)
@@ -6,7 +6,6 @@ from .login_widget import LoginWidget
 from .config_widget import ConfigWidget
 from .control_widget import ControlWidget
 from .business_list_widget import BusinessListWidget
-from .results_window import ResultsWindow
 
 __all__ = [
     "LoginWidget",
@@ -15,3 +14,12 @@ __all__ = [
     "BusinessListWidget",
     "ResultsWindow",
 ]
+
+
+def __getattr__(name: str):
+    # 결과창은 처음 열 때 불러옴 (앱 시작 시간 단축)
+    if name == "ResultsWindow":
+        from .results_window import ResultsWindow
+
+        return ResultsWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
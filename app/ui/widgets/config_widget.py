@@ -102,3 +102,8 @@ class ConfigWidget(QWidget):
             "tone": "친절하고 정중한",
             "custom_prompt": self.prompt_text.toPlainText(),
         }
+
+    def set_config(self, config: dict):
+        """저장된 설정값을 위젯에 반영"""
+        if "custom_prompt" in config:
+            self.prompt_text.setPlainText(config["custom_prompt"])
@@ -2,6 +2,10 @@
 결과 표시창 위젯
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from PySide6.QtWidgets import (
     QVBoxLayout,
     QTableWidget,
@@ -11,7 +15,8 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
-from app.services.review_crawler import CrawlResult
+if TYPE_CHECKING:
+    from app.services.review_crawler import CrawlResult
 
 
 class ResultsWindow(QDialog):
@@ -21,6 +26,8 @@ class ResultsWindow(QDialog):
         super().__init__(parent)
         self.setWindowTitle("리뷰 수집 결과")
         self.setMinimumSize(800, 600)
+        # 리뷰 ID → 테이블 행 (스트리밍 답변 갱신용)
+        self._row_by_review_id: dict[str, int] = {}
         self.init_ui()
 
     def init_ui(self):
@@ -61,6 +68,7 @@ class ResultsWindow(QDialog):
     def populate_data(self, crawl_result: CrawlResult):
         """테이블에 리뷰 데이터를 채웁니다."""
         self.table_widget.setRowCount(0)  # 기존 데이터 초기화
+        self._row_by_review_id = {}
 
         # 모든 매장의 리뷰와 생성된 답변을 수집
         all_data = []
@@ -90,6 +98,7 @@ class ResultsWindow(QDialog):
             rating = review.get("rating", 0)
             content = review.get("content", {}).get("text", "")
             created_date = review.get("createdDateTime", "").split("T")[0]
+            self._row_by_review_id[review.get("id", "")] = row
 
             # 테이블 아이템 생성 및 검정색 폰트 설정
             author_item = QTableWidgetItem(author)
@@ -117,3 +126,16 @@ class ResultsWindow(QDialog):
             self.table_widget.setRowHeight(row, 75)  # 기존 50의 1.5배
 
         self.table_widget.resizeRowsToContents()
+
+    def update_reply(self, review_id: str, reply_text: str):
+        """생성 중인 답변을 해당 리뷰 행에 실시간으로 반영합니다."""
+        row = self._row_by_review_id.get(review_id)
+        if row is None:
+            return
+
+        reply_item = self.table_widget.item(row, 3)
+        if reply_item is None:
+            reply_item = QTableWidgetItem()
+            reply_item.setForeground(Qt.GlobalColor.black)
+            self.table_widget.setItem(row, 3, reply_item)
+        reply_item.setText(reply_text)
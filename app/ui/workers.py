@@ -0,0 +1,680 @@
+"""
+백그라운드 워커 - 로그인과 전체 실행 흐름(열거->크롤링->답변생성->제출)
+
+여러 계정을 실행할 때는 계정마다 독립된 세션으로 같은 흐름을 동시에 실행합니다.
+
+httpx, OpenAI SDK, 서비스 모듈을 불러오므로 메인 윈도우는 첫 로그인/실행
+요청 때 이 모듈을 가져옵니다. (앱 시작 시간 단축)
+"""
+
+import logging
+import threading
+from dataclasses import asdict, replace
+
+import httpx
+from PySide6.QtCore import QObject
+from PySide6.QtCore import Signal as pyqtSignal
+
+from app.core.config import CrawlConfig
+from app.core.errors import LoginError, StoreEnumerationError
+from app.core.logging import log_context
+from app.core.retry import RetryBudget, RetryPolicy
+from app.infra.browser import get_browser_pool
+from app.infra.smartplace_graphql import CircuitBreaker, RequestLimiter
+from app.services.account_scheduler import AccountScheduler
+from app.services.accounts import Account, account_storage_path
+from app.services.checkpoint import (
+    STAGE_CRAWLED,
+    STAGE_ENUMERATED,
+    STAGE_GENERATED,
+    STAGE_SUBMITTED,
+    RunCheckpointStore,
+)
+from app.services.login_service import LoginResult, NaverLoginService
+from app.services.reply_generator import ReplyConfig, ReplyGenerator, ReviewReplyPair
+from app.services.reply_history import ReplyHistoryStore
+from app.services.review_crawler import CrawlResult, ReviewCrawler, StoreCrawlResult
+from app.services.stop_signal import StopSignal
+from app.services.store_enumerator import StoreEnumerator
+from app.services.submitter import (
+    AsyncReplySubmitter,
+    StoreSubmission,
+    SubmissionResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# UI 로그 수준 → logging 수준
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "SUCCESS": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+
+def _record_log(level: str, message: str) -> None:
+    """UI로 보내는 실행 로그를 파일에도 남깁니다. (발생한 스레드의 식별자 포함)"""
+    logger.log(_LOG_LEVELS.get(level, logging.INFO), message)
+
+
+class LoginWorker(QObject):
+    """로그인 과정을 처리하는 워커"""
+
+    finished = pyqtSignal()
+    success = pyqtSignal(LoginResult)
+    failure = pyqtSignal(str)
+
+    def __init__(self, user_id: str, password: str, force_credential_login: bool):
+        super().__init__()
+        self._user_id = user_id
+        self._password = password
+        self._force_credential_login = force_credential_login
+        # 계정마다 쿠키/CSRF 토큰을 따로 저장하고, 브라우저는 계정 간에 재사용
+        self._login_service = NaverLoginService(
+            storage_path=account_storage_path(user_id),
+            headless=False,
+            pool=get_browser_pool(headless=False),
+        )
+
+    def run(self) -> None:
+        """로그인 실행"""
+        try:
+            result = self._login_service.login(
+                self._user_id, self._password, self._force_credential_login
+            )
+            if result.success:
+                self.success.emit(result)
+            else:
+                self.failure.emit(result.message)
+        except Exception as e:
+            self.failure.emit(f"알 수 없는 오류 발생: {e}")
+        finally:
+            self.finished.emit()
+
+
+class OrchestrationWorker(QObject):
+    """전체 실행 흐름(열거->크롤링->답변생성->제출)을 관리하는 워커"""
+
+    finished = pyqtSignal()
+    success = pyqtSignal(CrawlResult)
+    failure = pyqtSignal(str)
+    log_emitted = pyqtSignal(str, str)
+    progress = pyqtSignal(int, int)
+    counts = pyqtSignal(int, int, int)
+    reply_generation_started = pyqtSignal()
+    reply_submission_started = pyqtSignal()
+    reviews_collected = pyqtSignal(CrawlResult)
+    reply_partial = pyqtSignal(str, str)
+
+    def __init__(
+        self,
+        config: CrawlConfig,
+        stop_signal: StopSignal | None = None,
+        breaker: CircuitBreaker | None = None,
+        limiter: RequestLimiter | None = None,
+    ) -> None:
+        super().__init__()
+        self._config = config
+        self._stop_signal = stop_signal
+        self._login_service = NaverLoginService(
+            storage_path=account_storage_path(config.user_id),
+            headless=not config.browser_visible,
+        )
+        self._checkpoints = RunCheckpointStore()
+        self._run_id = config.run_id or RunCheckpointStore.new_run_id()
+        # 수집/생성/제출이 하나의 재시도 예산을 공유
+        self._retry_policy = RetryPolicy(budget=RetryBudget(config.retry_budget))
+        # 수집/제출이 같은 SmartPlace 엔드포인트 장애 상태를 공유
+        # (여러 계정 실행 시에는 모든 계정이 공유)
+        self._breaker = breaker or CircuitBreaker("SmartPlace GraphQL")
+        # 여러 계정 실행 시 계정별/전체 동시 요청 수 제한
+        self._limiter = limiter
+        # 수신 객체가 없는 함수이므로 시그널을 보낸 워커 스레드에서 바로 호출됨
+        self.log_emitted.connect(_record_log)
+
+    def run(self) -> None:
+        """실행 ID/계정을 로그 컨텍스트로 지정하고 실행합니다."""
+        with log_context(run_id=self._run_id, account_id=self._config.user_id):
+            self._run()
+
+    def _run(self) -> None:
+        """실행의 메인 로직"""
+        try:
+            self._checkpoints.start_run(
+                self._run_id, self._config.business_ids, self._config.user_id
+            )
+            self.log_emitted.emit("INFO", f"실행 ID: {self._run_id}")
+
+            # 1. 인증된 HTTP 클라이언트 생성 (로그인은 이미 완료되었다고 가정)
+            self.log_emitted.emit(
+                "INFO", "저장된 인증 정보로 API 클라이언트를 생성합니다."
+            )
+            client = self._login_service.get_authenticated_client()
+
+            try:
+                # 2. 가게 ID 매핑
+                enumerator = StoreEnumerator(client)
+                store_mappings = []
+                total_stores = len(self._config.business_ids)
+                self.log_emitted.emit(
+                    "INFO", f"{total_stores}개 사업장의 ID를 확인합니다."
+                )
+                for i, booking_id in enumerate(self._config.business_ids):
+                    self.progress.emit(i, total_stores)
+                    saved_map = self._checkpoints.load_stage(
+                        self._run_id, booking_id, STAGE_ENUMERATED
+                    )
+                    if saved_map:
+                        store_mappings.append({"booking_id": booking_id, **saved_map})
+                        continue
+                    try:
+                        id_map = enumerator.get_store_ids(
+                            booking_business_id=booking_id, user_id=self._config.user_id
+                        )
+                        store_mappings.append({"booking_id": booking_id, **id_map})
+                        self._checkpoints.save_stage(
+                            self._run_id, booking_id, STAGE_ENUMERATED, id_map
+                        )
+                    except StoreEnumerationError as e:
+                        self.log_emitted.emit(
+                            "ERROR", f"사업장 ID '{booking_id}' 확인 실패: {e}"
+                        )
+                        continue
+
+                self.progress.emit(total_stores, total_stores)
+                if not store_mappings:
+                    raise ValueError("리뷰를 수집할 유효한 사업장이 없습니다.")
+
+                # 3. 리뷰 크롤링
+                crawl_result = self._crawl_reviews(client, store_mappings)
+                self.reviews_collected.emit(crawl_result)
+
+                # 4. 답변 생성 (활성화된 경우)
+                if self._config.enable_reply_generation:
+                    if self._config.use_reply_history:
+                        self._refresh_reply_history(client, store_mappings)
+                    self.reply_generation_started.emit()
+                    crawl_result = self._generate_replies(crawl_result)
+
+                # 5. 답변 제출 (활성화된 경우)
+                if self._config.auto_submit_replies and crawl_result:
+                    self.reply_submission_started.emit()
+                    self._submit_replies(crawl_result, client)
+
+                if self._is_run_complete(crawl_result, len(store_mappings)):
+                    self._checkpoints.mark_completed(self._run_id)
+
+                # 6. 결과 처리
+                self.success.emit(crawl_result)
+
+            finally:
+                # HTTP 클라이언트 세션 종료
+                client.close()
+
+        except LoginError as exc:
+            self.log_emitted.emit(
+                "ERROR", "로그인 정보가 유효하지 않습니다. 다시 로그인해주세요."
+            )
+            self.failure.emit(str(exc))
+        except Exception as exc:
+            self.failure.emit(str(exc))
+        finally:
+            self.finished.emit()
+
+    def _refresh_reply_history(
+        self, client: httpx.Client, store_mappings: list[dict[str, str]]
+    ) -> None:
+        """하루 이상 지난 매장만 답글 달린 리뷰를 수집해 과거 답변 색인을 갱신합니다."""
+        stale = [
+            store_map
+            for store_map in store_mappings
+            if ReplyHistoryStore(store_map["place_id"]).is_stale()
+        ]
+        if not stale:
+            return
+
+        self.log_emitted.emit(
+            "INFO", f"{len(stale)}개 매장의 과거 답변을 수집해 예시 색인을 갱신합니다."
+        )
+        try:
+            crawler = ReviewCrawler(
+                client,
+                self._stop_signal,
+                self._retry_policy,
+                self._breaker,
+                self._limiter,
+                self._config.user_id,
+            )
+            answered = crawler.fetch_reviews(
+                stores=stale, log=self.log_emitted.emit, has_reply=True, page_size=50
+            )
+        except Exception as e:
+            # 예시 색인은 부가 기능이므로 실패해도 답변 생성은 계속 진행
+            self.log_emitted.emit("WARNING", f"과거 답변 수집 실패: {e}")
+            return
+
+        for store in answered.stores:
+            if store.error:
+                continue
+            added = ReplyHistoryStore(store.place_id).ingest(store.reviews)
+            self.log_emitted.emit(
+                "INFO", f"매장 '{store.booking_id}' 과거 답변 {added}건을 새로 색인했습니다."
+            )
+
+    def _crawl_reviews(
+        self, client: httpx.Client, store_mappings: list[dict[str, str]]
+    ) -> CrawlResult:
+        """체크포인트에 없는 매장만 리뷰를 수집하고, 나머지는 복원합니다."""
+        restored: dict[str, StoreCrawlResult] = {}
+        pending = []
+        for store_map in store_mappings:
+            saved = self._checkpoints.load_stage(
+                self._run_id, store_map["booking_id"], STAGE_CRAWLED
+            )
+            if saved is None:
+                pending.append(store_map)
+                continue
+            restored[store_map["booking_id"]] = StoreCrawlResult(
+                booking_id=store_map["booking_id"],
+                place_id=store_map["place_id"],
+                place_seq=store_map["place_seq"],
+                review_count=len(saved["reviews"]),
+                reviews=saved["reviews"],
+            )
+
+        if restored:
+            self.log_emitted.emit(
+                "INFO", f"{len(restored)}개 매장의 수집 결과를 체크포인트에서 복원했습니다."
+            )
+
+        fetched: dict[str, StoreCrawlResult] = {}
+        if pending:
+            crawler = ReviewCrawler(
+                client,
+                self._stop_signal,
+                self._retry_policy,
+                self._breaker,
+                self._limiter,
+                self._config.user_id,
+            )
+            for store in crawler.fetch_reviews(
+                stores=pending, log=self.log_emitted.emit
+            ).stores:
+                fetched[store.booking_id] = store
+                if store.error is None:
+                    self._checkpoints.save_stage(
+                        self._run_id,
+                        store.booking_id,
+                        STAGE_CRAWLED,
+                        {"reviews": store.reviews},
+                    )
+
+        # 원래 사업장 순서를 유지하며 결과 병합 (중단된 매장은 제외)
+        stores = []
+        for store_map in store_mappings:
+            booking_id = store_map["booking_id"]
+            store = restored.get(booking_id) or fetched.get(booking_id)
+            if store is not None:
+                stores.append(store)
+        return CrawlResult(stores=stores)
+
+    def _generate_replies(self, crawl_result: CrawlResult) -> CrawlResult:
+        """크롤링된 리뷰에 대한 답변을 생성합니다."""
+        self.log_emitted.emit("INFO", "리뷰 답변 생성을 시작합니다.")
+
+        try:
+            # 답변 생성 설정
+            reply_config = ReplyConfig(
+                tone=self._config.tone,
+                business_type=self._config.business_type,
+                openai_api_key=self._config.openai_api_key,
+                custom_prompt=self._config.custom_prompt,
+                batch_size=self._config.reply_batch_size,
+                length_limit=self._config.reply_length_limit,
+                enable_template_replies=self._config.enable_template_replies,
+                priority_model=self._config.priority_model or None,
+                banned_words=self._config.banned_words,
+                history_examples=3 if self._config.use_reply_history else 0,
+                provider=self._config.llm_provider,
+                model=self._config.llm_model,
+                base_url=self._config.llm_base_url or None,
+                fallback_backends=self._config.llm_fallbacks,
+                retry_policy=self._retry_policy,
+            )
+
+            # 답변 생성기는 실제로 생성할 매장이 있을 때 초기화
+            reply_generator = None
+
+            # 각 매장별로 답변 생성
+            for store in crawl_result.stores:
+                if store.error or not store.reviews:
+                    continue
+
+                saved = self._checkpoints.load_stage(
+                    self._run_id, store.booking_id, STAGE_GENERATED
+                )
+                if saved is not None:
+                    store.generated_replies = [
+                        ReviewReplyPair(**pair) for pair in saved["replies"]
+                    ]
+                    self.log_emitted.emit(
+                        "INFO",
+                        f"매장 '{store.booking_id}' 생성된 답변을 체크포인트에서 복원했습니다.",
+                    )
+                    continue
+
+                if self._stop_signal and self._stop_signal.is_set():
+                    self.log_emitted.emit("INFO", "답변 생성이 중단되었습니다.")
+                    break
+
+                with log_context(store_id=store.booking_id):
+                    if reply_generator is None:
+                        reply_generator = ReplyGenerator(reply_config)
+
+                    self.log_emitted.emit(
+                        "INFO", f"매장 '{store.booking_id}' 리뷰 답변 생성 중..."
+                    )
+
+                    # 답변 생성
+                    reply_pairs = reply_generator.generate_batch(
+                        reviews=store.reviews,
+                        log=self.log_emitted.emit,
+                        on_partial=self.reply_partial.emit,
+                    )
+
+                    # 생성된 답변을 매장 데이터에 추가
+                    store.generated_replies = reply_pairs
+                    self._checkpoints.save_stage(
+                        self._run_id,
+                        store.booking_id,
+                        STAGE_GENERATED,
+                        {"replies": [asdict(pair) for pair in reply_pairs]},
+                    )
+
+            self.log_emitted.emit("SUCCESS", "리뷰 답변 생성이 완료되었습니다.")
+            return crawl_result
+
+        except Exception as e:
+            self.log_emitted.emit("ERROR", f"답변 생성 중 오류 발생: {e}")
+            return crawl_result
+
+    def _submit_replies(self, crawl_result: CrawlResult, client: httpx.Client) -> None:
+        """생성된 답변을 네이버 스마트플레이스에 제출합니다."""
+        self.log_emitted.emit("INFO", "리뷰 답변 제출을 시작합니다.")
+
+        try:
+            submissions: list[StoreSubmission] = []
+            stores_by_id: dict[str, StoreCrawlResult] = {}
+            for store in crawl_result.stores:
+                if not hasattr(store, "generated_replies") or store.error:
+                    continue
+
+                # 이전 실행에서 이미 등록된 답변은 다시 제출하지 않음
+                saved = self._checkpoints.load_stage(
+                    self._run_id, store.booking_id, STAGE_SUBMITTED
+                )
+                already_submitted = [
+                    SubmissionResult(**result)
+                    for result in (saved or {}).get("results", [])
+                    if result.get("success")
+                ]
+                submitted_ids = {result.review_id for result in already_submitted}
+
+                # Create a lookup map for review_id -> place_id
+                review_id_to_place_id = {
+                    review['id']: review.get('placeDetail', {}).get('id')
+                    for review in store.reviews
+                }
+
+                # 제출할 답변이 있는 경우만 처리
+                valid_replies = []
+                for reply in store.generated_replies:
+                    if reply.review_id in submitted_ids:
+                        continue
+                    if reply.generated_reply and not reply.error:
+                        specific_place_id = review_id_to_place_id.get(reply.review_id)
+                        valid_replies.append({
+                            "review_id": reply.review_id,
+                            "reply_text": reply.generated_reply,
+                            "place_id": specific_place_id,  # Add the specific place_id
+                        })
+
+                store.submission_results = already_submitted
+                if valid_replies:
+                    submissions.append(
+                        StoreSubmission(
+                            booking_id=store.booking_id,
+                            place_seq=store.place_seq,
+                            reply_pairs=valid_replies,
+                        )
+                    )
+                    stores_by_id[store.booking_id] = store
+
+            if not submissions:
+                self.log_emitted.emit("INFO", "제출할 새 답변이 없습니다.")
+                return
+
+            if self._stop_signal and self._stop_signal.is_set():
+                self.log_emitted.emit("INFO", "답변 제출이 중단되었습니다.")
+                return
+
+            def on_store_done(
+                submission: StoreSubmission, results: list[SubmissionResult]
+            ) -> None:
+                # 매장별로 끝나는 즉시 결과를 병합하고 체크포인트에 기록
+                store = stores_by_id[submission.booking_id]
+                store.submission_results = store.submission_results + results
+                self._checkpoints.save_stage(
+                    self._run_id,
+                    store.booking_id,
+                    STAGE_SUBMITTED,
+                    {
+                        "results": [
+                            asdict(result) for result in store.submission_results
+                        ]
+                    },
+                )
+
+            # 답변 제출기 초기화 (로그인된 API 클라이언트의 쿠키 사용)
+            submitter = AsyncReplySubmitter(
+                client,
+                per_store_concurrency=self._config.submit_per_store_concurrency,
+                global_concurrency=self._config.submit_global_concurrency,
+                stop_signal=self._stop_signal,
+                retry_policy=self._retry_policy,
+                breaker=self._breaker,
+                limiter=self._limiter,
+                limiter_key=self._config.user_id,
+            )
+            submitter.submit_stores(
+                submissions, log=self.log_emitted.emit, on_store_done=on_store_done
+            )
+
+            self.log_emitted.emit("SUCCESS", "리뷰 답변 제출이 완료되었습니다.")
+
+        except Exception as e:
+            self.log_emitted.emit("ERROR", f"답변 제출 중 오류 발생: {e}")
+
+    def _is_run_complete(self, crawl_result: CrawlResult, expected_stores: int) -> bool:
+        """모든 매장이 설정된 마지막 단계까지 완료되었는지 확인합니다."""
+        if self._stop_signal and self._stop_signal.is_set():
+            return False
+        if len(crawl_result.stores) < expected_stores:
+            return False
+
+        # 생성 단계 실행 여부와 같은 조건 (로컬 LLM은 API 키 없이도 생성함)
+        generation_enabled = self._config.enable_reply_generation
+        for store in crawl_result.stores:
+            if store.error:
+                return False
+            if not store.reviews:
+                continue
+            if generation_enabled and not hasattr(store, "generated_replies"):
+                return False
+            if self._config.auto_submit_replies and generation_enabled:
+                submitted_ids = {
+                    result.review_id
+                    for result in getattr(store, "submission_results", [])
+                    if result.success
+                }
+                for reply in store.generated_replies:
+                    if (
+                        reply.generated_reply
+                        and not reply.error
+                        and reply.review_id not in submitted_ids
+                    ):
+                        return False
+        return True
+
+
+class MultiAccountWorker(QObject):
+    """등록된 여러 계정의 실행 흐름을 동시에 관리하는 워커
+
+    계정마다 ``OrchestrationWorker``를 스케줄러 스레드에서 직접 실행하고,
+    로그/진행률/수집 결과를 하나로 모아 단일 실행과 같은 시그널로 전달합니다.
+    """
+
+    finished = pyqtSignal()
+    success = pyqtSignal(CrawlResult)
+    failure = pyqtSignal(str)
+    log_emitted = pyqtSignal(str, str)
+    progress = pyqtSignal(int, int)
+    counts = pyqtSignal(int, int, int)
+    reply_generation_started = pyqtSignal()
+    reply_submission_started = pyqtSignal()
+    reviews_collected = pyqtSignal(CrawlResult)
+    reply_partial = pyqtSignal(str, str)
+
+    def __init__(
+        self,
+        config: CrawlConfig,
+        accounts: list[Account],
+        stop_signal: StopSignal | None = None,
+    ) -> None:
+        super().__init__()
+        self._config = config
+        self._accounts = [account for account in accounts if account.business_ids]
+        self._stop_signal = stop_signal
+        self._checkpoints = RunCheckpointStore()
+        self._breaker = CircuitBreaker("SmartPlace GraphQL")
+        self._lock = threading.Lock()
+        self._progress: dict[str, tuple[int, int]] = {}
+        self._collected: dict[str, CrawlResult] = {}
+
+    def run(self) -> None:
+        """모든 계정을 동시에 실행하고 결과를 병합합니다."""
+        try:
+            if not self._accounts:
+                raise ValueError("사업장이 등록된 계정이 없습니다.")
+
+            scheduler = AccountScheduler(
+                max_parallel_accounts=self._config.max_parallel_accounts,
+                # 계정 하나의 한도는 단일 계정 실행의 전체 동시 제출 수와 같게 유지
+                per_account_concurrency=self._config.submit_global_concurrency,
+                global_concurrency=self._config.global_request_concurrency,
+                stop_signal=self._stop_signal,
+            )
+            results = scheduler.run(
+                self._accounts,
+                lambda account: self._run_account(account, scheduler.limiter),
+                log=self.log_emitted.emit,
+            )
+
+            failed = [result for result in results if not result.success]
+            if len(failed) == len(results):
+                raise RuntimeError(
+                    "모든 계정 실행 실패: "
+                    + "; ".join(f"{r.account_id}: {r.error}" for r in failed)
+                )
+            if failed:
+                self.log_emitted.emit(
+                    "WARNING",
+                    f"{len(failed)}개 계정 실행 실패: "
+                    + ", ".join(result.account_id for result in failed),
+                )
+
+            stores = [
+                store
+                for result in results
+                if result.success
+                for store in result.result.stores
+            ]
+            self.success.emit(CrawlResult(stores=stores))
+        except Exception as exc:
+            self.failure.emit(str(exc))
+        finally:
+            self.finished.emit()
+
+    def _run_account(self, account: Account, limiter: RequestLimiter) -> CrawlResult:
+        """계정 하나의 실행 흐름을 현재(스케줄러) 스레드에서 실행합니다."""
+        name = account.display_name
+        # 계정마다 끝나지 않은 이전 실행이 있으면 자동으로 이어서 진행
+        run_id = (
+            self._checkpoints.find_resumable_run(
+                account.business_ids, account.user_id
+            )
+            or ""
+        )
+        if run_id:
+            self.log_emitted.emit(
+                "INFO", f"[{name}] 이전 실행 '{run_id}'을 이어서 진행합니다."
+            )
+        config = replace(
+            self._config,
+            user_id=account.user_id,
+            password="",
+            business_ids=list(account.business_ids),
+            run_id=run_id,
+        )
+        worker = OrchestrationWorker(
+            config, self._stop_signal, breaker=self._breaker, limiter=limiter
+        )
+        outcome: dict[str, object] = {}
+
+        # 워커 시그널은 발생한 스레드에서 바로 처리
+        worker.log_emitted.connect(
+            lambda level, message: self.log_emitted.emit(level, f"[{name}] {message}")
+        )
+        worker.progress.connect(
+            lambda current, total: self._update_progress(
+                account.user_id, current, total
+            )
+        )
+        worker.reviews_collected.connect(
+            lambda result: self._merge_collected(account.user_id, result)
+        )
+        worker.reply_partial.connect(self.reply_partial.emit)
+        worker.reply_generation_started.connect(self.reply_generation_started.emit)
+        worker.reply_submission_started.connect(self.reply_submission_started.emit)
+        worker.success.connect(lambda result: outcome.update(result=result))
+        worker.failure.connect(lambda error: outcome.update(error=error))
+
+        worker.run()
+        if "error" in outcome:
+            raise RuntimeError(outcome["error"])
+        self.log_emitted.emit("SUCCESS", f"[{name}] 실행이 완료되었습니다.")
+        return outcome["result"]
+
+    def _update_progress(self, account_id: str, current: int, total: int) -> None:
+        # 계정별 사업장 진행률을 합산해 하나의 진행률로 표시
+        with self._lock:
+            self._progress[account_id] = (current, total)
+            done = sum(value[0] for value in self._progress.values())
+            expected = sum(len(account.business_ids) for account in self._accounts)
+        self.progress.emit(done, expected)
+
+    def _merge_collected(self, account_id: str, result: CrawlResult) -> None:
+        # 지금까지 수집이 끝난 계정들의 결과를 합쳐 화면에 표시
+        with self._lock:
+            self._collected[account_id] = result
+            merged = CrawlResult(
+                stores=[
+                    store
+                    for account in self._accounts
+                    if account.user_id in self._collected
+                    for store in self._collected[account.user_id].stores
+                ]
+            )
+        self.reviews_collected.emit(merged)
@@ -2,6 +2,13 @@
 유틸리티 모듈
 """
 
-from .dev_watcher import DevWatcher
-
 __all__ = ["DevWatcher"]
+
+
+def __getattr__(name: str):
+    # watchdog은 개발 모드에서만 필요하므로 앱 시작 시 불러오지 않음
+    if name == "DevWatcher":
+        from .dev_watcher import DevWatcher
+
+        return DevWatcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,31 +2,55 @@
 개발 모드 파일 감시자 - 코드 변경 시 자동 재시작
 """
 
+import fnmatch
 import os
+import re
 import sys
 import time
 import subprocess
 import threading
 import logging
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, List, Optional, Pattern, Set
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+from app.core.config import STYLE_RELOAD_ENV
+
 logger = logging.getLogger(__name__)
 
 
+# 재시작 없이 스타일시트만 다시 적용하면 되는 파일
+DEFAULT_STYLE_PATTERNS = ["*.qss", "*/ui/styles/main_style.py"]
+
+
+def compile_globs(patterns: List[str]) -> Pattern[str]:
+    """glob 목록을 하나의 정규식으로 미리 컴파일합니다."""
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
 class CodeChangeHandler(FileSystemEventHandler):
-    """파일 변경 이벤트 핸들러"""
+    """파일 변경 이벤트 핸들러
+
+    변경을 바로 처리하지 않고 ``debounce_delay``초 동안 추가 변경이 없을 때까지
+    모아서 한 번에 처리합니다. (계속 바뀌어도 ``max_delay``초 안에는 처리)
+    모인 변경이 모두 스타일 파일이고 ``style_callback``이 있으면 재시작 대신
+    스타일만 다시 적용합니다.
+    """
 
     def __init__(
         self,
         restart_callback,
         watch_extensions: Set[str] = None,
         ignore_patterns: List[str] = None,
+        style_callback=None,
+        style_patterns: List[str] = None,
+        debounce_delay: float = 0.3,
+        max_delay: float = 2.0,
     ):
         super().__init__()
         self.restart_callback = restart_callback
+        self.style_callback = style_callback
         self.watch_extensions = watch_extensions or {
             ".py",
             ".ui",
@@ -47,70 +71,96 @@ class CodeChangeHandler(FileSystemEventHandler):
             ".coverage",
             "dist",
             "build",
+            "*.tmp",
+            "*~",
         ]
-        self.last_restart = 0
-        self.restart_delay = 1.0  # 1초 내 중복 재시작 방지
+        # 경로의 각 구성 요소(디렉터리/파일 이름)에 대해 검사
+        self._ignore_regex = compile_globs(self.ignore_patterns)
+        self._style_regex = compile_globs(style_patterns or DEFAULT_STYLE_PATTERNS)
+        self.debounce_delay = debounce_delay
+        self.max_delay = max_delay
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, str] = {}
+        self._first_change = 0.0
+        self._timer: Optional[threading.Timer] = None
 
     def should_ignore(self, path: str) -> bool:
         """파일이 무시 대상인지 확인"""
-        path_str = str(path)
+        try:
+            path_obj = Path(os.path.relpath(path))
+        except ValueError:  # 다른 드라이브(Windows)
+            path_obj = Path(path)
 
         # 확장자 체크
-        if Path(path).suffix not in self.watch_extensions:
+        if path_obj.suffix not in self.watch_extensions:
             return True
 
         # 무시 패턴 체크
-        for pattern in self.ignore_patterns:
-            if pattern in path_str:
-                return True
+        return any(self._ignore_regex.match(part) for part in path_obj.parts)
 
-        return False
+    def is_style_file(self, path: str) -> bool:
+        """스타일시트만 다시 적용하면 되는 파일인지 확인"""
+        return bool(self._style_regex.match(Path(path).as_posix()))
 
     def on_modified(self, event):
         """파일 수정 이벤트"""
-        if event.is_directory:
-            return
-
-        if self.should_ignore(event.src_path):
-            return
-
-        self.trigger_restart(event.src_path, "수정됨")
+        self._handle(event, event.src_path, "수정됨")
 
     def on_created(self, event):
         """파일 생성 이벤트"""
-        if event.is_directory:
-            return
-
-        if self.should_ignore(event.src_path):
-            return
-
-        self.trigger_restart(event.src_path, "생성됨")
+        self._handle(event, event.src_path, "생성됨")
 
     def on_deleted(self, event):
         """파일 삭제 이벤트"""
-        if event.is_directory:
-            return
+        self._handle(event, event.src_path, "삭제됨")
 
-        if self.should_ignore(event.src_path):
-            return
+    def on_moved(self, event):
+        """파일 이동 이벤트 (임시 파일로 저장 후 이름을 바꾸는 편집기 대응)"""
+        self._handle(event, event.dest_path, "수정됨")
 
-        self.trigger_restart(event.src_path, "삭제됨")
+    def _handle(self, event, path: str, action: str):
+        if event.is_directory or self.should_ignore(path):
+            return
+        self.trigger_restart(path, action)
 
     def trigger_restart(self, file_path: str, action: str):
-        """재시작 트리거"""
-        current_time = time.time()
-
-        # 중복 재시작 방지
-        if current_time - self.last_restart < self.restart_delay:
+        """변경을 모으고 디바운스 타이머를 다시 시작합니다."""
+        with self._lock:
+            now = time.monotonic()
+            if not self._pending:
+                self._first_change = now
+            self._pending[file_path] = action
+
+            if self._timer:
+                self._timer.cancel()
+            delay = min(
+                self.debounce_delay,
+                max(0.0, self._first_change + self.max_delay - now),
+            )
+            self._timer = threading.Timer(delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """모인 변경을 한 번에 처리합니다."""
+        with self._lock:
+            changes, self._pending = self._pending, {}
+            self._timer = None
+        if not changes:
             return
 
-        self.last_restart = current_time
+        for path, action in changes.items():
+            relative_path = os.path.relpath(path)
+            logger.info(f"파일 변경 감지: {relative_path} ({action})")
+            print(f"🔄 파일 변경 감지: {relative_path} ({action})")
 
-        relative_path = os.path.relpath(file_path)
-        logger.info(f"파일 변경 감지: {relative_path} ({action})")
-        print(f"🔄 파일 변경 감지: {relative_path} ({action})")
-        print("   프로그램을 재시작합니다...")
+        if self.style_callback and all(self.is_style_file(p) for p in changes):
+            print("   스타일시트를 다시 적용합니다...")
+            self.style_callback(list(changes))
+            return
 
+        print("   프로그램을 재시작합니다...")
         # 재시작 콜백 호출
         if self.restart_callback:
             self.restart_callback()
@@ -125,6 +175,9 @@ class DevWatcher:
         self.observer = None
         self.process = None
         self.running = False
+        # 스타일 변경을 자식 프로세스에 알리는 표시 파일
+        self.style_reload_file = Path("runs/dev/style_reload").resolve()
+        self._restart_lock = threading.Lock()
 
         # 로거 설정
         self.setup_logging()
@@ -144,8 +197,10 @@ class DevWatcher:
 
         try:
             logger.info(f"프로세스 시작: {' '.join(self.restart_command)}")
+            env = {**os.environ, STYLE_RELOAD_ENV: str(self.style_reload_file)}
             self.process = subprocess.Popen(
                 self.restart_command,
+                env=env,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 universal_newlines=True,
@@ -199,9 +254,21 @@ class DevWatcher:
 
     def restart_process(self):
         """프로세스 재시작"""
-        self.stop_process()
-        time.sleep(0.5)  # 잠시 대기
-        self.start_process()
+        # 디바운스 타이머 스레드에서 호출되므로 재시작이 겹치지 않게 함
+        with self._restart_lock:
+            self.stop_process()
+            time.sleep(0.5)  # 잠시 대기
+            self.start_process()
+
+    def reload_styles(self, changed_paths: List[str]):
+        """실행 중인 앱에 스타일시트 재적용을 알림 (재시작 없음)"""
+        if not self.process or self.process.poll() is not None:
+            self.restart_process()
+            return
+        self.style_reload_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.style_reload_file.with_suffix(".tmp")
+        tmp_path.write_text("\n".join(changed_paths), encoding="utf-8")
+        os.replace(tmp_path, self.style_reload_file)
 
     def start_watching(self):
         """파일 감시 시작"""
@@ -212,7 +279,9 @@ class DevWatcher:
         self.running = True
 
         # 이벤트 핸들러 생성
-        handler = CodeChangeHandler(self.restart_process)
+        handler = CodeChangeHandler(
+            self.restart_process, style_callback=self.reload_styles
+        )
 
         # Observer 생성 및 설정
         self.observer = Observer()
@@ -261,7 +330,7 @@ class DevWatcher:
         print("🚀 네이버 스마트플레이스 리뷰 자동응답 - 개발 모드")
         print("=" * 60)
         print("📁 감시 중인 디렉토리:", ", ".join(self.watch_dirs))
-        print("🔄 파일 변경 시 자동 재시작됩니다")
+        print("🔄 파일 변경 시 자동 재시작됩니다 (스타일 변경은 재시작 없이 적용)")
         print("⏹️  중지하려면 Ctrl+C를 눌러주세요")
         print("=" * 60)
 
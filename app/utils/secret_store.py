@@ -0,0 +1,169 @@
+"""In-memory cache for credentials stored under ``.auth/``.
+
+``SecretStore`` is the single access point for the OpenAI API key, the
+Naver session cookies (Playwright storage state) and the SmartPlace CSRF
+token. Each file is read and decrypted once, then served from memory until
+its mtime or size changes, so repeated runs do no redundant disk I/O or JSON
+parsing.
+
+When the optional ``cryptography`` package is installed, files are written
+encrypted with Fernet using a key in ``.auth/secret.key``. Plain JSON files
+written by earlier versions are still read, and they are encrypted the next
+time they are saved. Without ``cryptography`` the files stay plain JSON, as
+before.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+CRYPTO_AVAILABLE = find_spec("cryptography") is not None
+
+DEFAULT_AUTH_DIR = Path(".auth")
+OPENAI_KEY_FILE = "openai_api.json"
+KEY_FILE = "secret.key"
+
+# 세션에 함께 저장되는 CSRF 토큰 쿠키 이름
+CSRF_COOKIE_NAME = "csrf_token"
+
+# Fernet 토큰은 항상 이 접두사로 시작 (버전 바이트 0x80의 base64)
+_FERNET_PREFIX = b"gAAAAA"
+
+
+class SecretStore:
+    """암호화된 자격 증명 파일을 한 번만 읽어 메모리에 캐시합니다. (스레드 안전)"""
+
+    def __init__(self, auth_dir: Path | str = DEFAULT_AUTH_DIR) -> None:
+        self.auth_dir = Path(auth_dir)
+        self._lock = threading.Lock()
+        # 경로 → ((mtime_ns, size), 데이터)
+        self._cache: dict[Path, tuple[tuple[int, int], Any]] = {}
+        self._fernet = None
+
+    # -- 공통 ------------------------------------------------------------
+
+    def read_json(self, path: Path | str) -> Any | None:
+        """파일을 복호화해 JSON으로 반환합니다. 파일이 없거나 읽을 수 없으면 None."""
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            with self._lock:
+                self._cache.pop(path, None)
+            return None
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            try:
+                data = json.loads(self._decrypt(path.read_bytes()))
+            except (OSError, ValueError):
+                return None
+            self._cache[path] = (signature, data)
+            return data
+
+    def write_json(self, path: Path | str, data: Any) -> None:
+        """JSON을 (가능하면 암호화해) 원자적으로 저장하고 캐시를 갱신합니다."""
+        path = Path(path)
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_bytes(self._encrypt(payload))
+            os.replace(tmp_path, path)
+            stat = path.stat()
+            self._cache[path] = ((stat.st_mtime_ns, stat.st_size), data)
+
+    def invalidate(self, path: Path | str | None = None) -> None:
+        """캐시를 비웁니다. (경로를 주면 해당 파일만)"""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(Path(path), None)
+
+    # -- OpenAI API 키 -------------------------------------------------------
+
+    def openai_api_key(self) -> str | None:
+        """저장된 OpenAI API 키. 없으면 환경변수 ``OPENAI_API_KEY``."""
+        data = self.read_json(self.auth_dir / OPENAI_KEY_FILE)
+        if isinstance(data, dict) and data.get("api_key"):
+            return data["api_key"]
+        return os.getenv("OPENAI_API_KEY")
+
+    def set_openai_api_key(self, api_key: str) -> None:
+        self.write_json(self.auth_dir / OPENAI_KEY_FILE, {"api_key": api_key})
+
+    # -- 네이버 세션 ---------------------------------------------------------
+
+    def storage_state(self, path: Path | str) -> dict | None:
+        """Playwright storage state(쿠키/로컬스토리지). 없으면 None."""
+        data = self.read_json(path)
+        return data if isinstance(data, dict) else None
+
+    def cookies(self, path: Path | str) -> list[dict]:
+        state = self.storage_state(path) or {}
+        return list(state.get("cookies", []))
+
+    def csrf_token(self, path: Path | str) -> str | None:
+        for cookie in self.cookies(path):
+            if cookie.get("name") == CSRF_COOKIE_NAME and cookie.get("value"):
+                return cookie["value"]
+        return None
+
+    # -- 암호화 ------------------------------------------------------------
+
+    def _get_fernet(self):
+        if self._fernet is None:
+            from cryptography.fernet import Fernet
+
+            key_path = self.auth_dir / KEY_FILE
+            try:
+                key = key_path.read_bytes().strip()
+            except FileNotFoundError:
+                key = Fernet.generate_key()
+                key_path.parent.mkdir(parents=True, exist_ok=True)
+                # 소유자만 읽을 수 있게 생성
+                fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(key)
+            self._fernet = Fernet(key)
+        return self._fernet
+
+    def _encrypt(self, payload: bytes) -> bytes:
+        if not CRYPTO_AVAILABLE:
+            return payload
+        return self._get_fernet().encrypt(payload)
+
+    def _decrypt(self, raw: bytes) -> bytes:
+        # 암호화 이전 버전이 남긴 평문 JSON도 그대로 읽음
+        if not raw.startswith(_FERNET_PREFIX):
+            return raw
+        if not CRYPTO_AVAILABLE:
+            raise ValueError("cryptography 패키지가 없어 암호화된 파일을 읽을 수 없습니다.")
+        from cryptography.fernet import InvalidToken
+
+        try:
+            return self._get_fernet().decrypt(raw)
+        except InvalidToken as e:
+            raise ValueError(f"자격 증명 파일을 복호화할 수 없습니다: {e}") from e
+
+
+_store: SecretStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_secret_store() -> SecretStore:
+    """앱 전체에서 공유하는 ``SecretStore``를 반환합니다."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SecretStore()
+        return _store
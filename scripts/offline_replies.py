@@ -0,0 +1,121 @@
+"""Answer the reviews of a checkpointed run overnight with the OpenAI Batch API.
+
+Submit the crawled reviews of an unfinished run, then collect the replies
+once the batch job is done. Resuming the run in the app afterwards skips
+generation and submits the collected replies.
+
+    python scripts/offline_replies.py submit --run-id 20250101-220000-ab12cd
+    python scripts/offline_replies.py collect --run-id 20250101-220000-ab12cd
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# "python scripts/offline_replies.py"로 실행해도 app 패키지를 찾도록 함
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.core.config import load_config  # noqa: E402
+from app.services.checkpoint import (  # noqa: E402
+    DEFAULT_CHECKPOINT_DIR,
+    RunCheckpointStore,
+)
+from app.services.offline_replies import collect_run, submit_run  # noqa: E402
+from app.services.reply_generator import (  # noqa: E402
+    DEFAULT_BATCH_DIR,
+    ReplyConfig,
+    ReplyGenerator,
+)
+from app.utils.auth import get_openai_api_key  # noqa: E402
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Generate replies for a checkpointed run with the Batch API.",
+    )
+    parser.add_argument("command", choices=["submit", "collect"])
+    parser.add_argument("--run-id", required=True, help="Run ID under runs/checkpoints")
+    parser.add_argument(
+        "--checkpoint-dir",
+        default=str(DEFAULT_CHECKPOINT_DIR),
+        help=f"Checkpoint directory (default: {DEFAULT_CHECKPOINT_DIR})",
+    )
+    parser.add_argument(
+        "--batch-dir",
+        default=str(DEFAULT_BATCH_DIR),
+        help=f"Directory for batch input files (default: {DEFAULT_BATCH_DIR})",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=60.0,
+        help="Seconds between batch status checks when collecting (default: 60)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Give up collecting after this many seconds (default: wait)",
+    )
+    return parser
+
+
+def build_generator() -> ReplyGenerator:
+    """저장된 사용자 설정으로 답변 생성기를 만듭니다."""
+    settings = load_config()
+    return ReplyGenerator(
+        ReplyConfig(
+            tone=settings.tone,
+            business_type=settings.business_type,
+            openai_api_key=get_openai_api_key() or "",
+            custom_prompt=settings.custom_prompt,
+            length_limit=settings.length_limit,
+            enable_template_replies=settings.template_replies,
+            priority_model=settings.priority_model or None,
+            banned_words=list(settings.banned_words),
+            history_examples=3 if settings.use_reply_history else 0,
+            provider=settings.llm_provider,
+            model=settings.llm_model,
+            base_url=settings.llm_base_url or None,
+            fallback_backends=[dict(f) for f in settings.llm_fallbacks],
+        )
+    )
+
+
+def log(level: str, message: str) -> None:
+    print(f"[{level}] {message}")
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    generator = build_generator()
+    checkpoints = RunCheckpointStore(args.checkpoint_dir)
+    batch_dir = Path(args.batch_dir)
+
+    if args.command == "submit":
+        submit_run(args.run_id, generator, checkpoints, batch_dir, log=log)
+        return 0
+
+    try:
+        collect_run(
+            args.run_id,
+            generator,
+            checkpoints,
+            batch_dir,
+            poll_interval=args.poll_interval,
+            timeout=args.timeout,
+            log=log,
+        )
+    except (FileNotFoundError, TimeoutError) as e:
+        log("ERROR", str(e))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
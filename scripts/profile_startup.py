@@ -0,0 +1,140 @@
+"""Import-time benchmark for the GUI cold start.
+
+Runs ``python -X importtime`` on the modules loaded before the main window is
+shown, prints the slowest imports and fails when the total exceeds the budget
+or when a module that should load lazily (OpenAI SDK, Playwright, httpx,
+NumPy, watchdog) is imported at startup.
+
+    python scripts/profile_startup.py
+    python scripts/profile_startup.py --budget-ms 800 --top 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# 메인 윈도우 표시 전에 불러오는 모듈
+STARTUP_MODULES = ["app.main", "app.ui.main_window"]
+
+# 첫 사용 시에만 불러와야 하는 무거운 모듈
+LAZY_MODULES = ["openai", "playwright", "httpx", "numpy", "watchdog"]
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Profile import time of the GUI startup path.",
+    )
+    parser.add_argument(
+        "--modules",
+        nargs="+",
+        default=STARTUP_MODULES,
+        help="Modules imported before the main window is shown",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=1500.0,
+        help="Fail if the total import time exceeds this (default: 1500)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of slowest top-level imports to print (default: 20)",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="Repeat and keep the fastest run to reduce noise (default: 3)",
+    )
+    return parser
+
+
+def profile_imports(modules: list[str]) -> list[ImportTiming]:
+    """새 인터프리터에서 ``-X importtime`` 출력을 수집합니다."""
+    env = {**os.environ, "PYTHONPATH": str(ROOT), "QT_QPA_PLATFORM": "offscreen"}
+    statement = "; ".join(f"import {module}" for module in modules)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+
+    timings = []
+    for line in completed.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        timings.append(
+            ImportTiming(name.strip(), int(self_us), int(cumulative_us), depth)
+        )
+    return timings
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+
+    best: list[ImportTiming] | None = None
+    best_total = float("inf")
+    for _ in range(max(1, args.runs)):
+        timings = profile_imports(args.modules)
+        total = sum(t.cumulative_us for t in timings if t.depth == 0)
+        if total < best_total:
+            best, best_total = timings, total
+
+    assert best is not None
+    top_level = sorted(
+        (t for t in best if t.depth == 0), key=lambda t: t.cumulative_us, reverse=True
+    )
+    print(f"{'cumulative ms':>14}  {'self ms':>8}  module")
+    for timing in top_level[: args.top]:
+        print(
+            f"{timing.cumulative_us / 1000:>14.1f}  {timing.self_us / 1000:>8.1f}  "
+            f"{timing.module}"
+        )
+
+    total_ms = best_total / 1000
+    print(f"\nTotal startup import time: {total_ms:.1f} ms (budget {args.budget_ms} ms)")
+
+    failed = False
+    eager = sorted(
+        {
+            t.module.split(".")[0]
+            for t in best
+            if t.module.split(".")[0] in LAZY_MODULES
+        }
+    )
+    if eager:
+        print(f"FAIL: imported at startup but should be lazy: {', '.join(eager)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print("FAIL: startup import time is over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+"""AccountRegistry persistence and AccountScheduler parallel runs."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from app.services.account_scheduler import AccountScheduler  # noqa: E402
+from app.services.accounts import (  # noqa: E402
+    Account,
+    AccountRegistry,
+    account_storage_path,
+)
+from app.services.stop_signal import StopSignal  # noqa: E402
+
+
+def test_registry_upsert_persists_and_updates_only_given_fields(tmp_path):
+    path = tmp_path / "accounts.json"
+    registry = AccountRegistry(path)
+    registry.upsert("owner1", business_ids=["1", "2", "1"], label="본점")
+    registry.upsert("owner2", business_ids=["3"])
+    registry.upsert("owner1", enabled=False)
+
+    reloaded = AccountRegistry(path)
+    assert len(reloaded) == 2
+    owner1 = reloaded.get("owner1")
+    assert owner1.business_ids == ["1", "2"]
+    assert owner1.display_name == "본점"
+    assert owner1.enabled is False
+    assert [a.user_id for a in reloaded.list(enabled_only=True)] == ["owner2"]
+
+    reloaded.remove("owner2")
+    assert AccountRegistry(path).get("owner2") is None
+
+
+def test_registry_skips_invalid_entries_and_broken_files(tmp_path):
+    path = tmp_path / "accounts.json"
+    path.write_text(
+        json.dumps({"accounts": [{"label": "아이디 없음"}, {"user_id": 42}]}),
+        encoding="utf-8",
+    )
+    registry = AccountRegistry(path)
+    assert [a.user_id for a in registry.list()] == ["42"]
+
+    path.write_text("{broken", encoding="utf-8")
+    assert len(AccountRegistry(path)) == 0
+
+
+def test_storage_path_is_per_account_and_filesystem_safe(tmp_path):
+    first = account_storage_path("owner@naver.com", tmp_path)
+    second = account_storage_path("other/owner", tmp_path)
+    assert first.parent != second.parent
+    assert first.parent.parent == second.parent.parent == tmp_path
+    assert first.name == "cookies.json"
+
+
+def test_scheduler_runs_accounts_in_parallel_and_keeps_order():
+    accounts = [Account("a"), Account("b"), Account("c")]
+    barrier = threading.Barrier(3, timeout=5)
+
+    def run_account(account: Account) -> str:
+        # 세 계정이 동시에 실행 중이어야 통과
+        barrier.wait()
+        if account.user_id == "b":
+            raise RuntimeError("로그인 실패")
+        return account.user_id.upper()
+
+    scheduler = AccountScheduler(max_parallel_accounts=3)
+    results = scheduler.run(accounts, run_account)
+
+    assert [r.account_id for r in results] == ["a", "b", "c"]
+    assert [r.result for r in results] == ["A", None, "C"]
+    assert not results[1].success
+    assert results[1].error == "로그인 실패"
+    assert scheduler.limiter._waiters is None
+
+
+def test_scheduler_skips_accounts_after_stop():
+    stop_signal = StopSignal()
+    started: list[str] = []
+
+    def run_account(account: Account) -> None:
+        started.append(account.user_id)
+        stop_signal.stop()
+
+    scheduler = AccountScheduler(max_parallel_accounts=1, stop_signal=stop_signal)
+    results = scheduler.run([Account("a"), Account("b")], run_account)
+
+    assert started == ["a"]
+    assert results[0].success
+    assert results[1].error == "중단됨"
+    assert scheduler.run([], run_account) == []
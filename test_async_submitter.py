@@ -0,0 +1,106 @@
+"""AsyncReplySubmitter result ordering, CSRF precondition and per-store callbacks.
+
+``SmartPlaceGraphQL.post_async`` is replaced with a fake, so no request
+leaves the process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from app.services.submitter import (  # noqa: E402
+    AsyncReplySubmitter,
+    StoreSubmission,
+)
+
+
+def _pair(review_id: str, text: str = "감사합니다!") -> dict:
+    return {"review_id": review_id, "reply_text": text}
+
+
+def _submitter(cookies: dict[str, str] | None = None) -> AsyncReplySubmitter:
+    if cookies is None:
+        cookies = {"csrf_token": "token"}
+    client = httpx.Client(cookies=cookies)
+    return AsyncReplySubmitter(
+        client, per_store_concurrency=3, global_concurrency=6, request_interval=0
+    )
+
+
+def _install_fake_post(submitter, delays: dict[str, float], failing=()) -> list[str]:
+    """리뷰별 지연 후 응답하는 가짜 post_async를 설치하고 호출 기록을 반환합니다."""
+    posted: list[str] = []
+
+    async def post_async(async_client, url, **kwargs):
+        review_id = kwargs["json"]["variables"]["input"]["reviewId"]
+        posted.append(review_id)
+        await asyncio.sleep(delays.get(review_id, 0))
+        if review_id in failing:
+            body = {"errors": [{"message": "이미 답글이 있습니다"}]}
+        else:
+            body = {"data": {"createReviewReply": {"reply": {"text": "ok"}}}}
+        return httpx.Response(200, json=body, request=httpx.Request("POST", url))
+
+    submitter.graphql.post_async = post_async
+    return posted
+
+
+def test_results_keep_input_order_and_report_each_store():
+    submitter = _submitter()
+    # 뒤쪽 답변이 먼저 끝나도록 지연을 거꾸로 줌
+    posted = _install_fake_post(
+        submitter, {"a1": 0.06, "a2": 0.03, "a3": 0.0, "b1": 0.02}, failing={"a2"}
+    )
+    stores = [
+        StoreSubmission("1001", "p1", [_pair("a1"), _pair("a2"), _pair("a3")]),
+        StoreSubmission("1002", "p2", [_pair("b1"), _pair("b2", "  ")]),
+    ]
+    done: list[tuple[str, list[str]]] = []
+
+    results = submitter.submit_stores(
+        stores,
+        on_store_done=lambda store, rs: done.append(
+            (store.booking_id, [r.review_id for r in rs])
+        ),
+    )
+
+    assert [r.review_id for r in results["1001"]] == ["a1", "a2", "a3"]
+    assert [r.success for r in results["1001"]] == [True, False, True]
+    assert "이미 답글이 있습니다" in results["1001"][1].error
+    assert results["1001"][0].submitted_text == "감사합니다!"
+
+    # 빈 답변은 요청 없이 실패 처리
+    assert [r.success for r in results["1002"]] == [True, False]
+    assert "b2" not in posted
+
+    # 매장마다 한 번씩, 끝난 순서대로 호출
+    assert sorted(done) == [("1001", ["a1", "a2", "a3"]), ("1002", ["b1", "b2"])]
+    assert done[0][0] == "1002"
+
+
+def test_missing_csrf_token_fails_every_reply_without_requests():
+    submitter = _submitter(cookies={})
+    posted = _install_fake_post(submitter, {})
+    stores = [
+        StoreSubmission("1001", "p1", [_pair("a1"), _pair("a2")]),
+        StoreSubmission("1002", "p2", [_pair("b1")]),
+    ]
+    done: list[str] = []
+    logs: list[tuple[str, str]] = []
+
+    results = submitter.submit_stores(
+        stores,
+        log=lambda level, message: logs.append((level, message)),
+        on_store_done=lambda store, rs: done.append(store.booking_id),
+    )
+
+    assert posted == []
+    assert done == ["1001", "1002"]
+    for store_results in results.values():
+        assert all(not r.success for r in store_results)
+        assert all(r.error == "CSRF token not found in cookies." for r in store_results)
+    assert any(level == "ERROR" and "CSRF" in message for level, message in logs)
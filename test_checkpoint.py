@@ -0,0 +1,80 @@
+"""Stage checkpoints, resume lookup and pruning of completed runs."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.services.checkpoint import (
+    STAGE_CRAWLED,
+    STAGE_ENUMERATED,
+    STAGE_GENERATED,
+    RunCheckpointStore,
+)
+
+
+@pytest.fixture
+def store(tmp_path) -> RunCheckpointStore:
+    return RunCheckpointStore(tmp_path / "checkpoints", keep_completed=2)
+
+
+def test_stages_are_saved_and_restored(store):
+    store.start_run("run-1", ["b1"], user_id="owner")
+    assert store.load_stage("run-1", "b1", STAGE_CRAWLED) is None
+    assert store.last_stage("run-1", "b1") is None
+
+    store.save_stage("run-1", "b1", STAGE_ENUMERATED, {"place_id": "p1"})
+    store.save_stage("run-1", "b1", STAGE_CRAWLED, {"reviews": [{"id": "r1"}]})
+
+    reopened = RunCheckpointStore(store.root)
+    assert reopened.load_stage("run-1", "b1", STAGE_CRAWLED) == {
+        "reviews": [{"id": "r1"}]
+    }
+    assert reopened.last_stage("run-1", "b1") == STAGE_CRAWLED
+    assert not list(store.root.rglob("*.tmp"))
+
+
+def test_unknown_stage_is_rejected(store):
+    with pytest.raises(ValueError):
+        store.save_stage("run-1", "b1", "published", {})
+
+
+def test_resume_matches_owner_and_business_ids(store):
+    store.start_run("20250101-000000-aaaaaa", ["b2", "b1"], user_id="owner-a")
+    store.start_run("20250102-000000-bbbbbb", ["b1", "b2"], user_id="owner-b")
+
+    assert store.find_resumable_run(["b1", "b2"], "owner-a") == "20250101-000000-aaaaaa"
+    assert store.find_resumable_run(["b1", "b2"], "owner-b") == "20250102-000000-bbbbbb"
+    assert store.find_resumable_run(["b1", "b2"], "owner-c") is None
+    assert store.find_resumable_run(["b1"], "owner-a") is None
+
+    store.mark_completed("20250101-000000-aaaaaa")
+    assert store.find_resumable_run(["b1", "b2"], "owner-a") is None
+
+
+def test_start_run_keeps_existing_manifest(store):
+    store.start_run("run-1", ["b1"], user_id="owner")
+    store.start_run("run-1", ["b9"], user_id="other")
+    assert store.find_resumable_run(["b1"], "owner") == "run-1"
+
+
+def test_only_recent_completed_runs_are_kept(store):
+    run_ids = [f"2025010{day}-000000-abcdef" for day in range(1, 5)]
+    for run_id in run_ids:
+        store.start_run(run_id, ["b1"], user_id="owner")
+    store.start_run("20250109-000000-open00", ["b1"], user_id="owner")
+
+    for run_id in run_ids:
+        store.mark_completed(run_id)
+
+    remaining = sorted(path.name for path in store.root.iterdir())
+    # 최근 완료 2개와 끝나지 않은 실행은 남음
+    assert remaining == [run_ids[2], run_ids[3], "20250109-000000-open00"]
+    assert store.prune_completed(keep=0) == [run_ids[3], run_ids[2]]
+
+
+def test_discard_run_removes_checkpoints(store):
+    store.start_run("run-1", ["b1"])
+    store.save_stage("run-1", "b1", STAGE_GENERATED, {"replies": []})
+    store.discard_run("run-1")
+    assert store.load_stage("run-1", "b1", STAGE_GENERATED) is None
+    assert store.find_resumable_run(["b1"]) is None
@@ -0,0 +1,139 @@
+"""CircuitBreaker state transitions driven by a fake clock."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from app.core.errors import CircuitOpenError  # noqa: E402
+from app.infra.smartplace_graphql import (  # noqa: E402
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    SmartPlaceGraphQL,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def _open_breaker(clock: FakeClock) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30.0, clock=clock)
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+    return breaker
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30.0, clock=clock)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2, clock=clock)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+
+
+def test_open_half_open_closed(clock):
+    breaker = _open_breaker(clock)
+
+    clock.now += 29.9
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now += 0.1
+    breaker.before_call()
+    assert breaker.state == STATE_HALF_OPEN
+    # 확인 요청이 진행 중이면 다른 요청은 거부
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    breaker.before_call()
+
+
+def test_failed_probe_reopens_for_another_timeout(clock):
+    breaker = _open_breaker(clock)
+
+    clock.now += 30.0
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+
+    clock.now += 29.0
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    clock.now += 1.0
+    breaker.before_call()
+    assert breaker.state == STATE_HALF_OPEN
+
+
+
+def test_non_retryable_error_does_not_close_half_open_breaker(clock):
+    class BrokenClient:
+        def post(self, url, **kwargs):
+            raise ValueError("요청 본문을 만들 수 없습니다")
+
+    breaker = _open_breaker(clock)
+    clock.now += 30.0
+    transport = SmartPlaceGraphQL(client=BrokenClient(), breaker=breaker)
+
+    with pytest.raises(ValueError):
+        transport.post("/graphql")
+
+    # 서버가 회복됐는지 알 수 없으므로 반열림 유지, 다음 요청이 확인 요청
+    assert breaker.state == STATE_HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_cancelled_probe_frees_the_half_open_slot(clock):
+    class HangingClient:
+        async def post(self, url, **kwargs):
+            await asyncio.sleep(60)
+
+    breaker = _open_breaker(clock)
+    clock.now += 30.0
+    transport = SmartPlaceGraphQL(client=None, breaker=breaker)
+
+    async def cancel_probe() -> None:
+        probe = asyncio.create_task(transport.post_async(HangingClient(), "/graphql"))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+    asyncio.run(cancel_probe())
+
+    # 취소된 확인 요청 대신 다음 요청이 확인 요청으로 통과
+    assert breaker.state == STATE_HALF_OPEN
+    breaker.before_call()
@@ -0,0 +1,119 @@
+"""AppSettings validation/diff and ConfigStore persistence."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from app.core.config import AppSettings, ConfigStore, CrawlConfig
+from app.core.errors import ConfigurationError
+from app.infra.llm_router import DEFAULT_PROVIDER, normalize_provider
+
+
+def test_from_dict_coerces_and_ignores_unknown_keys():
+    settings = AppSettings.from_dict(
+        {
+            "length_limit": 200,
+            "banned_words": ["공짜", "무료"],
+            "llm_fallbacks": [{"provider": "local", "model": "qwen"}],
+            "removed_option": True,
+        }
+    )
+    assert settings.length_limit == 200
+    assert settings.banned_words == ("공짜", "무료")
+    assert settings.llm_fallbacks == ({"provider": "local", "model": "qwen"},)
+    assert settings.tone == AppSettings().tone
+
+
+def test_from_dict_reports_every_problem():
+    with pytest.raises(ConfigurationError) as excinfo:
+        AppSettings.from_dict(
+            {
+                "length_limit": "350",
+                "template_replies": 1,
+                "reply_batch_size": True,
+                "banned_words": "공짜",
+                "max_reviews": 0,
+            }
+        )
+    message = str(excinfo.value)
+    for name in (
+        "length_limit",
+        "template_replies",
+        "reply_batch_size",
+        "banned_words",
+        "max_reviews",
+    ):
+        assert name in message
+
+
+def test_diff_lists_only_changed_keys():
+    before = AppSettings()
+    after = AppSettings.from_dict({**before.to_dict(), "tone": "캐주얼한"})
+    assert before.diff(after) == {"tone": (before.tone, "캐주얼한")}
+    assert before.diff(AppSettings()) == {}
+
+
+def test_to_dict_round_trips_through_json():
+    settings = AppSettings(banned_words=("공짜",), llm_fallbacks=({"model": "m"},))
+    data = json.loads(json.dumps(settings.to_dict()))
+    assert AppSettings.from_dict(data) == settings
+
+
+def test_crawl_config_defaults_follow_app_settings():
+    config, settings = CrawlConfig(user_id="", password=""), AppSettings()
+    assert config.reply_batch_size == settings.reply_batch_size
+    assert config.reply_length_limit == settings.length_limit
+    assert config.enable_template_replies == settings.template_replies
+    assert config.retry_budget == settings.retry_budget
+    assert config.max_parallel_accounts == settings.max_parallel_accounts
+    assert config.llm_provider == settings.llm_provider
+    assert normalize_provider(config.llm_provider) == DEFAULT_PROVIDER
+
+
+def test_store_update_saves_and_returns_diff(tmp_path):
+    store = ConfigStore(tmp_path / "settings.json")
+    assert store.get() == AppSettings()
+
+    changes = store.update(length_limit=300)
+    assert changes == {"length_limit": (AppSettings().length_limit, 300)}
+    assert json.loads(store.path.read_text(encoding="utf-8"))["length_limit"] == 300
+    assert ConfigStore(store.path).get().length_limit == 300
+
+    # 같은 값이면 다시 쓰지 않음
+    mtime = store.path.stat().st_mtime_ns
+    assert store.update(length_limit=300) == {}
+    assert store.path.stat().st_mtime_ns == mtime
+
+
+def test_store_rejects_invalid_update(tmp_path):
+    store = ConfigStore(tmp_path / "settings.json")
+    with pytest.raises(ConfigurationError):
+        store.update(retry_budget=-1)
+    assert not store.path.exists()
+
+
+def test_store_reloads_when_file_changes(tmp_path):
+    store = ConfigStore(tmp_path / "settings.json")
+    store.update(tone="전문적인")
+
+    data = json.loads(store.path.read_text(encoding="utf-8"))
+    data["tone"] = "감사한"
+    store.path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    stat = store.path.stat()
+    os.utime(store.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert store.get().tone == "감사한"
+
+
+def test_store_raises_on_broken_file(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(ConfigurationError):
+        ConfigStore(path).get()
+
+    path.write_text("[]", encoding="utf-8")
+    with pytest.raises(ConfigurationError):
+        ConfigStore(path).get()
@@ -66,8 +66,8 @@ def test_file_change_detection():
         test_event = MockEvent("app/test.py")
         handler.on_modified(test_event)
 
-        # 잠시 대기
-        time.sleep(0.1)
+        # 디바운스 시간이 지나 변경이 일괄 처리될 때까지 대기
+        time.sleep(handler.debounce_delay + 0.2)
 
         if restart_called:
             print("✅ 파일 변경 감지 및 재시작 콜백 테스트 성공")
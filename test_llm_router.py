@@ -0,0 +1,127 @@
+"""LLMRouter failover, health-based ordering and cooldown (fake backends)."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+pytest.importorskip("openai")
+
+from app.infra.llm_router import (  # noqa: E402
+    PROBE_INTERVAL,
+    BackendSpec,
+    LLMRouter,
+    create_llm_client,
+)
+from app.infra.llm_openai import LLMClient  # noqa: E402
+
+
+class FakeClient:
+    """호출을 기록하고 정해진 응답 또는 예외를 돌려주는 백엔드"""
+
+    def __init__(self, name: str, fail: bool = False) -> None:
+        self.name = name
+        self.fail = fail
+        self.calls: list[dict] = []
+
+    def generate(self, **kwargs) -> str:
+        self.calls.append(kwargs)
+        if self.fail:
+            raise RuntimeError(f"{self.name} 장애")
+        return f"{self.name} 응답"
+
+    def generate_stream(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.fail:
+            raise RuntimeError(f"{self.name} 장애")
+        yield f"{self.name} "
+        yield "응답"
+
+
+def _router(*clients: FakeClient) -> LLMRouter:
+    specs = [
+        BackendSpec(provider="openai" if i == 0 else "local", model=f"m{i}")
+        for i in range(len(clients))
+    ]
+    router = LLMRouter(specs, default_api_key="test-key")
+    for backend, client in zip(router._backends, clients):
+        backend.client = client
+    return router
+
+
+def test_single_backend_is_a_plain_client():
+    client = create_llm_client(BackendSpec(), default_api_key="test-key")
+    assert isinstance(client, LLMClient)
+
+
+def test_fails_over_to_the_next_backend():
+    primary, fallback = FakeClient("primary", fail=True), FakeClient("fallback")
+    router = _router(primary, fallback)
+
+    assert router.generate(prompt="안녕") == "fallback 응답"
+    assert len(primary.calls) == 1
+    snapshot = router.health_snapshot()
+    assert snapshot[0]["error_rate"] == 1.0
+    assert snapshot[1]["error_rate"] == 0.0
+
+
+def test_all_backends_failing_raises():
+    router = _router(FakeClient("a", fail=True), FakeClient("b", fail=True))
+    with pytest.raises(RuntimeError, match="모든 LLM 백엔드 호출 실패"):
+        router.generate(prompt="안녕")
+
+
+def test_model_override_applies_only_to_the_primary_provider():
+    primary, fallback = FakeClient("primary", fail=True), FakeClient("fallback")
+    router = _router(primary, fallback)
+    router.generate(prompt="안녕", model="gpt-4o")
+    assert primary.calls[0]["model"] == "gpt-4o"
+    assert fallback.calls[0]["model"] is None
+
+
+def test_faster_backend_is_tried_first():
+    slow, fast = FakeClient("slow"), FakeClient("fast")
+    router = _router(slow, fast)
+    for _ in range(5):
+        router._backends[0].health.record_success(2.0)
+        router._backends[1].health.record_success(0.2)
+
+    assert router.generate(prompt="안녕") == "fast 응답"
+    assert slow.calls == []
+
+
+def test_errors_outweigh_latency_and_cooldown_moves_backend_last():
+    flaky, steady = FakeClient("flaky"), FakeClient("steady")
+    router = _router(flaky, steady)
+    flaky_health = router._backends[0].health
+    router._backends[1].health.record_success(1.0)
+    flaky_health.record_success(0.5)
+    flaky_health.record_failure(now=0.0)
+    # 0.5 * (1 + 4 * 0.5) = 1.5 > 1.0
+    assert router.generate(prompt="안녕") == "steady 응답"
+
+    for _ in range(3):
+        flaky_health.record_failure(now=10**9)
+    assert flaky_health.cooldown_until > 10**9
+    ranked = [b.client.name for b in router._ranked_backends()]
+    assert ranked == ["steady", "flaky"]
+
+
+def test_idle_backend_is_probed_again():
+    primary, idle = FakeClient("primary"), FakeClient("idle")
+    router = _router(primary, idle)
+    router._backends[0].health.record_success(0.1)
+    router._backends[1].health.record_success(5.0)
+    # PROBE_INTERVAL 넘게 쓰이지 않은 백엔드는 한 번 앞으로 보냄
+    router._backends[1].health.last_attempt = time.monotonic() - PROBE_INTERVAL - 1
+    assert router._ranked_backends()[0].client is idle
+
+    router._backends[1].health.last_attempt = time.monotonic()
+    assert router._ranked_backends()[0].client is primary
+
+
+def test_stream_fails_over_before_the_first_chunk():
+    primary, fallback = FakeClient("primary", fail=True), FakeClient("fallback")
+    router = _router(primary, fallback)
+    assert "".join(router.generate_stream(prompt="안녕")) == "fallback 응답"
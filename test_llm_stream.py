@@ -0,0 +1,91 @@
+"""LLMClient.generate_stream retries only before the first chunk."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+
+from app.core.retry import RetryPolicy  # noqa: E402
+from app.infra.llm_openai import LLMClient  # noqa: E402
+
+
+class ServerError(Exception):
+    status_code = 503
+
+
+def _chunk(text: str | None):
+    delta = SimpleNamespace(content=text)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+class FakeCompletions:
+    """호출마다 미리 정한 스트림(조각 목록, 중간에 예외 가능)을 돌려줌"""
+
+    def __init__(self, scripts: list[list]) -> None:
+        self.scripts = scripts
+        self.calls = 0
+
+    def create(self, **kwargs):
+        assert kwargs["stream"] is True
+        script = self.scripts[self.calls]
+        self.calls += 1
+        if isinstance(script, Exception):
+            raise script
+        return self._stream(script)
+
+    @staticmethod
+    def _stream(script):
+        for item in script:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+def _client(scripts: list) -> tuple[LLMClient, FakeCompletions]:
+    client = LLMClient(
+        api_key="test-key", retry_policy=RetryPolicy(base_delay=0.0, max_delay=0.0)
+    )
+    completions = FakeCompletions(scripts)
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return client, completions
+
+
+def test_retries_when_the_request_fails_before_any_chunk():
+    client, completions = _client(
+        [
+            ServerError("unavailable"),
+            [ServerError("reset before first chunk")],
+            [SimpleNamespace(choices=[]), _chunk(None), _chunk("감사"), _chunk("합니다")],
+        ]
+    )
+    assert list(client.generate_stream(prompt="안녕")) == ["감사", "합니다"]
+    assert completions.calls == 3
+
+
+def test_does_not_retry_after_a_chunk_was_delivered():
+    client, completions = _client(
+        [[_chunk("감사"), ServerError("reset")], [_chunk("중복")]]
+    )
+    received = []
+    with pytest.raises(RuntimeError, match="스트리밍 호출 실패"):
+        for delta in client.generate_stream(prompt="안녕"):
+            received.append(delta)
+    assert received == ["감사"]
+    assert completions.calls == 1
+
+
+def test_gives_up_after_max_retries_and_on_fatal_errors():
+    client, completions = _client([ServerError("down")] * 5)
+    with pytest.raises(RuntimeError):
+        list(client.generate_stream(prompt="안녕"))
+    assert completions.calls == client.max_retries
+
+    fatal = ServerError("bad request")
+    fatal.status_code = 400
+    client, completions = _client([fatal, [_chunk("x")]])
+    with pytest.raises(RuntimeError):
+        list(client.generate_stream(prompt="안녕"))
+    assert completions.calls == 1
@@ -0,0 +1,90 @@
+"""Log context binding, ContextFilter and the JSON lines formatter."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sys
+
+import pytest
+
+from app.core.logging import (
+    ContextFilter,
+    JsonLinesFormatter,
+    bind_log_context,
+    current_log_context,
+    log_context,
+)
+
+
+def _record(message: str = "리뷰 수집 완료", **extra) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "app.test", logging.INFO, __file__, 1, message, None, None
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+def test_log_context_nests_and_resets_on_error():
+    with log_context(run_id="run-1", account_id="owner"):
+        with pytest.raises(RuntimeError):
+            with log_context(store_id="1001"):
+                assert current_log_context() == {
+                    "run_id": "run-1",
+                    "account_id": "owner",
+                    "store_id": "1001",
+                }
+                raise RuntimeError("매장 수집 실패")
+        # 예외가 나도 매장 ID가 다음 매장의 로그에 남지 않음
+        assert current_log_context() == {"run_id": "run-1", "account_id": "owner"}
+    assert current_log_context() == {}
+
+
+def test_bind_in_async_task_does_not_leak_to_caller():
+    async def submit(review_id: str) -> dict[str, str]:
+        bind_log_context(review_id=review_id)
+        await asyncio.sleep(0)
+        return current_log_context()
+
+    async def scenario() -> list[dict[str, str]]:
+        return await asyncio.gather(submit("r1"), submit("r2"))
+
+    with log_context(store_id="1001"):
+        contexts = asyncio.run(scenario())
+        assert current_log_context() == {"store_id": "1001"}
+    assert contexts == [
+        {"store_id": "1001", "review_id": "r1"},
+        {"store_id": "1001", "review_id": "r2"},
+    ]
+
+
+def test_context_filter_copies_ids_without_overwriting():
+    context_filter = ContextFilter()
+    with log_context(run_id="run-1", review_id="r1"):
+        record = _record(review_id="explicit")
+        assert context_filter.filter(record)
+    assert record.run_id == "run-1"
+    assert record.review_id == "explicit"
+    assert not hasattr(record, "store_id")
+
+
+def test_json_lines_formatter_includes_context_and_exception():
+    formatter = JsonLinesFormatter()
+    entry = json.loads(formatter.format(_record(run_id="run-1", store_id="1001")))
+    assert entry["message"] == "리뷰 수집 완료"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "app.test"
+    assert entry["run_id"] == "run-1"
+    assert entry["store_id"] == "1001"
+    assert "review_id" not in entry
+    assert entry["ts"].endswith("+00:00")
+
+    try:
+        raise ValueError("잘못된 응답")
+    except ValueError:
+        record = _record("실패")
+        record.exc_info = sys.exc_info()
+    line = formatter.format(record)
+    assert "\n" not in line
+    assert "ValueError: 잘못된 응답" in json.loads(line)["exc_info"]
@@ -0,0 +1,255 @@
+"""Offline (Batch API) reply generation against a stub OpenAI endpoint.
+
+Runs submit → poll → collect for a checkpointed run, with an output file that
+has one failed line and a separate error file.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("openai")
+
+from app.services.checkpoint import (  # noqa: E402
+    STAGE_CRAWLED,
+    STAGE_GENERATED,
+    RunCheckpointStore,
+)
+from app.services.offline_replies import collect_run, submit_run  # noqa: E402
+from app.services.reply_generator import ReplyConfig, ReplyGenerator  # noqa: E402
+
+BATCH_ID = "batch_test"
+
+
+def _chat_line(custom_id: str, content: str) -> dict:
+    return {
+        "custom_id": custom_id,
+        "response": {
+            "status_code": 200,
+            "body": {"choices": [{"message": {"content": content}}]},
+        },
+        "error": None,
+    }
+
+
+OUTPUT_LINES = [
+    _chat_line("r1", "방문해 주셔서 감사합니다. 또 뵙겠습니다!"),
+    {
+        "custom_id": "r2",
+        "response": {"status_code": 500, "body": {}},
+        "error": None,
+    },
+]
+ERROR_LINES = [
+    {
+        "custom_id": "r3",
+        "response": None,
+        "error": {"code": "rate_limit", "message": "요청 한도 초과"},
+    }
+]
+
+
+class StubBatchAPI(BaseHTTPRequestHandler):
+    """files/batches 엔드포인트만 흉내 내는 OpenAI 스텁"""
+
+    uploaded: list[dict] = []
+    retrieve_calls = 0
+    output_lines: list[dict] = OUTPUT_LINES
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _send_json(self, data: dict) -> None:
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_text(self, lines: list[dict]) -> None:
+        body = "\n".join(json.dumps(line, ensure_ascii=False) for line in lines)
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self) -> None:
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/v1/files":
+            # multipart 본문에서 JSONL 줄만 추출
+            for line in raw.decode("utf-8", "ignore").splitlines():
+                if line.startswith("{"):
+                    StubBatchAPI.uploaded.append(json.loads(line))
+            self._send_json(
+                {
+                    "id": "file-input",
+                    "object": "file",
+                    "bytes": len(raw),
+                    "created_at": 0,
+                    "filename": "replies.jsonl",
+                    "purpose": "batch",
+                    "status": "processed",
+                }
+            )
+        elif self.path == "/v1/batches":
+            self._send_json(self._batch("validating"))
+        else:
+            self.send_error(404)
+
+    def do_GET(self) -> None:
+        if self.path == f"/v1/batches/{BATCH_ID}":
+            StubBatchAPI.retrieve_calls += 1
+            status = "in_progress" if StubBatchAPI.retrieve_calls < 3 else "completed"
+            self._send_json(self._batch(status))
+        elif self.path == "/v1/files/file-output/content":
+            self._send_text(StubBatchAPI.output_lines)
+        elif self.path == "/v1/files/file-error/content":
+            self._send_text(ERROR_LINES)
+        else:
+            self.send_error(404)
+
+    @staticmethod
+    def _batch(status: str) -> dict:
+        done = status == "completed"
+        return {
+            "id": BATCH_ID,
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": "file-input",
+            "completion_window": "24h",
+            "status": status,
+            "created_at": 0,
+            "output_file_id": "file-output" if done else None,
+            "error_file_id": "file-error" if done else None,
+        }
+
+
+@pytest.fixture
+def stub_url():
+    StubBatchAPI.uploaded = []
+    StubBatchAPI.retrieve_calls = 0
+    StubBatchAPI.output_lines = OUTPUT_LINES
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubBatchAPI)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+def _review(review_id: str, text: str) -> dict:
+    return {"id": review_id, "content": {"text": text}, "author": {"displayName": "손님"}}
+
+
+def test_submit_poll_collect_with_partial_failures(stub_url, tmp_path):
+    checkpoints = RunCheckpointStore(tmp_path / "checkpoints")
+    run_id = "run-1"
+    checkpoints.start_run(run_id, ["store-a", "store-b"])
+    checkpoints.save_stage(
+        run_id,
+        "store-a",
+        STAGE_CRAWLED,
+        {"reviews": [_review("r1", "음식이 정말 맛있었어요"), _review("r2", "친절해요 또 올게요")]},
+    )
+    checkpoints.save_stage(
+        run_id,
+        "store-b",
+        STAGE_CRAWLED,
+        {"reviews": [_review("r3", "대기가 조금 길었어요"), _review("r4", "분위기가 좋아요")]},
+    )
+
+    generator = ReplyGenerator(
+        ReplyConfig(
+            openai_api_key="test-key",
+            base_url=stub_url,
+            enable_template_replies=False,
+            history_examples=0,
+        )
+    )
+    batch_dir = tmp_path / "batches"
+
+    batch_id = submit_run(run_id, generator, checkpoints, batch_dir)
+    assert batch_id == BATCH_ID
+    assert [line["custom_id"] for line in StubBatchAPI.uploaded] == [
+        "r1",
+        "r2",
+        "r3",
+        "r4",
+    ]
+
+    succeeded = collect_run(
+        run_id, generator, checkpoints, batch_dir, poll_interval=0.01, timeout=10
+    )
+    assert StubBatchAPI.retrieve_calls == 3
+    assert succeeded == {"store-a": 1, "store-b": 0}
+
+    store_a = checkpoints.load_stage(run_id, "store-a", STAGE_GENERATED)["replies"]
+    assert store_a[0]["generated_reply"] == "방문해 주셔서 감사합니다. 또 뵙겠습니다!"
+    assert store_a[0]["error"] is None
+    assert store_a[1]["error"] == "HTTP 500"
+
+    store_b = checkpoints.load_stage(run_id, "store-b", STAGE_GENERATED)["replies"]
+    assert store_b[0]["error"] == "요청 한도 초과"
+    assert store_b[1]["error"].startswith("Batch 결과 없음")
+
+    # 답변이 저장된 실행은 다시 제출하지 않음
+    assert submit_run(run_id, generator, checkpoints, batch_dir) is None
+
+
+def test_collect_rejects_replies_with_banned_words(stub_url, tmp_path):
+    StubBatchAPI.output_lines = [
+        _chat_line("r1", "방문해 주셔서 감사합니다. 환불은 매장에 문의해 주세요."),
+        _chat_line("r2", "칭찬해 주셔서 감사합니다. 또 뵙겠습니다!"),
+    ]
+    checkpoints = RunCheckpointStore(tmp_path / "checkpoints")
+    run_id = "run-banned"
+    checkpoints.start_run(run_id, ["store-a"])
+    checkpoints.save_stage(
+        run_id,
+        "store-a",
+        STAGE_CRAWLED,
+        {"reviews": [_review("r1", "음식이 식어서 나왔어요"), _review("r2", "친절해요 또 올게요")]},
+    )
+
+    generator = ReplyGenerator(
+        ReplyConfig(
+            openai_api_key="test-key",
+            base_url=stub_url,
+            enable_template_replies=False,
+            history_examples=0,
+            banned_words=["환불"],
+            max_regenerations=0,
+        )
+    )
+    batch_dir = tmp_path / "batches"
+    submit_run(run_id, generator, checkpoints, batch_dir)
+
+    succeeded = collect_run(
+        run_id, generator, checkpoints, batch_dir, poll_interval=0.01, timeout=10
+    )
+    assert succeeded == {"store-a": 1}
+
+    replies = checkpoints.load_stage(run_id, "store-a", STAGE_GENERATED)["replies"]
+    assert replies[0]["error"].startswith("품질 검증 실패")
+    assert "환불" in replies[0]["error"]
+    assert replies[1]["error"] is None
+
+
+def test_collect_without_submission_fails(stub_url, tmp_path):
+    generator = ReplyGenerator(
+        ReplyConfig(openai_api_key="test-key", base_url=stub_url, history_examples=0)
+    )
+    with pytest.raises(FileNotFoundError):
+        collect_run(
+            "missing",
+            generator,
+            RunCheckpointStore(tmp_path / "checkpoints"),
+            tmp_path / "batches",
+        )
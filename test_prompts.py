@@ -0,0 +1,108 @@
+"""Batch prompt construction and parsing of malformed or partial responses."""
+
+from __future__ import annotations
+
+import json
+
+from app.domain.prompts import (
+    BATCH_FEW_SHOT_NOTE,
+    build_batch_user_message,
+    build_reply_messages,
+    build_reply_prompt,
+    build_system_prompt,
+    parse_batch_reply_response,
+)
+
+IDS = ["1", "2", "3"]
+
+
+def test_parses_complete_response():
+    raw = json.dumps(
+        [{"id": "1", "reply": "감사합니다!"}, {"id": "2", "reply": "또 오세요."}],
+        ensure_ascii=False,
+    )
+    assert parse_batch_reply_response(raw, IDS) == {
+        "1": "감사합니다!",
+        "2": "또 오세요.",
+    }
+
+
+def test_ignores_text_and_code_fences_around_the_array():
+    raw = '결과입니다.\n```json\n[{"id": "3", "reply": "좋은 하루 되세요"}]\n```'
+    assert parse_batch_reply_response(raw, IDS) == {"3": "좋은 하루 되세요"}
+
+
+def test_malformed_responses_return_nothing():
+    assert parse_batch_reply_response("", IDS) == {}
+    assert parse_batch_reply_response("답변을 생성할 수 없습니다.", IDS) == {}
+    # 길이 제한으로 잘린 응답
+    assert parse_batch_reply_response('[{"id": "1", "reply": "감사', IDS) == {}
+    assert parse_batch_reply_response('[{"id": "1", "reply": ]', IDS) == {}
+    assert parse_batch_reply_response('{"id": "1", "reply": "x"}', IDS) == {}
+
+
+def test_partial_response_keeps_only_valid_items():
+    raw = json.dumps(
+        [
+            {"id": "1", "reply": "첫 답변"},
+            {"id": "1", "reply": "중복 id는 첫 항목만 사용"},
+            {"id": "2", "reply": None},
+            {"id": "9", "reply": "요청하지 않은 id"},
+            {"reply": "id 없음"},
+            "문자열 항목",
+            {"id": 3, "reply": "  숫자 id도 허용  "},
+        ],
+        ensure_ascii=False,
+    )
+    assert parse_batch_reply_response(raw, IDS) == {"1": "첫 답변", "3": "숫자 id도 허용"}
+
+
+def test_replies_are_cleaned_and_truncated():
+    raw = json.dumps([{"id": "1", "reply": '"' + "가" * 50 + '"'}], ensure_ascii=False)
+    reply = parse_batch_reply_response(raw, IDS, max_length=20)["1"]
+    assert not reply.startswith('"')
+    assert len(reply) <= 20
+
+
+def test_batch_message_lists_reviews():
+    message = build_batch_user_message(
+        [
+            {"id": "1", "author": "홍길동", "text": "맛있어요"},
+            {"id": "2", "author": None, "text": "친절해요"},
+        ]
+    )
+    assert "2개의 고객 리뷰" in message
+    assert '{"id": "1", "author": "홍길동", "text": "맛있어요"}' in message
+    assert '{"id": "2", "author": "", "text": "친절해요"}' in message
+    assert BATCH_FEW_SHOT_NOTE not in message
+
+
+def test_batch_message_includes_examples():
+    message = build_batch_user_message(
+        [
+            {"id": "1", "text": "맛있어요", "examples": [("예전 리뷰", "예전 답변")]},
+            {"id": "2", "text": "친절해요", "examples": []},
+        ]
+    )
+    assert message.startswith(BATCH_FEW_SHOT_NOTE)
+    assert '"examples": [{"review": "예전 리뷰", "reply": "예전 답변"}]' in message
+    assert '{"id": "2", "author": "", "text": "친절해요"}' in message
+
+
+def test_system_message_is_a_stable_prefix_across_reviews():
+    first = build_reply_messages("음식이 맛있어요", review_author="홍길동")
+    second = build_reply_messages(
+        "대기가 길었어요", review_author="김철수", examples=[("예전 리뷰", "예전 답변")]
+    )
+    # 리뷰/작성자/예시는 사용자 메시지에만 들어가고 시스템 메시지는 동일
+    assert first[0] == second[0]
+    assert "음식이 맛있어요" not in first[0]["content"]
+    assert second[1]["content"].index("예전 답변") < second[1]["content"].index(
+        "대기가 길었어요"
+    )
+
+
+def test_prompt_text_ends_with_the_review():
+    prompt = build_reply_prompt("음식이 맛있어요")
+    assert prompt.startswith(build_system_prompt())
+    assert prompt.index("음식이 맛있어요") > len(build_system_prompt())
@@ -0,0 +1,38 @@
+"""Near-duplicate lookups in the per-place MinHash index."""
+
+from __future__ import annotations
+
+import json
+
+from app.services.reply_dedup import ReplyDedupIndex
+
+BODY = "소중한 리뷰 남겨주셔서 감사합니다. 다음에도 좋은 모습으로 찾아뵙겠습니다."
+
+
+def test_reply_differing_only_by_author_name_is_found(tmp_path):
+    index = ReplyDedupIndex("place-1", root=tmp_path)
+    index.add("r1", f"안녕하세요, 홍길동님! {BODY}")
+
+    matches = index.query(f"안녕하세요, 김철수님! {BODY}")
+    assert [key for key, _ in matches] == ["r1"]
+    assert matches[0][1] >= index.threshold
+
+
+def test_different_reply_is_not_found(tmp_path):
+    index = ReplyDedupIndex("place-1", root=tmp_path)
+    index.add("r1", f"안녕하세요, 홍길동님! {BODY}")
+
+    assert index.query("안녕하세요, 김철수님! 맛있게 드셨다니 정말 기쁩니다.") == []
+
+
+def test_index_from_older_signature_version_is_discarded(tmp_path):
+    index = ReplyDedupIndex("place-1", root=tmp_path)
+    index.add("r1", BODY)
+    index.save()
+
+    data = json.loads(index.path.read_text(encoding="utf-8"))
+    assert len(ReplyDedupIndex("place-1", root=tmp_path)) == 1
+
+    data.pop("version")
+    index.path.write_text(json.dumps(data), encoding="utf-8")
+    assert len(ReplyDedupIndex("place-1", root=tmp_path)) == 0
@@ -0,0 +1,73 @@
+"""Validation and regeneration in ReplyGenerator (no network calls)."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("openai")
+
+from app.services.reply_generator import (  # noqa: E402
+    ReplyConfig,
+    ReplyGenerator,
+    ReviewReplyPair,
+)
+
+
+def _generator(tmp_path, **overrides) -> ReplyGenerator:
+    config = ReplyConfig(
+        openai_api_key="test-key",
+        history_examples=0,
+        dedup_dir=tmp_path / "dedup",
+        history_dir=tmp_path / "history",
+        **overrides,
+    )
+    return ReplyGenerator(config)
+
+
+def test_negative_max_regenerations_marks_failures_without_regenerating(tmp_path):
+    generator = _generator(tmp_path, max_regenerations=-1, length_limit=20)
+
+    def fail_generate(*args, **kwargs):
+        raise AssertionError("재생성하면 안 됨")
+
+    generator.generate = fail_generate
+    results = [
+        ReviewReplyPair("r1", "맛있어요", generated_reply="감사합니다. 또 오세요!"),
+        ReviewReplyPair("r2", "친절해요", generated_reply="가" * 30),
+    ]
+    generator._validate_and_regenerate(results, set(), lambda *_: None, {})
+
+    assert results[0].error is None
+    assert results[1].error.startswith("품질 검증 실패")
+
+
+class _RecordingClient:
+    """요청 메시지를 기록하고 고정 JSON 배열로 답하는 LLM 클라이언트"""
+
+    model = "gpt-4o-mini"
+
+    def __init__(self) -> None:
+        self.messages: list[list[dict[str, str]]] = []
+
+    def generate(self, messages, **kwargs) -> str:
+        self.messages.append(messages)
+        return '[{"id": "1", "reply": "첫 답변입니다."}, {"id": "2", "reply": "둘째 답변"}]'
+
+
+def test_batched_prompt_includes_history_examples(tmp_path):
+    generator = _generator(tmp_path, batch_size=10, enable_template_replies=False)
+    generator.llm_client = _RecordingClient()
+    generator._history_examples = lambda place_id, text: (
+        [("예전 리뷰", "예전 답변")] if place_id == "p1" else []
+    )
+    reviews = [
+        {"id": "a", "content": {"text": "맛있어요"}, "placeDetail": {"id": "p1"}},
+        {"id": "b", "content": {"text": "친절해요"}, "placeDetail": {"id": "p2"}},
+    ]
+
+    replies = generator._generate_in_batches(reviews, lambda *_: None)
+
+    assert replies == {"a": "첫 답변입니다.", "b": "둘째 답변"}
+    prompt = generator.llm_client.messages[0][-1]["content"]
+    assert '"examples": [{"review": "예전 리뷰", "reply": "예전 답변"}]' in prompt
+    assert prompt.count('"examples"') == 1
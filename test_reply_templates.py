@@ -0,0 +1,40 @@
+"""Trivial-review detection and deterministic template replies."""
+
+from __future__ import annotations
+
+from app.domain.reply_templates import (
+    BUSINESS_TEMPLATE_POOLS,
+    is_trivial_review,
+    render_template_reply,
+)
+
+
+def test_trivial_reviews():
+    assert is_trivial_review("")
+    assert is_trivial_review("   ", rating=5)
+    assert is_trivial_review("맛있어요!", rating=5)
+
+
+def test_non_trivial_reviews():
+    assert not is_trivial_review("맛있어요", rating=3)
+    assert not is_trivial_review("", has_negative_grade=True)
+    assert not is_trivial_review("음식이 정말 맛있고 직원분들도 친절해요")
+    assert not is_trivial_review("별로예요")
+
+
+def test_template_reply_is_deterministic_per_review():
+    first = render_template_reply("review-1", business_type="카페", review_author="홍길동")
+    again = render_template_reply("review-1", business_type="카페", review_author="홍길동")
+    assert first == again
+    replies = {render_template_reply(f"review-{i}") for i in range(20)}
+    assert len(replies) > 1
+
+
+def test_template_reply_addresses_author():
+    assert "고객님" in render_template_reply("review-1")
+    assert "홍길동님" in render_template_reply("review-1", review_author="홍길동")
+
+
+def test_unknown_business_type_uses_default_pool():
+    assert "알 수 없음" not in BUSINESS_TEMPLATE_POOLS
+    assert render_template_reply("r", business_type="알 수 없음")
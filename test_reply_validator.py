@@ -0,0 +1,41 @@
+"""Near-duplicate detection in ReplyValidator."""
+
+from __future__ import annotations
+
+from app.services.reply_validator import (
+    ISSUE_NEAR_DUPLICATE,
+    ReplyValidator,
+    reply_body,
+)
+
+BODY = "소중한 리뷰 남겨주셔서 감사합니다. 다음에도 좋은 모습으로 찾아뵙겠습니다."
+
+
+def test_reply_body_strips_greeting_and_name():
+    assert reply_body(f"안녕하세요, 홍길동님! {BODY}") == f"님! {BODY}"
+    assert reply_body(f"반갑습니다~ 김철수 고객님, {BODY}") == f"님, {BODY}"
+
+
+def test_replies_differing_only_by_author_name_are_duplicates():
+    validator = ReplyValidator()
+    issues = validator.validate_batch(
+        {
+            "r1": f"안녕하세요, 홍길동님! {BODY}",
+            "r2": f"안녕하세요, 김철수님! {BODY}",
+        }
+    )
+    assert issues["r1"] == []
+    assert len(issues["r2"]) == 1
+    assert issues["r2"][0].startswith(ISSUE_NEAR_DUPLICATE)
+
+
+def test_different_replies_with_same_greeting_pass():
+    validator = ReplyValidator()
+    issues = validator.validate_batch(
+        {
+            "r1": f"안녕하세요, 홍길동님! {BODY}",
+            "r2": "안녕하세요, 김철수님! 대기 시간이 길어 불편하셨을 텐데 "
+            "죄송합니다. 주말에는 예약을 이용해 주시면 바로 안내해 드릴게요.",
+        }
+    )
+    assert issues == {"r1": [], "r2": []}
@@ -0,0 +1,76 @@
+"""RequestLimiter permits are returned when an async waiter is cancelled."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from app.infra.smartplace_graphql import RequestLimiter  # noqa: E402
+
+
+def test_cancelled_waiter_does_not_leak_permits():
+    limiter = RequestLimiter(global_limit=1, per_key_limit=1)
+
+    async def scenario() -> None:
+        holder_ready = asyncio.Event()
+        release_holder = asyncio.Event()
+
+        async def holder() -> None:
+            async with limiter.slot_async("account"):
+                holder_ready.set()
+                await release_holder.wait()
+
+        async def waiter() -> None:
+            async with limiter.slot_async("account"):
+                pass
+
+        holder_task = asyncio.create_task(holder())
+        await holder_ready.wait()
+
+        waiter_task = asyncio.create_task(waiter())
+        await asyncio.sleep(0.05)
+        waiter_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter_task
+
+        release_holder.set()
+        await holder_task
+
+        # 취소된 대기자의 스레드가 얻은 자리도 반납되어야 다시 진입 가능
+        async with limiter.slot_async("account"):
+            pass
+
+    asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+
+    with limiter.slot("account"):
+        pass
+
+
+def test_sync_slot_limits_per_key():
+    limiter = RequestLimiter(global_limit=4, per_key_limit=1)
+    with limiter.slot("a"):
+        assert not limiter._key_semaphore("a").acquire(blocking=False)
+        assert limiter._key_semaphore("b").acquire(blocking=False)
+
+
+def test_close_shuts_down_waiter_threads_and_allows_reuse():
+    limiter = RequestLimiter(global_limit=1, per_key_limit=1)
+
+    async def use_slot() -> None:
+        async with limiter.slot_async("account"):
+            pass
+
+    asyncio.run(use_slot())
+    waiters = limiter._waiters
+    assert waiters is not None
+
+    limiter.close()
+    assert limiter._waiters is None
+    assert waiters._shutdown
+
+    # 닫은 뒤에도 다음 실행에서 다시 사용 가능
+    asyncio.run(use_slot())
+    limiter.close()
@@ -0,0 +1,79 @@
+"""RetryPolicy jitter bounds, Retry-After parsing and budget (seeded, no sleeps)."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+from app.core.errors import ReviewAPIAuthError
+from app.core.retry import RetryBudget, RetryPolicy, retry_after_seconds
+
+
+class HTTPError(Exception):
+    """상태 코드와 응답 헤더를 가진 httpx 스타일 예외"""
+
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+def _policy(**kwargs) -> RetryPolicy:
+    return RetryPolicy(_rng=random.Random(1234), **kwargs)
+
+
+def test_jitter_stays_between_base_and_three_times_previous_delay():
+    policy = _policy(max_attempts=1000, base_delay=0.5, max_delay=30.0)
+    previous = policy.base_delay
+    for attempt in range(1, 500):
+        delay = policy.delay_before_retry(HTTPError(503), attempt, previous)
+        assert policy.base_delay <= delay <= min(policy.max_delay, previous * 3)
+        previous = delay
+
+
+def test_jitter_is_capped_at_max_delay():
+    policy = _policy(max_attempts=100, base_delay=1.0, max_delay=2.0)
+    delays = [policy.delay_before_retry(HTTPError(500), 1, 100.0) for _ in range(200)]
+    assert max(delays) <= 2.0
+    assert min(delays) >= 1.0
+
+
+def test_retry_after_in_seconds_and_http_date():
+    assert retry_after_seconds(HTTPError(429, {"retry-after": "7"})) == 7.0
+    assert retry_after_seconds(HTTPError(429, {"Retry-After": "-3"})) == 0.0
+    past = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert retry_after_seconds(HTTPError(429, {"retry-after": past})) == 0.0
+    future = "Fri, 01 Jan 2100 00:00:00 GMT"
+    assert retry_after_seconds(HTTPError(429, {"retry-after": future})) > 10**9
+    assert retry_after_seconds(HTTPError(429, {"retry-after": "soon"})) is None
+    assert retry_after_seconds(HTTPError(429)) is None
+
+
+def test_retry_after_sets_the_minimum_wait():
+    policy = _policy(base_delay=0.1, max_delay=1.0, max_retry_after=60.0)
+    delay = policy.delay_before_retry(HTTPError(429, {"retry-after": "12"}), 1, 0.1)
+    assert delay == 12.0
+
+
+def test_retry_after_beyond_limit_gives_up():
+    policy = _policy(max_retry_after=60.0)
+    exc = HTTPError(429, {"retry-after": "600"})
+    assert policy.delay_before_retry(exc, 1, 0.5) is None
+
+
+def test_fatal_errors_and_attempt_limit_are_not_retried():
+    policy = _policy(max_attempts=3)
+    assert policy.delay_before_retry(HTTPError(401), 1, 0.5) is None
+    assert policy.delay_before_retry(ReviewAPIAuthError("만료"), 1, 0.5) is None
+    assert policy.delay_before_retry(HTTPError(503), 3, 0.5) is None
+    # 답변 등록처럼 멱등이 아닌 요청은 처리되지 않았음이 확실할 때만 재시도
+    assert policy.delay_before_retry(HTTPError(500), 1, 0.5, idempotent=False) is None
+    assert policy.delay_before_retry(HTTPError(503), 1, 0.5, idempotent=False)
+
+
+def test_shared_budget_stops_retries():
+    budget = RetryBudget(max_retries=2)
+    first, second = _policy(budget=budget), _policy(budget=budget)
+    assert first.delay_before_retry(HTTPError(503), 1, 0.5) is not None
+    assert second.delay_before_retry(HTTPError(503), 1, 0.5) is not None
+    assert first.delay_before_retry(HTTPError(503), 1, 0.5) is None
+    assert budget.remaining == 0
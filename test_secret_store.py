@@ -0,0 +1,91 @@
+"""SecretStore caching, invalidation and plain-to-encrypted migration."""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+
+import pytest
+
+from app.utils.secret_store import CSRF_COOKIE_NAME, KEY_FILE, SecretStore
+
+
+def _write_plain(path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_read_is_cached_until_mtime_or_size_changes(tmp_path):
+    store = SecretStore(tmp_path)
+    path = tmp_path / "state.json"
+    _write_plain(path, {"value": "aaaa"})
+
+    first = store.read_json(path)
+    assert first == {"value": "aaaa"}
+    assert store.read_json(path) is first
+
+    # 크기가 같아도 수정 시각이 바뀌면 다시 읽음
+    _write_plain(path, {"value": "bbbb"})
+    mtime_ns = path.stat().st_mtime_ns + 1_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    assert store.read_json(path) == {"value": "bbbb"}
+
+    path.unlink()
+    assert store.read_json(path) is None
+
+
+def test_invalidate_forces_a_reread(tmp_path):
+    store = SecretStore(tmp_path)
+    path = tmp_path / "state.json"
+    _write_plain(path, {"value": "aaaa"})
+    assert store.read_json(path) == {"value": "aaaa"}
+
+    # 크기와 수정 시각을 그대로 둔 채 내용만 바꾸면 캐시가 그대로 쓰임
+    signature = path.stat()
+    _write_plain(path, {"value": "bbbb"})
+    os.utime(path, ns=(signature.st_atime_ns, signature.st_mtime_ns))
+    assert store.read_json(path) == {"value": "aaaa"}
+
+    store.invalidate(path)
+    assert store.read_json(path) == {"value": "bbbb"}
+
+
+def test_session_helpers_and_api_key_fallback(tmp_path, monkeypatch):
+    store = SecretStore(tmp_path)
+    session = tmp_path / "accounts" / "owner" / "cookies.json"
+    _write_plain(
+        session,
+        {
+            "cookies": [
+                {"name": "NID_AUT", "value": "session"},
+                {"name": CSRF_COOKIE_NAME, "value": "csrf-value"},
+            ]
+        },
+    )
+    assert [c["name"] for c in store.cookies(session)] == ["NID_AUT", CSRF_COOKIE_NAME]
+    assert store.csrf_token(session) == "csrf-value"
+    assert store.csrf_token(tmp_path / "missing.json") is None
+
+    monkeypatch.setenv("OPENAI_API_KEY", "env-key")
+    assert store.openai_api_key() == "env-key"
+    store.set_openai_api_key("stored-key")
+    assert store.openai_api_key() == "stored-key"
+
+
+def test_plain_file_is_encrypted_on_next_save(tmp_path):
+    pytest.importorskip("cryptography")
+
+    path = tmp_path / "state.json"
+    _write_plain(path, {"cookies": [{"name": CSRF_COOKIE_NAME, "value": "old"}]})
+    store = SecretStore(tmp_path)
+    assert store.csrf_token(path) == "old"
+
+    store.write_json(path, {"cookies": [{"name": CSRF_COOKIE_NAME, "value": "new"}]})
+    raw = path.read_bytes()
+    assert raw.startswith(b"gAAAAA")
+    assert b"new" not in raw
+    assert stat.S_IMODE((tmp_path / KEY_FILE).stat().st_mode) == 0o600
+
+    # 같은 키 파일을 쓰는 새 인스턴스도 복호화해서 읽음
+    assert SecretStore(tmp_path).csrf_token(path) == "new"
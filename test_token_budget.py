@@ -0,0 +1,40 @@
+"""TokenBudget falls back to the character estimate without tokenizer data."""
+
+from __future__ import annotations
+
+import logging
+
+from app.domain import token_budget
+from app.domain.token_budget import TokenBudget
+
+
+class _OfflineTiktoken:
+    """BPE 파일을 받을 수 없는 환경의 tiktoken"""
+
+    calls = 0
+
+    @classmethod
+    def encoding_for_model(cls, model):
+        cls.calls += 1
+        raise KeyError(model)
+
+    @classmethod
+    def get_encoding(cls, name):
+        cls.calls += 1
+        raise OSError("network is unreachable")
+
+
+def test_download_failure_falls_back_to_estimate(monkeypatch, caplog):
+    monkeypatch.setattr(token_budget, "TIKTOKEN_AVAILABLE", True)
+    monkeypatch.setattr(token_budget, "tiktoken", _OfflineTiktoken, raising=False)
+    monkeypatch.setattr(token_budget, "_encoding_load_failed", False)
+
+    with caplog.at_level(logging.WARNING, logger=token_budget.__name__):
+        budget = TokenBudget(model="local-model")
+        TokenBudget(model="local-model")
+
+    assert budget.count_tokens("맛있어요") == 4
+    assert budget.max_tokens_for_reply(100) > 0
+    # 두 번째 인스턴스는 다시 다운로드를 시도하지 않고 경고도 한 번만 남김
+    assert _OfflineTiktoken.calls == 2
+    assert len(caplog.records) == 1
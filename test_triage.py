@@ -0,0 +1,35 @@
+"""Review triage scores, priority levels and ordering."""
+
+from __future__ import annotations
+
+from app.services.triage import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    prioritize_reviews,
+    score_review,
+    triage_review,
+)
+
+
+def test_low_rating_and_negative_grade_raise_the_score():
+    assert score_review({"rating": 5}, "좋아요") == 0
+    assert score_review({"rating": 1}, "") == 6.0
+    assert score_review({"hasNegativeTextGrade": True}, "") == 3.0
+
+
+def test_priority_levels():
+    assert triage_review({"rating": 1}, "r1", "최악").priority == PRIORITY_HIGH
+    assert triage_review({"rating": 5}, "r2", "").priority == PRIORITY_LOW
+    assert triage_review({"rating": 5}, "r3", "맛있어요").priority == PRIORITY_NORMAL
+
+
+def test_prioritize_is_stable_for_equal_scores():
+    reviews = [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+    triage = [
+        triage_review({"rating": 5}, "a", "좋아요"),
+        triage_review({"rating": 1}, "b", ""),
+        triage_review({"rating": 5}, "c", "좋아요"),
+    ]
+    ordered = [review["id"] for review, _ in prioritize_reviews(reviews, triage)]
+    assert ordered == ["b", "a", "c"]